@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', '_kenziebuster.settings')
+# Serve the native async views (see movies.async_views) on ASGI.
+os.environ.setdefault('KENZIEBUSTER_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
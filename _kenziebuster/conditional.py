@@ -0,0 +1,141 @@
+"""
+Conditional GETs: strong ETags and Last-Modified from `VersionedModel` rows.
+
+Views cache the validators of every resource they send in full. The next
+request carrying a matching `If-None-Match` is answered with 304 before
+its row is loaded. Anything that writes around the API (admin, shell) is
+covered only by `CONDITIONAL_VALIDATORS_TIMEOUT`.
+
+Every key also has a generation counter, which writes increment after they
+commit. A read takes the generations of its key and of what it depends on
+before loading the rows, and the validators it caches are valid only while
+those generations stay the same. A write landing between the load and the
+cache write (an update, a delete, a change to a dependency) leaves them
+stale instead of cached.
+"""
+import hashlib
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .routers import reading_from_replica
+
+
+class VersionedModel(models.Model):
+    """
+    `version` counts full saves. `updated_at` goes into the ETag too, so two
+    concurrent saves that reach the same version still get different ETags.
+    """
+
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        # Saves limited to `update_fields` (password rehash, last_login)
+        # do not touch the representation.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            self.version += 1
+        super().save(*args, **kwargs)
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: float | None = None
+
+    def apply(self, response):
+        response["ETag"] = self.etag
+        if self.last_modified is not None:
+            response["Last-Modified"] = http_date(self.last_modified)
+        return response
+
+    def not_modified(self, request) -> HttpResponse | None:
+        """The 304 (or 412) this request gets, None when it needs the full response."""
+        # Headers to copy into a 304, handed back as is when nothing matched.
+        headers_only = self.apply(HttpResponse())
+        response = get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=self.last_modified,
+            response=headers_only,
+        )
+        return None if response is headers_only else response
+
+
+def digest_etag(*parts) -> str:
+    return quote_etag(hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest())
+
+
+def model_validators(*objs: VersionedModel) -> Validators:
+    """Validators of a representation built from `objs`."""
+    tokens = [
+        (obj._meta.label_lower, obj.pk, obj.version, obj.updated_at.isoformat())
+        for obj in objs
+    ]
+    return Validators(
+        etag=digest_etag(*tokens),
+        last_modified=max(obj.updated_at for obj in objs).timestamp(),
+    )
+
+
+def validators_key(model: type[models.Model], pk=None) -> str:
+    """The key of one row's validators, or without `pk`, a key for the whole model."""
+    key = f"validators:{model._meta.label_lower}"
+    return key if pk is None else f"{key}:{pk}"
+
+
+def generation_key(key: str) -> str:
+    return f"{key}:generation"
+
+
+def get_validators(key: str, depends_on: tuple = ()) -> tuple[Validators | None, dict]:
+    """
+    The cached validators of `key`, None when missing or stale, and the
+    current generations of `key` and `depends_on`, for `set_validators`.
+    """
+    generation_keys = [generation_key(k) for k in (key, *depends_on)]
+    found = cache.get_many([key, *generation_keys])
+    missing = [k for k in generation_keys if k not in found]
+    if missing:
+        for missing_key in missing:
+            # Past any value an evicted counter of this key could have reached.
+            cache.add(missing_key, time.time_ns(), timeout=None)
+        found.update(cache.get_many(missing))
+
+    generations = {k: found.get(k) for k in generation_keys}
+    entry = found.get(key)
+    if entry is None:
+        return None, generations
+
+    validators, cached_generations = entry
+    if cached_generations != generations:
+        return None, generations
+    return validators, generations
+
+
+def set_validators(key: str, validators: Validators, generations: dict) -> None:
+    """Caches `validators` under the `generations` read before their rows were loaded."""
+    if reading_from_replica():
+        # A lagging replica would cache validators a write just forgot.
+        return
+
+    timeout = settings.CONDITIONAL_VALIDATORS_TIMEOUT
+    cache.set(key, (validators, generations), timeout=timeout)
+
+
+def forget_validators(*keys: str) -> None:
+    """Call after the write commits, it makes the validators cached under `keys` stale."""
+    for key in keys:
+        try:
+            cache.incr(generation_key(key))
+        except ValueError:
+            # No counter, the next read starts a new one past every old value.
+            pass
@@ -0,0 +1,307 @@
+"""
+Per-request timings: SQL (statement count and time), serializers, the view
+and the whole request.
+
+`MetricsMiddleware` returns them in a `Server-Timing` header and folds them
+into per-route histograms, which `metrics_view` serves in the Prometheus
+text format at /api/metrics/ to scrapers that send `METRICS_TOKEN`.
+Histograms live in the process, so every worker exposes its own.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from rest_framework.serializers import ListSerializer, Serializer
+
+_current = ContextVar("request_metrics", default=None)
+
+DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+QUERY_BUCKETS = (0, 1, 2, 3, 4, 5, 10, 25, 50, 100)
+LABELS = ("route", "method")
+UNMATCHED_ROUTE = "<unmatched>"
+# Any other method is client-chosen text, labelled OTHER so it can't add series.
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+OTHER_METHOD = "OTHER"
+
+
+class RequestMetrics:
+    """Timings of one request; also the execute wrapper that times its SQL."""
+
+    __slots__ = (
+        "sql_count",
+        "sql_time",
+        "serializer_time",
+        "serializer_depth",
+        "view_start",
+        "view_time",
+    )
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.view_start = None
+        self.view_time = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - start
+            self.sql_count += 1
+
+    def server_timing(self, total: float) -> str:
+        entries = [
+            f'sql;dur={self.sql_time * 1000:.2f};desc="{self.sql_count} queries"',
+            f"serializer;dur={self.serializer_time * 1000:.2f}",
+        ]
+        if self.view_time is not None:
+            entries.append(f"view;dur={self.view_time * 1000:.2f}")
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, buckets: tuple):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # One count per bucket, one for +Inf, then the sum.
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[bisect_left(self.buckets, value)] += 1
+            series[-1] += value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def expose(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = {labels: list(values) for labels, values in self._series.items()}
+
+        for labels, values in sorted(series.items()):
+            label_text = ",".join(
+                f'{name}="{escape(value)}"' for name, value in zip(LABELS, labels)
+            )
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), values):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"{self.name}_sum{{{label_text}}} {values[-1]}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+        return lines
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REQUEST_DURATION = Histogram(
+    "kenziebuster_request_duration_seconds",
+    "Time spent in the whole request.",
+    DURATION_BUCKETS,
+)
+VIEW_DURATION = Histogram(
+    "kenziebuster_view_duration_seconds", "Time spent in the view.", DURATION_BUCKETS
+)
+SERIALIZER_DURATION = Histogram(
+    "kenziebuster_serializer_duration_seconds",
+    "Time spent validating and representing data in serializers.",
+    DURATION_BUCKETS,
+)
+SQL_DURATION = Histogram(
+    "kenziebuster_sql_duration_seconds", "Time spent running SQL.", DURATION_BUCKETS
+)
+SQL_QUERIES = Histogram(
+    "kenziebuster_sql_queries", "SQL statements run per request.", QUERY_BUCKETS
+)
+HISTOGRAMS = (
+    REQUEST_DURATION,
+    VIEW_DURATION,
+    SERIALIZER_DURATION,
+    SQL_DURATION,
+    SQL_QUERIES,
+)
+
+
+def reset_metrics() -> None:
+    for histogram in HISTOGRAMS:
+        histogram.clear()
+
+
+class MetricsMiddleware:
+    """
+    Goes first in MIDDLEWARE, so `total` covers every other middleware.
+    The view is timed from `process_view` until its response comes back
+    (`process_template_response`, before rendering) and, for responses
+    that are not rendered, until the response reaches this middleware.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        wrappers = [connections[alias].execute_wrappers for alias in connections]
+        for execute_wrappers in wrappers:
+            execute_wrappers.append(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            for execute_wrappers in wrappers:
+                execute_wrappers.remove(metrics)
+            _current.reset(token)
+
+        end = time.perf_counter()
+        if metrics.view_time is None and metrics.view_start is not None:
+            metrics.view_time = end - metrics.view_start
+
+        match = request.resolver_match
+        method = request.method if request.method in KNOWN_METHODS else OTHER_METHOD
+        labels = (match.route if match else UNMATCHED_ROUTE, method)
+        REQUEST_DURATION.observe(labels, end - start)
+        SQL_DURATION.observe(labels, metrics.sql_time)
+        SQL_QUERIES.observe(labels, metrics.sql_count)
+        SERIALIZER_DURATION.observe(labels, metrics.serializer_time)
+        if metrics.view_time is not None:
+            VIEW_DURATION.observe(labels, metrics.view_time)
+
+        response["Server-Timing"] = metrics.server_timing(end - start)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.view_start = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        metrics = _current.get()
+        if metrics is not None and metrics.view_start is not None:
+            metrics.view_time = time.perf_counter() - metrics.view_start
+        return response
+
+
+class _SerializerTimer:
+    def __enter__(self):
+        self.metrics = _current.get()
+        # Only the outermost serializer counts, nested ones are inside it.
+        if self.metrics is not None:
+            self.metrics.serializer_depth += 1
+            self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        if self.metrics is not None:
+            self.metrics.serializer_depth -= 1
+            if not self.metrics.serializer_depth:
+                self.metrics.serializer_time += time.perf_counter() - self.start
+
+
+class TimedSerializerMixin:
+    """Adds the time spent in `is_valid()` and `.data` to the request's serializer timing."""
+
+    def is_valid(self, *args, **kwargs):
+        with _SerializerTimer():
+            return super().is_valid(*args, **kwargs)
+
+    @property
+    def data(self):
+        with _SerializerTimer():
+            return super().data
+
+
+class TimedListSerializer(TimedSerializerMixin, ListSerializer):
+    pass
+
+
+class TimedSerializer(TimedSerializerMixin, Serializer):
+    class Meta:
+        list_serializer_class = TimedListSerializer
+
+
+def metrics_view(request) -> HttpResponse:
+    if not settings.METRICS_TOKEN:
+        raise Http404
+    if not constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        response = HttpResponse(status=401)
+        response["WWW-Authenticate"] = 'Bearer realm="metrics"'
+        return response
+
+    from movies.cache import cache_stats
+    from movies.fragments import movie_fragments
+    from users.authentication import user_cache
+
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines.extend(histogram.expose())
+
+    stats = cache_stats()
+    lines += [
+        "# HELP kenziebuster_catalog_cache_requests_total Catalog list cache lookups.",
+        "# TYPE kenziebuster_catalog_cache_requests_total counter",
+        f'kenziebuster_catalog_cache_requests_total{{result="hit"}} {stats["hits"]}',
+        f'kenziebuster_catalog_cache_requests_total{{result="miss"}} {stats["misses"]}',
+        "# HELP kenziebuster_jwt_user_cache_entries Users held by the JWT user cache.",
+        "# TYPE kenziebuster_jwt_user_cache_entries gauge",
+        f"kenziebuster_jwt_user_cache_entries {len(user_cache)}",
+    ]
+
+    fragments = movie_fragments.stats()
+    lines += [
+        "# HELP kenziebuster_movie_fragment_cache_bytes Size of the pre-rendered movie rows held.",
+        "# TYPE kenziebuster_movie_fragment_cache_bytes gauge",
+        f"kenziebuster_movie_fragment_cache_bytes {fragments['bytes']}",
+        "# HELP kenziebuster_movie_fragment_cache_entries Pre-rendered movie rows held.",
+        "# TYPE kenziebuster_movie_fragment_cache_entries gauge",
+        f"kenziebuster_movie_fragment_cache_entries {fragments['entries']}",
+        "# HELP kenziebuster_movie_fragment_cache_requests_total Pre-rendered movie row lookups.",
+        "# TYPE kenziebuster_movie_fragment_cache_requests_total counter",
+        f'kenziebuster_movie_fragment_cache_requests_total{{result="hit"}} {fragments["hits"]}',
+        f'kenziebuster_movie_fragment_cache_requests_total{{result="miss"}} {fragments["misses"]}',
+        "# HELP kenziebuster_movie_fragment_cache_evictions_total Rows evicted to stay under the size limit.",
+        "# TYPE kenziebuster_movie_fragment_cache_evictions_total counter",
+        f"kenziebuster_movie_fragment_cache_evictions_total {fragments['evictions']}",
+    ]
+
+    return HttpResponse(
+        "\n".join(lines) + "\n", content_type="text/plain; version=0.0.4"
+    )
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Counters open in the current context. Async views share one sync thread
+# (and its connections) between concurrent requests, so a counter only
+# records statements issued from its own context.
+_active_counters = ContextVar("active_query_counters", default=())
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryCounter:
+    # Transaction control is not counted: savepoints only show up when an
+    # outer transaction is already open (as in tests) and BEGIN only when
+    # none is (SQLite sends it as a statement), so counting either would
+    # make the same handler cost differently in tests and in production.
+    ignored_prefixes = (
+        "SAVEPOINT",
+        "RELEASE SAVEPOINT",
+        "ROLLBACK TO SAVEPOINT",
+        "BEGIN",
+    )
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if self in _active_counters.get() and not sql.startswith(self.ignored_prefixes):
+            self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    def __len__(self):
+        return len(self.queries)
+
+
+class count_queries:
+    """
+    Counts every statement sent to any configured database alias.
+
+    Use `async with` from coroutines: the async ORM runs queries on the
+    thread-sensitive sync thread, so the counter is installed there.
+    """
+
+    def _start(self) -> QueryCounter:
+        self.counter = QueryCounter()
+        self.token = _active_counters.set((*_active_counters.get(), self.counter))
+        return self.counter
+
+    def _install(self) -> None:
+        for alias in connections:
+            connections[alias].execute_wrappers.append(self.counter)
+
+    def _uninstall(self) -> None:
+        # Removed by identity, exits of concurrent requests can interleave.
+        for alias in connections:
+            connections[alias].execute_wrappers.remove(self.counter)
+
+    def __enter__(self) -> QueryCounter:
+        self._start()
+        self._install()
+        return self.counter
+
+    def __exit__(self, *exc_info):
+        self._uninstall()
+        _active_counters.reset(self.token)
+
+    async def __aenter__(self) -> QueryCounter:
+        self._start()
+        await sync_to_async(self._install)()
+        return self.counter
+
+    async def __aexit__(self, *exc_info):
+        await sync_to_async(self._uninstall)()
+        _active_counters.reset(self.token)
+
+
+def query_budget(max_queries: int, extra: Callable[[Any], int] = None):
+    """
+    Declares how many queries a view handler may run.
+
+    Works on sync and async handlers. The budget covers the handler body
+    (including serialization), not the authentication step that DRF runs
+    before it. `extra(request)` adds to it for requests that opt into more
+    work, so the common path keeps its tight budget. Going over the budget
+    raises `QueryBudgetExceeded` when `QUERY_BUDGET_RAISE` is set and logs
+    a warning otherwise.
+    """
+
+    def check(view, handler, request, counter: QueryCounter) -> None:
+        budget = max_queries + (extra(request) if extra else 0)
+        if len(counter) > budget:
+            msg = (
+                f"{type(view).__name__}.{handler.__name__} ran {len(counter)} "
+                f"queries, budget is {budget}:\n" + "\n".join(counter.queries)
+            )
+            if getattr(settings, "QUERY_BUDGET_RAISE", False):
+                raise QueryBudgetExceeded(msg)
+            logger.warning(msg)
+
+    def decorator(handler):
+        if asyncio.iscoroutinefunction(handler):
+
+            @wraps(handler)
+            async def wrapper(view, request, *args, **kwargs):
+                async with count_queries() as counter:
+                    response = await handler(view, request, *args, **kwargs)
+
+                check(view, handler, request, counter)
+                return response
+
+        else:
+
+            @wraps(handler)
+            def wrapper(view, request, *args, **kwargs):
+                with count_queries() as counter:
+                    response = handler(view, request, *args, **kwargs)
+
+                check(view, handler, request, counter)
+                return response
+
+        wrapper.query_budget = max_queries
+        return wrapper
+
+    return decorator
@@ -0,0 +1,80 @@
+"""
+Read replica routing.
+
+`ReplicaRoutingMiddleware` sends the reads of safe requests (GET, HEAD,
+OPTIONS) to the `REPLICA_DATABASE` alias when the view opts in with
+`replica_reads = True`. Writes always go to "default". After a client
+writes, a short-lived cookie keeps its reads on the primary for
+`REPLICA_STICKY_SECONDS`, so it reads its own writes even if the replica
+lags behind.
+
+The shared caches must not be filled from replica reads either: a lagging
+replica can return rows older than the catalog version or validators they
+would be stored under, and the writer would get them back as cache hits or
+304s. `reading_from_replica()` tells the cache helpers to skip the write.
+"""
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+STICKY_COOKIE = "kenziebuster_primary"
+
+_read_alias = ContextVar("read_alias", default=None)
+
+
+def reading_from_replica() -> bool:
+    """Whether the current request's reads go to the replica."""
+    return _read_alias.get() is not None
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        # Explicit, otherwise Django saves an instance back to the alias it
+        # was read from.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(self, get_response):
+        if not settings.REPLICA_DATABASE:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _read_alias.set(None)
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_alias.set(None)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                STICKY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        if (
+            request.method in SAFE_METHODS
+            and getattr(view_class, "replica_reads", False)
+            and STICKY_COOKIE not in request.COOKIES
+        ):
+            _read_alias.set(settings.REPLICA_DATABASE)
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.0/ref/settings/
 """
 
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -53,6 +54,7 @@ DJANGO_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + MY_APPS
 
 MIDDLEWARE = [
+    '_kenziebuster.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -60,6 +62,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    '_kenziebuster.routers.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = '_kenziebuster.urls'
@@ -89,10 +92,122 @@ WSGI_APPLICATION = '_kenziebuster.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get("KENZIEBUSTER_DB_NAME", BASE_DIR / 'db.sqlite3'),
     }
 }
 
+# PRAGMAs run on every new SQLite connection, see _kenziebuster.sqlite.
+SQLITE_PRAGMAS = {}
+
+# "production" tunes SQLite for concurrent writers (several workers placing
+# orders at once); "development" keeps Django's defaults.
+DB_PROFILE = os.environ.get("KENZIEBUSTER_DB_PROFILE", "development")
+
+if DB_PROFILE == "production":
+    DATABASES['default'].update({
+        # Keep connections (and their statement caches) between requests.
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            # Seconds a writer waits on a locked database before "database
+            # is locked"; the driver applies it as SQLite's busy timeout.
+            "timeout": 20,
+            "cached_statements": 512,
+        },
+    })
+    SQLITE_PRAGMAS = {
+        # Readers no longer block the writer and vice versa.
+        "journal_mode": "WAL",
+        # Durable across application crashes; under WAL only a power loss
+        # can drop the last commits.
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+    }
+
+# Read replica for the views marked `replica_reads`, see
+# _kenziebuster.routers. Locally a copy of (or the same) database file
+# works as a stand-in; it is opened read-only.
+REPLICA_DATABASE = None
+
+if os.environ.get("KENZIEBUSTER_REPLICA_NAME"):
+    REPLICA_DATABASE = "replica"
+    DATABASES[REPLICA_DATABASE] = {
+        **DATABASES['default'],
+        "NAME": f"file:{os.environ['KENZIEBUSTER_REPLICA_NAME']}?mode=ro",
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["_kenziebuster.routers.ReplicaRouter"]
+
+# How long a client keeps reading from the primary after its own writes.
+REPLICA_STICKY_SECONDS = 5
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+# The catalog version (movies.cache), the list pages and the ETag
+# validators (_kenziebuster.conditional) live here. LocMemCache keeps them
+# per process, so with more than one worker the others serve stale pages
+# for up to MOVIES_LIST_CACHE_TIMEOUT after a write: run a single worker,
+# or set KENZIEBUSTER_REDIS_URL (needs the `redis` package) so every
+# worker shares them. FileBasedCache is not an option, its `incr` is not
+# atomic and concurrent writes can lose a version bump.
+
+if os.environ.get("KENZIEBUSTER_REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["KENZIEBUSTER_REDIS_URL"],
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "kenziebuster",
+        }
+    }
+
+MOVIES_LIST_CACHE_TIMEOUT = 60 * 5
+
+# Upper bound for the pre-rendered catalog rows kept by each process
+# (movies.fragments).
+MOVIE_FRAGMENT_CACHE_BYTES = 16 * 1024 * 1024
+
+# How long ETag/Last-Modified validators stay cached (_kenziebuster.conditional).
+# Bounds how long writes made outside the API can be answered with 304.
+CONDITIONAL_VALIDATORS_TIMEOUT = 60 * 10
+
+MOVIES_BULK_BATCH_SIZE = 500
+MOVIES_BULK_MAX_BATCH_SIZE = 5000
+
+MOVIES_EXPORT_CHUNK_SIZE = 2000
+
+# Rows per movie in movies.MovieOrderCounter; more shards spread concurrent
+# order writes for a hot title over more rows.
+MOVIE_ORDER_COUNTER_SHARDS = 8
+
+# Orders younger than this many seconds are left for the next rollup refresh
+# (movies.rollups). On Postgres or MySQL an order can commit after one with a
+# higher id, so this must be longer than any order transaction; only SQLite,
+# with its single writer, is safe at 0.
+SALES_ROLLUP_LAG = 60
+
+# Seconds an order's Idempotency-Key is remembered and replayed
+# (movies.idempotency); `purge_idempotency_keys` deletes older ones.
+IDEMPOTENCY_KEY_TTL = 60 * 60 * 24
+
+# Route the catalog and order endpoints to movies.async_views. asgi.py
+# turns it on; under WSGI the sync views avoid an async_to_sync per request.
+ASYNC_VIEWS = os.environ.get("KENZIEBUSTER_ASYNC_VIEWS", "0") == "1"
+
+# Server-Timing header and /api/metrics/ (see _kenziebuster.metrics).
+METRICS_ENABLED = os.environ.get("KENZIEBUSTER_METRICS", "1") == "1"
+
+# Bearer token the /api/metrics/ scraper sends. Unset, the endpoint answers
+# 404: its per-route timings and cache stats are not for anonymous clients.
+METRICS_TOKEN = os.environ.get("KENZIEBUSTER_METRICS_TOKEN")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
@@ -112,12 +227,33 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+PASSWORD_HASHERS = [
+    "users.hashers.ConfigurablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+# PBKDF2 work factor, tune per deployment (Django 4.1 default: 390000).
+PASSWORD_HASH_ITERATIONS = int(os.environ.get("KENZIEBUSTER_PASSWORD_HASH_ITERATIONS", 390000))
+
+# Processes used by users.hashing.password_hashing; 0 hashes inline.
+PASSWORD_HASHING_WORKERS = int(
+    os.environ.get("KENZIEBUSTER_PASSWORD_HASHING_WORKERS", min(4, os.cpu_count() or 1))
+)
+
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=24),
     "REFRESH_TOKEN_LIFETIME": timedelta(hours=24),
 }
 
+# Per-process cache of users resolved from access tokens, see
+# users.authentication.CachedJWTAuthentication.
+JWT_USER_CACHE_MAXSIZE = 1024
+JWT_USER_CACHE_TTL = 60
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.0/topics/i18n/
 
@@ -146,3 +282,7 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = "users.User"
+
+# Views decorated with `query_budget` raise instead of logging when they run
+# more queries than declared.
+QUERY_BUDGET_RAISE = DEBUG
@@ -0,0 +1,23 @@
+from django.conf import settings
+
+# The journal mode belongs to the database file and is set by the primary;
+# read-only connections (the local replica stand-in) cannot change it.
+READ_ONLY_SKIPPED_PRAGMAS = {"journal_mode"}
+
+
+def is_read_only(connection) -> bool:
+    return "mode=ro" in str(connection.settings_dict["NAME"])
+
+
+def configure_connection(sender, connection, **kwargs) -> None:
+    """`connection_created` receiver applying `settings.SQLITE_PRAGMAS`."""
+    if connection.vendor != "sqlite":
+        return
+
+    read_only = is_read_only(connection)
+    for pragma, value in settings.SQLITE_PRAGMAS.items():
+        if read_only and pragma in READ_ONLY_SKIPPED_PRAGMAS:
+            continue
+        # Straight on the driver connection, so the PRAGMAs never show up
+        # in query counts (see _kenziebuster.query_budget).
+        connection.connection.execute(f"PRAGMA {pragma} = {value}")
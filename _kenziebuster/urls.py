@@ -16,8 +16,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from _kenziebuster.metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path("api/", include("users.urls")),
     path("api/", include("movies.urls")),
+    path("api/metrics/", metrics_view),
 ]
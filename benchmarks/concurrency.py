@@ -0,0 +1,204 @@
+"""
+Read latency and throughput at high concurrency, ASGI vs WSGI.
+
+Each server runs in its own process (the async views are picked when the
+URLconf loads) and is called in-process, without sockets: the ASGI app gets
+every request as a task on one event loop, the WSGI app gets them through a
+pool of `--threads` worker threads, like a threaded WSGI server. Latency
+includes the time a request waits for a free worker.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from wsgiref.util import setup_testing_defaults
+
+from benchmarks import Timer, percentile, setup, test_database
+
+HOST = "testserver"
+
+
+async def call_asgi(application, path: str, headers: dict) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", HOST.encode())]
+        + [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": (HOST, 80),
+    }
+    sent = {}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            sent["status"] = message["status"]
+
+    await application(scope, receive, send)
+    return sent["status"]
+
+
+def call_wsgi(application, path: str, headers: dict) -> int:
+    environ = {
+        "PATH_INFO": path,
+        "REQUEST_METHOD": "GET",
+        "HTTP_HOST": HOST,
+        "SERVER_NAME": HOST,
+    }
+    environ.update({f"HTTP_{name.upper()}": value for name, value in headers.items()})
+    setup_testing_defaults(environ)
+    sent = {}
+
+    def start_response(status, response_headers, exc_info=None):
+        sent["status"] = int(status.split()[0])
+
+    result = application(environ, start_response)
+    try:
+        b"".join(result)
+    finally:
+        # Fires request_finished, which closes the thread's connections.
+        result.close()
+    return sent["status"]
+
+
+async def load(call, paths: list[str], concurrency: int, headers: dict) -> dict:
+    gate = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(path):
+        nonlocal errors
+        async with gate:
+            with Timer() as timer:
+                status_code = await call(path, headers)
+        latencies.append(timer.elapsed)
+        if status_code != 200:
+            errors += 1
+
+    with Timer() as total:
+        await asyncio.gather(*(one(path) for path in paths))
+
+    return {
+        "requests": len(paths),
+        "errors": errors,
+        "requests_per_second": len(paths) / total.elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run(
+    server: str, requests: int, concurrency: int, threads: int, movies: int
+) -> dict:
+    setup()
+    if server == "asgi":
+        from _kenziebuster.asgi import application
+    else:
+        from _kenziebuster.wsgi import application
+
+    from tests.factories import (
+        create_multiple_movies_with_employee,
+        create_non_employee_with_token,
+    )
+    from tests.factories.user_factories import create_employee_with_token
+
+    results = {}
+    with test_database():
+        employee, _ = create_employee_with_token()
+        ids = [
+            movie.id for movie in create_multiple_movies_with_employee(employee, movies)
+        ]
+        _, token = create_non_employee_with_token()
+        routes = {
+            "detail": (
+                [f"/api/movies/{ids[i % len(ids)]}/" for i in range(requests)],
+                {},
+            ),
+            "detail_authenticated": (
+                [f"/api/movies/{ids[i % len(ids)]}/" for i in range(requests)],
+                {"Authorization": f"Bearer {token.access_token}"},
+            ),
+        }
+
+        if server == "asgi":
+
+            async def call(path, headers):
+                return await call_asgi(application, path, headers)
+
+        else:
+            pool = ThreadPoolExecutor(max_workers=threads)
+
+            async def call(path, headers):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    pool, call_wsgi, application, path, headers
+                )
+
+        for name, (paths, headers) in routes.items():
+            results[name] = asyncio.run(load(call, paths, concurrency, headers))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--server", choices=["asgi", "wsgi", "both"], default="both")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=32, help="WSGI worker threads")
+    parser.add_argument("--movies", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.server != "both":
+        result = run(
+            args.server, args.requests, args.concurrency, args.threads, args.movies
+        )
+        print(json.dumps(result))
+        return
+
+    results = {}
+    for server in ("wsgi", "asgi"):
+        env = {
+            **os.environ,
+            "KENZIEBUSTER_ASYNC_VIEWS": "1" if server == "asgi" else "0",
+        }
+        argv = [sys.executable, "-m", "benchmarks.concurrency", "--server", server]
+        argv += [
+            "--requests",
+            str(args.requests),
+            "--concurrency",
+            str(args.concurrency),
+        ]
+        argv += ["--threads", str(args.threads), "--movies", str(args.movies)]
+        output = subprocess.run(
+            argv, env=env, check=True, capture_output=True, text=True
+        )
+        results[server] = json.loads(output.stdout.splitlines()[-1])
+
+    print(
+        f"{args.requests} requests, {args.concurrency} concurrent, {args.threads} WSGI threads"
+    )
+    for route in results["asgi"]:
+        for server, by_route in results.items():
+            r = by_route[route]
+            print(
+                f"{route:>22} {server}: {r['requests_per_second']:7.0f} req/s  "
+                f"p50 {r['p50_ms']:7.1f}ms  p95 {r['p95_ms']:7.1f}ms  "
+                f"p99 {r['p99_ms']:7.1f}ms  errors {r['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Password verifications (logins) per second at different hashing pool sizes."""
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import Timer, setup
+
+
+def run(pool_size: int, logins: int, concurrency: int) -> dict:
+    from users.hashing import PasswordHashingService
+
+    service = PasswordHashingService(workers=pool_size)
+    encoded = service.make_password("benchmark-password")
+
+    # Simulates `concurrency` request threads verifying passwords at once.
+    with ThreadPoolExecutor(max_workers=concurrency) as threads, Timer() as timer:
+        results = list(
+            threads.map(
+                lambda _: service.check_password("benchmark-password", encoded),
+                range(logins),
+            )
+        )
+    service.shutdown()
+
+    assert all(results)
+    return {
+        "pool_size": pool_size,
+        "logins": logins,
+        "seconds": timer.elapsed,
+        "logins_per_second": logins / timer.elapsed,
+    }
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--pool-sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=sorted({0, 1, 2, cpus, cpus * 2}),
+        help="comma separated pool sizes, 0 hashes inline on the request threads",
+    )
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=cpus * 4)
+    args = parser.parse_args()
+
+    setup()
+    from django.conf import settings
+
+    print(f"PASSWORD_HASH_ITERATIONS={settings.PASSWORD_HASH_ITERATIONS}")
+    for pool_size in args.pool_sizes:
+        result = run(pool_size, args.logins, args.concurrency)
+        print(
+            f"pool_size={result['pool_size']:>3}: {result['logins']} logins in "
+            f"{result['seconds']:.2f}s ({result['logins_per_second']:.1f} logins/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
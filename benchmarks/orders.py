@@ -0,0 +1,50 @@
+"""Orders per second through POST /api/movies/<id>/orders/."""
+import argparse
+
+from benchmarks import Timer, setup, test_database
+
+
+def run(orders: int) -> dict:
+    from rest_framework.test import APIClient
+
+    from tests.factories import (
+        create_movie_with_employee,
+        create_non_employee_with_token,
+    )
+
+    movie = create_movie_with_employee()
+    _, token = create_non_employee_with_token()
+
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+    url = f"/api/movies/{movie.id}/orders/"
+
+    with Timer() as timer:
+        for _ in range(orders):
+            response = client.post(url, data={"price": "10.00"}, format="json")
+            assert response.status_code == 201, response.content
+
+    return {
+        "orders": orders,
+        "seconds": timer.elapsed,
+        "orders_per_second": orders / timer.elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=2000)
+    args = parser.parse_args()
+
+    setup()
+    with test_database():
+        result = run(args.orders)
+
+    print(
+        f"{result['orders']} orders in {result['seconds']:.2f}s "
+        f"({result['orders_per_second']:.0f} orders/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
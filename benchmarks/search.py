@@ -0,0 +1,83 @@
+"""Catalog search: FTS5 index versus a LIKE '%q%' scan over title and synopsis."""
+import argparse
+import random
+import statistics
+
+from benchmarks import Timer, setup, test_database
+
+SYLLABLES = "ka ri mo ten lu sa vor del an qui ba zo mer fin tha gul".split()
+
+
+def vocabulary(size: int = 20_000) -> list[str]:
+    """Deterministic pseudo-words, so search terms are as selective as real ones."""
+    rng = random.Random(1)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    return sorted(words)
+
+
+WORDS = vocabulary()
+
+
+def seed(rows: int, batch_size: int = 10_000) -> None:
+    from movies.models import Movie
+    from tests.factories import create_employee_with_token
+
+    employee, _ = create_employee_with_token()
+    rng = random.Random(0)
+    for start in range(0, rows, batch_size):
+        Movie.objects.bulk_create(
+            Movie(
+                title=" ".join(rng.choices(WORDS, k=3)).title(),
+                synopsis=" ".join(rng.choices(WORDS, k=25)),
+                user=employee,
+            )
+            for _ in range(start, min(rows, start + batch_size))
+        )
+
+
+def measure(run, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        with Timer() as timer:
+            run()
+        samples.append(timer.elapsed)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--query", default=WORDS[1234])
+    args = parser.parse_args()
+
+    setup()
+    with test_database():
+        from django.db.models import Q
+
+        from movies.models import Movie
+        from movies.search import search_movies
+
+        with Timer() as timer:
+            seed(args.rows)
+        print(f"seeded {args.rows} movies in {timer.elapsed:.1f}s")
+
+        movies = Movie.objects.all()
+        like = Q()
+        for word in args.query.split():
+            like &= Q(title__icontains=word) | Q(synopsis__icontains=word)
+
+        cases = {
+            "fts5 count": lambda: search_movies(movies, args.query).count(),
+            "like count": lambda: movies.filter(like).count(),
+            "fts5 first page": lambda: list(search_movies(movies, args.query)[:2]),
+            "like first page": lambda: list(movies.filter(like).order_by("id")[:2]),
+        }
+        for name, run in cases.items():
+            print(f"{name:>16}: {measure(run, args.repeat) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Cost per row of the list serializers: model instances vs `.values()` rows
+(`ValuesRowMixin`), fetch included, for movies and orders. Movies are also
+spliced from warm pre-rendered fragments (`movies.fragments`).
+
+Every path must render the same JSON bytes, the run fails otherwise.
+"""
+import argparse
+import random
+from decimal import Decimal
+
+from benchmarks import Timer, setup, test_database
+
+
+def seed(rows: int) -> None:
+    from movies.models import Movie, MovieChoices, MovieOrder
+    from tests.factories import (
+        create_employee_with_token,
+        create_non_employee_with_token,
+    )
+
+    employee, _ = create_employee_with_token()
+    customer, _ = create_non_employee_with_token()
+    rng = random.Random(0)
+    ratings = [None, *MovieChoices.values]
+
+    movies = Movie.objects.bulk_create(
+        Movie(
+            title=f"Movie {index}",
+            duration=rng.choice([None, "95min", "2h 10min"]),
+            rating=rng.choice(ratings),
+            synopsis=rng.choice(
+                [None, "A hotshot gambler, long on audacity and short on sense."]
+            ),
+            user=employee,
+        )
+        for index in range(rows)
+    )
+    MovieOrder.objects.bulk_create(
+        MovieOrder(
+            movie=movie, user=customer, price=Decimal(rng.randint(100, 99999)) / 100
+        )
+        for movie in movies
+    )
+
+
+def best_per_row(render, rows: int, repeat: int) -> tuple[float, bytes]:
+    best = None
+    for _ in range(repeat):
+        with Timer() as timer:
+            content = render()
+        best = timer.elapsed if best is None else min(best, timer.elapsed)
+    return best / rows, content
+
+
+def rendered(build):
+    from rest_framework.renderers import JSONRenderer
+
+    return lambda: JSONRenderer().render(build().data)
+
+
+def run(rows: int, repeat: int) -> dict:
+    from movies.fragments import page_rows, render_page
+    from movies.models import Movie, MovieOrder
+    from movies.serializers import MovieOrderSerializer, MovieSerializer
+
+    seed(rows)
+    cases = {
+        "movies": (
+            lambda: MovieSerializer(
+                Movie.objects.select_related("user").order_by("id"), many=True
+            ),
+            lambda: MovieSerializer(
+                MovieSerializer.values_rows(Movie.objects.order_by("id")), many=True
+            ),
+        ),
+        "orders": (
+            lambda: MovieOrderSerializer(
+                MovieOrder.objects.select_related("movie", "user").order_by("id"),
+                many=True,
+            ),
+            lambda: MovieOrderSerializer(
+                MovieOrderSerializer.values_rows(MovieOrder.objects.order_by("id")),
+                many=True,
+            ),
+        ),
+    }
+
+    results = {}
+    for name, (instances, values) in cases.items():
+        instances_per_row, expected = best_per_row(rendered(instances), rows, repeat)
+        values_per_row, content = best_per_row(rendered(values), rows, repeat)
+        assert content == expected, f"{name}: values() rows render different JSON"
+        results[name] = {"instances": instances_per_row, "values": values_per_row}
+
+        if name == "movies":
+            # The first run fills the fragment cache, the best one is warm.
+            fragments_per_row, content = best_per_row(
+                lambda: render_page({}, list(page_rows(Movie.objects.order_by("id")))),
+                rows,
+                repeat,
+            )
+            assert (
+                content == b'{"results":' + expected + b"}"
+            ), "fragments render different JSON"
+            results[name]["fragments"] = fragments_per_row
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5, help="best of this many runs")
+    args = parser.parse_args()
+
+    setup()
+    with test_database():
+        results = run(args.rows, args.repeat)
+
+    print(f"{args.rows} rows, fetch + serialize + render, best of {args.repeat}")
+    for name, r in results.items():
+        line = (
+            f"{name:>8}: instances {r['instances'] * 1e6:6.1f}us/row  "
+            f"values {r['values'] * 1e6:6.1f}us/row  "
+            f"({r['instances'] / r['values']:.1f}x)"
+        )
+        if "fragments" in r:
+            line += (
+                f"  fragments {r['fragments'] * 1e6:6.1f}us/row "
+                f"({r['instances'] / r['fragments']:.1f}x)"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+"""
+Latency, queries per request and peak memory for every API route.
+
+Seeds a throwaway database with `--scale` movies and as many orders (users
+and tokens come from tests.factories), sends `--iterations` requests per
+route through the full middleware stack and writes the results as JSON:
+
+    python -m benchmarks.suite --scale 100k --output before.json
+    python -m benchmarks.suite --scale 100k --compare before.json
+
+`--compare` exits with status 1 when a route got slower (p50/p95), heavier
+(peak memory) by more than `--threshold`, or runs more queries.
+"""
+import argparse
+import io
+import json
+import platform
+import random
+import subprocess
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from benchmarks import Timer, percentile, setup, test_database
+from benchmarks.search import WORDS
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+LATENCY_METRICS = ("p50_ms", "p95_ms")
+
+
+@dataclass
+class Route:
+    """One benchmarked request; `build` returns its path and body for the i-th call."""
+
+    name: str
+    method: str
+    pattern: str
+    build: Callable[[dict, int], tuple]
+    auth: Optional[str] = None
+    status: int = 200
+    # Cleared before every call, so the catalog cache does not hide the query.
+    cold_cache: bool = False
+    max_iterations: Optional[int] = None
+
+
+def movie_row(rng: random.Random, employee) -> "Movie":
+    from movies.models import Movie, MovieChoices
+
+    minutes = rng.randint(70, 200)
+    return Movie(
+        title=" ".join(rng.choices(WORDS, k=3)).title(),
+        duration=f"{minutes}min",
+        duration_minutes=minutes,
+        rating=rng.choice(MovieChoices.values),
+        synopsis=" ".join(rng.choices(WORDS, k=25)),
+        user=employee,
+    )
+
+
+def seed(rows: int, batch_size: int = 10_000) -> dict:
+    from django.core.management import call_command
+
+    from movies.models import Movie, MovieOrder
+    from tests.factories import (
+        create_employee_with_token,
+        create_non_employee_with_token,
+    )
+
+    employee, employee_token = create_employee_with_token()
+    customer, customer_token = create_non_employee_with_token()
+    rng = random.Random(0)
+
+    for start in range(0, rows, batch_size):
+        size = min(rows, start + batch_size) - start
+        Movie.objects.bulk_create(movie_row(rng, employee) for _ in range(size))
+
+    movie_ids = list(Movie.objects.order_by("id").values_list("id", flat=True))
+    for start in range(0, rows, batch_size):
+        size = min(rows, start + batch_size) - start
+        MovieOrder.objects.bulk_create(
+            MovieOrder(
+                movie_id=rng.choice(movie_ids), user=customer, price=rng.randint(5, 50)
+            )
+            for _ in range(size)
+        )
+
+    call_command("reconcile_order_counters", stdout=io.StringIO())
+    # Seeding is the only writer, every order is already committed.
+    call_command("refresh_sales_rollups", "--lag", "0", stdout=io.StringIO())
+
+    return {
+        "rng": rng,
+        "movie_ids": movie_ids,
+        "employee": employee,
+        "customer": customer,
+        "tokens": {"employee": employee_token, "customer": customer_token},
+    }
+
+
+def routes(ctx: dict) -> list[Route]:
+    ids, rng = ctx["movie_ids"], ctx["rng"]
+    customer_id = ctx["customer"].id
+    # Deletes walk down from the newest movies, the other routes read the
+    # older half so they never hit a deleted one.
+    stable, deletable = ids[: len(ids) // 2], ids[len(ids) // 2 :]
+
+    def movie():
+        return rng.choice(stable)
+
+    return [
+        Route(
+            "movies.list",
+            "GET",
+            "movies/",
+            lambda c, i: ("/api/movies/", None),
+            cold_cache=True,
+        ),
+        Route(
+            "movies.list_cached", "GET", "movies/", lambda c, i: ("/api/movies/", None)
+        ),
+        Route(
+            "movies.list_deep_page",
+            "GET",
+            "movies/",
+            lambda c, i: (f"/api/movies/?page={len(ids) // 4}", None),
+            cold_cache=True,
+        ),
+        Route(
+            "movies.list_cursor",
+            "GET",
+            "movies/",
+            lambda c, i: ("/api/movies/?pagination=cursor&ordering=title", None),
+            cold_cache=True,
+        ),
+        Route(
+            "movies.search",
+            "GET",
+            "movies/",
+            lambda c, i: (f"/api/movies/?q={rng.choice(WORDS)}", None),
+            cold_cache=True,
+        ),
+        Route(
+            "movies.filter_duration",
+            "GET",
+            "movies/",
+            lambda c, i: ("/api/movies/?min_duration=90&max_duration=95", None),
+            cold_cache=True,
+        ),
+        Route(
+            "movies.create",
+            "POST",
+            "movies/",
+            lambda c, i: (
+                "/api/movies/",
+                {"title": f"Benchmark {i}", "duration": "1h50"},
+            ),
+            auth="employee",
+            status=201,
+        ),
+        Route(
+            "movies.bulk",
+            "POST",
+            "movies/bulk/",
+            lambda c, i: (
+                "/api/movies/bulk/",
+                [{"title": f"Bulk {i} {n}", "duration": "95min"} for n in range(100)],
+            ),
+            auth="employee",
+            status=201,
+        ),
+        Route(
+            "movies.export",
+            "GET",
+            "movies/export/",
+            lambda c, i: ("/api/movies/export/?output=ndjson", None),
+            max_iterations=3,
+        ),
+        Route(
+            "movies.detail",
+            "GET",
+            "movies/<int:movie_id>/",
+            lambda c, i: (f"/api/movies/{movie()}/", None),
+        ),
+        Route(
+            "movies.delete",
+            "DELETE",
+            "movies/<int:movie_id>/",
+            lambda c, i: (f"/api/movies/{deletable.pop()}/", None),
+            auth="employee",
+            status=204,
+        ),
+        Route(
+            "movies.order",
+            "POST",
+            "movies/<int:movie_id>/orders/",
+            lambda c, i: (f"/api/movies/{movie()}/orders/", {"price": "10.00"}),
+            auth="customer",
+            status=201,
+        ),
+        Route(
+            "movies.stats",
+            "GET",
+            "movies/<int:movie_id>/stats/",
+            lambda c, i: (f"/api/movies/{movie()}/stats/", None),
+            auth="employee",
+        ),
+        Route(
+            "reports.sales",
+            "GET",
+            "reports/sales/",
+            lambda c, i: ("/api/reports/sales/?granularity=hour", None),
+            auth="employee",
+        ),
+        Route(
+            "users.create",
+            "POST",
+            "users/",
+            lambda c, i: (
+                "/api/users/",
+                {
+                    "username": f"benchmark_{i}",
+                    "email": f"benchmark_{i}@mail.com",
+                    "password": "1234",
+                    "first_name": "Bench",
+                    "last_name": "Mark",
+                },
+            ),
+            status=201,
+        ),
+        Route(
+            "users.login",
+            "POST",
+            "users/login/",
+            lambda c, i: (
+                "/api/users/login/",
+                {"username": "lucira_common", "password": "1111"},
+            ),
+        ),
+        Route(
+            "users.refresh",
+            "POST",
+            "users/refresh/",
+            lambda c, i: (
+                "/api/users/refresh/",
+                {"refresh": str(c["tokens"]["customer"])},
+            ),
+        ),
+        Route(
+            "users.detail",
+            "GET",
+            "users/<int:user_id>/",
+            lambda c, i: (f"/api/users/{customer_id}/", None),
+            auth="customer",
+        ),
+        Route(
+            "users.update",
+            "PATCH",
+            "users/<int:user_id>/",
+            lambda c, i: (f"/api/users/{customer_id}/", {"first_name": f"Lucira {i}"}),
+            auth="customer",
+        ),
+        Route(
+            "users.orders",
+            "GET",
+            "users/<int:user_id>/orders/",
+            lambda c, i: (f"/api/users/{customer_id}/orders/", None),
+            auth="customer",
+        ),
+    ]
+
+
+def uncovered_patterns(benchmarked: list[Route]) -> list[str]:
+    from movies.urls import urlpatterns as movie_patterns
+    from users.urls import urlpatterns as user_patterns
+
+    covered = {route.pattern for route in benchmarked}
+    return [
+        str(pattern.pattern)
+        for pattern in [*movie_patterns, *user_patterns]
+        if str(pattern.pattern) not in covered
+    ]
+
+
+def send(client, route: Route, ctx: dict, index: int):
+    from django.core.cache import cache
+
+    path, data = route.build(ctx, index)
+    if route.cold_cache:
+        cache.clear()
+
+    method = getattr(client, route.method.lower())
+    response = (
+        method(path, data=data, format="json") if data is not None else method(path)
+    )
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+
+    assert response.status_code == route.status, (route.name, response.status_code)
+    return response
+
+
+def measure(
+    client, route: Route, ctx: dict, iterations: int, memory_iterations: int
+) -> dict:
+    from _kenziebuster.query_budget import count_queries
+
+    token = ctx["tokens"].get(route.auth)
+    if token is not None:
+        client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+    else:
+        client.credentials()
+
+    iterations = min(iterations, route.max_iterations or iterations)
+    calls = iter(range(iterations + memory_iterations + 1))
+    # Warm-up: imports, the JWT user cache and SQLite's page cache.
+    send(client, route, ctx, next(calls))
+
+    latencies, queries = [], []
+    for _ in range(iterations):
+        index = next(calls)
+        with count_queries() as counter, Timer() as timer:
+            send(client, route, ctx, index)
+        latencies.append(timer.elapsed)
+        queries.append(len(counter))
+
+    # Separate pass, tracing allocations slows every call down.
+    peaks = []
+    tracemalloc.start()
+    for index in calls:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        send(client, route, ctx, index)
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    return {
+        "method": route.method,
+        "iterations": iterations,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "queries": max(queries),
+        "peak_memory_kb": max(peaks) / 1024,
+    }
+
+
+def git_commit() -> Optional[str]:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+    )
+    return result.stdout.strip() or None
+
+
+def run(scale: str, iterations: int, memory_iterations: int, only: list[str]) -> dict:
+    from rest_framework.test import APIClient
+
+    with Timer() as seeding:
+        ctx = seed(SCALES[scale])
+
+    benchmarked = routes(ctx)
+    missing = uncovered_patterns(benchmarked)
+    if missing:
+        raise SystemExit(f"Routes without a benchmark: {', '.join(missing)}")
+
+    results = {}
+    for route in benchmarked:
+        if only and route.name not in only:
+            continue
+        results[route.name] = measure(
+            APIClient(), route, ctx, iterations, memory_iterations
+        )
+        print(format_result(route.name, results[route.name]), file=sys.stderr)
+
+    return {
+        "meta": {
+            "scale": scale,
+            "rows": SCALES[scale],
+            "seed_seconds": seeding.elapsed,
+            "iterations": iterations,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "routes": results,
+    }
+
+
+def format_result(name: str, result: dict) -> str:
+    return (
+        f"{name:>24}: p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+        f"p99 {result['p99_ms']:8.2f}ms  {result['queries']:3d} queries  "
+        f"{result['peak_memory_kb']:9.1f} KiB"
+    )
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float, min_delta_ms: float
+) -> list[str]:
+    """Human readable regressions of `current` against `baseline`."""
+    regressions = []
+    for name, new in current["routes"].items():
+        old = baseline["routes"].get(name)
+        if old is None:
+            continue
+
+        for metric in LATENCY_METRICS:
+            delta = new[metric] - old[metric]
+            if delta > min_delta_ms and new[metric] > old[metric] * (1 + threshold):
+                regressions.append(
+                    f"{name}: {metric} {old[metric]:.2f} -> {new[metric]:.2f}"
+                )
+
+        if new["queries"] > old["queries"]:
+            regressions.append(f"{name}: queries {old['queries']} -> {new['queries']}")
+
+        if new["peak_memory_kb"] > old["peak_memory_kb"] * (1 + threshold):
+            regressions.append(
+                f"{name}: peak_memory_kb {old['peak_memory_kb']:.1f} -> {new['peak_memory_kb']:.1f}"
+            )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scale", choices=SCALES, default="1k")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--memory-iterations", type=int, default=3)
+    parser.add_argument(
+        "--route", action="append", default=[], help="only this route (repeatable)"
+    )
+    parser.add_argument("--output", help="write the JSON results here")
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="JSON results to compare against"
+    )
+    parser.add_argument(
+        "--current", metavar="RESULTS", help="compare these results instead of running"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed relative slowdown"
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="ignore latency changes below this",
+    )
+    args = parser.parse_args()
+
+    if args.current:
+        with open(args.current) as file:
+            current = json.load(file)
+    else:
+        setup()
+        with test_database():
+            current = run(
+                args.scale, args.iterations, args.memory_iterations, args.route
+            )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent=2)
+    elif not args.current:
+        print(json.dumps(current, indent=2))
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if baseline["meta"]["scale"] != current["meta"]["scale"]:
+            print("warning: comparing results from different scales", file=sys.stderr)
+
+        regressions = compare(baseline, current, args.threshold, args.min_delta_ms)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("no regressions", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
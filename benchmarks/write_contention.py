@@ -0,0 +1,117 @@
+"""
+Concurrent writers on one SQLite file: several processes place orders
+through POST /api/movies/<id>/orders/ at the same time.
+
+Every database profile (KENZIEBUSTER_DB_PROFILE) runs in its own process
+against a fresh temporary database, and reports throughput, latency and how
+many orders failed with "database is locked".
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks import Timer, percentile, setup
+
+
+def place_orders(url: str, token: str, orders: int) -> dict:
+    from django.db import OperationalError, connections
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+    latencies = []
+    locked = 0
+
+    for _ in range(orders):
+        try:
+            with Timer() as timer:
+                response = client.post(url, data={"price": "10.00"}, format="json")
+        except OperationalError as exc:
+            if "locked" not in str(exc):
+                raise
+            locked += 1
+            continue
+
+        assert response.status_code == 201, response.content
+        latencies.append(timer.elapsed)
+
+    connections.close_all()
+    return {"latencies": latencies, "locked": locked}
+
+
+def run(processes: int, orders: int) -> dict:
+    setup()
+    from django.core.management import call_command
+    from django.db import connections
+    from django.test.utils import setup_test_environment
+
+    from tests.factories import (
+        create_movie_with_employee,
+        create_non_employee_with_token,
+    )
+
+    setup_test_environment(debug=False)
+    call_command("migrate", verbosity=0)
+
+    url = f"/api/movies/{create_movie_with_employee().id}/orders/"
+    _, token = create_non_employee_with_token()
+    # Forked workers must not share the parent's SQLite handle.
+    connections.close_all()
+
+    with multiprocessing.get_context("fork").Pool(processes) as pool, Timer() as timer:
+        args = [(url, str(token.access_token), orders)] * processes
+        results = pool.starmap(place_orders, args)
+
+    latencies = [latency for result in results for latency in result["latencies"]]
+    return {
+        "placed": len(latencies),
+        "locked": sum(result["locked"] for result in results),
+        "orders_per_second": len(latencies) / timer.elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--profiles", nargs="+", default=["development", "production"])
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--orders", type=int, default=300, help="orders per process")
+    parser.add_argument("--run", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run(args.processes, args.orders)))
+        return
+
+    print(f"{args.processes} processes x {args.orders} orders")
+    for profile in args.profiles:
+        with tempfile.TemporaryDirectory() as directory:
+            env = {
+                **os.environ,
+                "KENZIEBUSTER_DB_PROFILE": profile,
+                "KENZIEBUSTER_DB_NAME": str(Path(directory) / "db.sqlite3"),
+                # Users are created once, hash inline instead of a pool.
+                "KENZIEBUSTER_PASSWORD_HASHING_WORKERS": "0",
+            }
+            argv = [sys.executable, "-m", "benchmarks.write_contention", "--run"]
+            argv += ["--processes", str(args.processes), "--orders", str(args.orders)]
+            output = subprocess.run(
+                argv, env=env, check=True, capture_output=True, text=True
+            )
+
+        r = json.loads(output.stdout.splitlines()[-1])
+        print(
+            f"{profile:>12}: {r['orders_per_second']:6.0f} orders/s  "
+            f"p50 {r['p50_ms']:6.1f}ms  p99 {r['p99_ms']:7.1f}ms  "
+            f"placed {r['placed']}  locked {r['locked']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class MoviesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "movies"
+
+    def ready(self):
+        from _kenziebuster.sqlite import configure_connection
+
+        connection_created.connect(configure_connection, dispatch_uid="sqlite_pragmas")
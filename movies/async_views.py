@@ -0,0 +1,241 @@
+"""
+Coroutine versions of the catalog and order views, served instead of the
+ones in `movies.views` when `ASYNC_VIEWS` is on (the default under
+`_kenziebuster.asgi`). Responses, status codes and query budgets match the
+sync views.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from rest_framework import exceptions
+from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.views import APIView, Request, Response, status
+
+from _kenziebuster.conditional import (
+    forget_validators,
+    get_validators,
+    model_validators,
+    set_validators,
+    validators_key,
+)
+from _kenziebuster.query_budget import query_budget
+from _kenziebuster.routers import reading_from_replica
+from users.authentication import AnonymousSafeMethodsMixin, CachedJWTAuthentication
+from users.models import User
+
+from .cache import (
+    bump_catalog_version,
+    catalog_version,
+    get_cached_list,
+    list_validators,
+    set_cached_list,
+)
+from .fragments import movie_fragments, page_response, page_rows, render_page
+from .idempotency import key_queries, run_once
+from .models import Movie
+from .pagination import (
+    AsyncMovieCursorPagination,
+    AsyncPageNumberPagination,
+    MovieRowsPaginator,
+)
+from .permissions import IsEmployeeOrReadOnly
+from .search import search_movies
+from .serializers import MovieFilterSerializer, MovieOrderSerializer, MovieSerializer
+
+
+async def aget_object_or_404(queryset, **kwargs):
+    try:
+        return await queryset.aget(**kwargs)
+    except queryset.model.DoesNotExist:
+        raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines, so Django runs it on the event
+    loop under ASGI instead of in a worker thread.
+
+    Authentication is awaited before `initial()`, which then finds
+    `request.user` already set, unless `skips_authentication()` leaves
+    the request anonymous. Permission checks only read the request
+    and run inline.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            if not self.skips_authentication(request):
+                await self.aperform_authentication(request)
+            self.initial(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def skips_authentication(self, request: Request) -> bool:
+        return False
+
+    async def aperform_authentication(self, request: Request) -> None:
+        """Async `Request._authenticate`, awaiting `aauthenticate` when offered."""
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(
+                        request
+                    )
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._not_authenticated()
+
+
+class AsyncMovieView(
+    AnonymousSafeMethodsMixin, AsyncAPIView, AsyncPageNumberPagination
+):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsEmployeeOrReadOnly]
+    replica_reads = True
+    django_paginator_class = MovieRowsPaginator
+
+    @query_budget(2)
+    async def get(self, req: Request) -> Response:
+        version = await sync_to_async(catalog_version)()
+        validators = list_validators(req, version)
+        not_modified = validators.not_modified(req)
+        if not_modified is not None:
+            return not_modified
+
+        cache_key, cached = await sync_to_async(get_cached_list)(req, version)
+        if cached is not None:
+            response = page_response(req, cached)
+            response["X-Cache"] = "HIT"
+            return validators.apply(response)
+
+        filters = MovieFilterSerializer(data=req.query_params)
+        filters.is_valid(raise_exception=True)
+        # Page numbers count this queryset as is, the page turns into rows.
+        movies_list = filters.filter_queryset(Movie.objects.order_by("id"))
+
+        paginator = self
+        if "q" in req.query_params:
+            # Ranked results are paged by number, a rank makes no stable cursor.
+            movies_list = search_movies(movies_list, req.query_params["q"])
+        elif AsyncMovieCursorPagination.is_requested(req):
+            # Cursor pages never count, they slice the rows directly.
+            paginator = AsyncMovieCursorPagination()
+            movies_list = page_rows(movies_list)
+
+        result_page = await paginator.apaginate_queryset(movies_list, req, view=self)
+        envelope = paginator.get_paginated_response([]).data
+        content = render_page(envelope, result_page)
+
+        await sync_to_async(set_cached_list)(cache_key, content)
+        response = page_response(req, content)
+        response["X-Cache"] = "MISS"
+        if reading_from_replica():
+            # The ETag names the current version, which a lagging replica may predate.
+            return response
+        return validators.apply(response)
+
+    @query_budget(1)
+    async def post(self, req: Request) -> Response:
+        serializer = MovieSerializer(data=req.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.instance = await Movie.objects.acreate(
+            **serializer.instance_fields(
+                {**serializer.validated_data, "user": req.user}
+            )
+        )
+        await sync_to_async(bump_catalog_version)()
+
+        return Response(serializer.data, status.HTTP_201_CREATED)
+
+
+class AsyncMovieDetailView(AnonymousSafeMethodsMixin, AsyncAPIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsEmployeeOrReadOnly]
+    replica_reads = True
+
+    @query_budget(1)
+    async def get(self, req: Request, movie_id: int) -> Response:
+        key = validators_key(Movie, movie_id)
+        # added_by comes from the owner, whose row is unknown until the movie loads.
+        validators, generations = await sync_to_async(get_validators)(
+            key, depends_on=(validators_key(User),)
+        )
+        if validators is not None:
+            not_modified = validators.not_modified(req)
+            if not_modified is not None:
+                return not_modified
+
+        movie = await aget_object_or_404(
+            Movie.objects.select_related("user"), id=movie_id
+        )
+        validators = model_validators(movie, movie.user)
+        await sync_to_async(set_validators)(key, validators, generations)
+
+        not_modified = validators.not_modified(req)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = MovieSerializer(movie)
+
+        return validators.apply(Response(serializer.data, status.HTTP_200_OK))
+
+    @query_budget(4)
+    async def delete(self, req: Request, movie_id: int) -> Response:
+        deleted, _ = await Movie.objects.filter(id=movie_id).adelete()
+        if not deleted:
+            raise Http404(f"No {Movie._meta.object_name} matches the given query.")
+
+        await sync_to_async(bump_catalog_version)()
+        movie_fragments.invalidate(movie_id)
+        await sync_to_async(forget_validators)(validators_key(Movie, movie_id))
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class AsyncMovieOrderView(AsyncAPIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    @query_budget(4, extra=key_queries)
+    async def post(self, req: Request, movie_id: int) -> Response:
+        movie = await aget_object_or_404(Movie.objects.only("id", "title"), id=movie_id)
+        serializer = MovieOrderSerializer(data=req.data)
+        serializer.is_valid(raise_exception=True)
+
+        def place_order() -> Response:
+            serializer.save(user=req.user, movie=movie)
+            return Response(serializer.data, status.HTTP_201_CREATED)
+
+        # The key, the order and its counter shard are written in one
+        # transaction, which has to stay on a single thread.
+        return await sync_to_async(run_once)(req, place_order)
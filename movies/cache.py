@@ -0,0 +1,63 @@
+import hashlib
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.views import Request
+
+from _kenziebuster.conditional import Validators, digest_etag
+from _kenziebuster.routers import reading_from_replica
+
+CATALOG_VERSION_KEY = "movies:catalog:version"
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def catalog_version() -> int:
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, 1, timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY, 1)
+    return version
+
+
+def bump_catalog_version() -> int:
+    """Invalidates every cached catalog page in O(1) by moving to a new version."""
+    try:
+        return cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.add(CATALOG_VERSION_KEY, 1, timeout=None)
+        return cache.incr(CATALOG_VERSION_KEY)
+
+
+def list_cache_key(request: Request, version: int) -> str:
+    params = sorted(request.query_params.lists())
+    raw = f"{request.scheme}://{request.get_host()}|{params}".encode()
+    return f"movies:list:v{version}:{hashlib.md5(raw).hexdigest()}"
+
+
+def list_validators(request: Request, version: int) -> Validators:
+    """Every catalog write moves the version, so the page key is a strong ETag."""
+    return Validators(etag=digest_etag(list_cache_key(request, version)))
+
+
+def get_cached_list(request: Request, version: int = None):
+    key = list_cache_key(request, catalog_version() if version is None else version)
+    data = cache.get(key)
+
+    with _stats_lock:
+        _stats["hits" if data is not None else "misses"] += 1
+
+    return key, data
+
+
+def set_cached_list(key: str, data) -> None:
+    # The key names the current version, a lagging replica may not have it yet.
+    if not reading_from_replica():
+        cache.set(key, data, timeout=settings.MOVIES_LIST_CACHE_TIMEOUT)
+
+
+def cache_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
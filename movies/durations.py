@@ -0,0 +1,31 @@
+import re
+
+HOURS_MINUTES = re.compile(
+    r"^(?:(\d+)\s*h(?:ours?|rs?)?)?\s*(?:(\d+)\s*m(?:in(?:utes?|s)?)?)?$"
+)
+CLOCK = re.compile(r"^(\d+):([0-5]\d)$")
+
+
+def parse_duration_minutes(duration: str | None) -> int | None:
+    """
+    Reads the free-form `Movie.duration` ("110min", "1h30", "2h", "1:50",
+    "110") as a number of minutes, or None when it can't be parsed.
+    """
+    if not duration:
+        return None
+
+    text = duration.strip().lower()
+    if text.isdigit():
+        return int(text)
+
+    match = CLOCK.match(text)
+    if match:
+        return int(match[1]) * 60 + int(match[2])
+
+    # "1h30" has no minute unit, accept a bare number after the hours.
+    text = re.sub(r"(h(?:ours?|rs?)?)\s*(\d+)$", r"\1\2m", text)
+    match = HOURS_MINUTES.match(text)
+    if match and (match[1] or match[2]):
+        return int(match[1] or 0) * 60 + int(match[2] or 0)
+
+    return None
@@ -0,0 +1,42 @@
+import csv
+import json
+
+from django.db.models import F
+
+from .models import Movie
+
+EXPORT_FIELDS = ("id", "title", "duration", "rating", "synopsis", "added_by")
+
+
+class _Echo:
+    """File-like object whose `write` hands back the line instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def iter_catalog_rows(chunk_size: int):
+    """Yields catalog rows as tuples in `EXPORT_FIELDS` order, joined with the owner."""
+    return (
+        Movie.objects.order_by("id")
+        .values_list(*EXPORT_FIELDS[:-1], F("user__email"))
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False) + "\n"
+
+
+def csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_lines, "application/x-ndjson"),
+    "csv": (csv_lines, "text/csv"),
+}
@@ -0,0 +1,109 @@
+"""
+Catalog pages spliced together from pre-rendered JSON, one fragment per movie.
+
+Fragments are cached per process by movie id and stamped with the row's
+version and its owner's (added_by). A fragment is reused until either of
+them changes. The cache is an LRU bounded by the total size of the
+fragments it holds.
+"""
+import json
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import F, QuerySet
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import Request, Response
+
+from .serializers import MovieSerializer
+
+
+class FragmentCache:
+    def __init__(self, maxbytes: int):
+        self.maxbytes = maxbytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_many(self, stamps: dict) -> dict:
+        """Fragments for `{key: stamp}` whose stamp still matches."""
+        found = {}
+        with self._lock:
+            for key, stamp in stamps.items():
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == stamp:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[1]
+            self._stats["hits"] += len(found)
+            self._stats["misses"] += len(stamps) - len(found)
+        return found
+
+    def set(self, key, stamp, fragment: bytes) -> None:
+        if len(fragment) > self.maxbytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[1])
+            self._entries[key] = (stamp, fragment)
+            self.size += len(fragment)
+            while self.size > self.maxbytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= len(entry[1])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self.size}
+
+
+movie_fragments = FragmentCache(maxbytes=settings.MOVIE_FRAGMENT_CACHE_BYTES)
+
+
+def page_rows(queryset: QuerySet) -> QuerySet:
+    """`MovieSerializer.values_rows()` plus the columns that stamp a fragment."""
+    return MovieSerializer.values_rows(
+        queryset, "version", owner_version=F("user__version")
+    )
+
+
+def render_page(envelope: dict, rows: list) -> bytes:
+    """
+    The JSON of `{**envelope, "results": rows}`, byte for byte what
+    JSONRenderer gives for the serialized page. `results` must be the
+    envelope's last key, as in every DRF paginated response.
+    """
+    renderer = JSONRenderer()
+    stamps = {row["id"]: (row["version"], row["owner_version"]) for row in rows}
+    fragments = movie_fragments.get_many(stamps)
+
+    missing = [row for row in rows if row["id"] not in fragments]
+    if missing:
+        for row, data in zip(missing, MovieSerializer(missing, many=True).data):
+            fragment = renderer.render(data)
+            movie_fragments.set(row["id"], stamps[row["id"]], fragment)
+            fragments[row["id"]] = fragment
+
+    head = renderer.render({**envelope, "results": []})
+    return head[:-3] + b"[" + b",".join(fragments[row["id"]] for row in rows) + b"]}"
+
+
+def page_response(request: Request, content: bytes):
+    """Sends a rendered page as is, unless the client negotiated another renderer."""
+    if isinstance(request.accepted_renderer, JSONRenderer):
+        return HttpResponse(content, content_type=request.accepted_renderer.media_type)
+    return Response(json.loads(content))
@@ -0,0 +1,124 @@
+"""
+`Idempotency-Key` support for order placement.
+
+The first request with a key claims it by inserting its `IdempotencyKey`
+row, then places the order and stores the response, all in one
+transaction. A retry with the same key replays the stored response
+without touching the orders table. A concurrent duplicate blocks on the
+claim's unique constraint until the original commits, then replays it, so
+only one order is inserted. If the original fails, its claim rolls back
+with it and the key is free again.
+
+Keys are scoped per user and expire after `IDEMPOTENCY_KEY_TTL` seconds;
+`purge_idempotency_keys` deletes the expired rows.
+"""
+import hashlib
+import json
+from collections.abc import Callable
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import exceptions
+from rest_framework.views import Request, Response, status
+
+from .models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+KEY_MAX_LENGTH = IdempotencyKey._meta.get_field("key").max_length
+# The key lookup, its claim and the stored response, plus deleting the old
+# row when the key had expired.
+KEY_QUERIES = 4
+
+
+class IdempotencyKeyReused(exceptions.APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This Idempotency-Key was already used with a different request."
+    default_code = "idempotency_key_reused"
+
+
+def expiry_cutoff():
+    return timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+
+
+def request_hash(request: Request) -> str:
+    body = json.dumps(
+        request.data, sort_keys=True, separators=(",", ":"), cls=DjangoJSONEncoder
+    )
+    return hashlib.sha256(
+        f"{request.method} {request.path}\n{body}".encode()
+    ).hexdigest()
+
+
+def key_queries(request: Request) -> int:
+    """Queries `run_once` adds to `request`, the `extra` of a `query_budget`."""
+    return KEY_QUERIES if HEADER in request.headers else 0
+
+
+def replay(record: IdempotencyKey, fingerprint: str) -> Response:
+    if record.request_hash != fingerprint:
+        raise IdempotencyKeyReused()
+    return Response(
+        record.response, record.status_code, headers={"Idempotent-Replayed": "true"}
+    )
+
+
+def run_once(request: Request, handler: Callable[[], Response]) -> Response:
+    """
+    Runs `handler` once per `Idempotency-Key` of `request.user`, and just
+    runs it when the request has no key.
+    """
+    key = request.headers.get(HEADER)
+    if key is None:
+        return handler()
+    if not key or len(key) > KEY_MAX_LENGTH:
+        raise exceptions.ValidationError(
+            {
+                HEADER: [
+                    f"Ensure this header has between 1 and {KEY_MAX_LENGTH} characters."
+                ]
+            }
+        )
+
+    fingerprint = request_hash(request)
+    keys = IdempotencyKey.objects.filter(user_id=request.user.pk, key=key)
+    record = keys.first()
+    if record is not None and record.created_at >= expiry_cutoff():
+        return replay(record, fingerprint)
+
+    claimed = None
+    try:
+        with transaction.atomic():
+            if record is not None:
+                # Expired but not purged yet, the key starts over.
+                keys.filter(created_at__lt=expiry_cutoff()).delete()
+            claimed = IdempotencyKey.objects.create(
+                user_id=request.user.pk, key=key, request_hash=fingerprint
+            )
+            response = handler()
+            claimed.status_code = response.status_code
+            claimed.response = response.data
+            claimed.save(update_fields=["status_code", "response"])
+    except IntegrityError:
+        if claimed is not None:
+            raise
+        # A concurrent request with this key committed first.
+        return replay(keys.get(), fingerprint)
+
+    return response
+
+
+def purge_expired_keys(batch_size: int = 1000) -> int:
+    """Deletes expired keys `batch_size` rows per statement, returns how many."""
+    cutoff = expiry_cutoff()
+    expired = IdempotencyKey.objects.filter(created_at__lt=cutoff).order_by(
+        "created_at"
+    )
+    purged = 0
+    while True:
+        batch = list(expired.values_list("pk", flat=True)[:batch_size])
+        if not batch:
+            return purged
+        purged += IdempotencyKey.objects.filter(pk__in=batch).delete()[0]
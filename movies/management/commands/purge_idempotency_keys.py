@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from movies.idempotency import purge_expired_keys
+
+
+class Command(BaseCommand):
+    help = "Deletes order Idempotency-Keys older than IDEMPOTENCY_KEY_TTL, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, batch_size, **options):
+        purged = purge_expired_keys(batch_size=batch_size)
+        self.stdout.write(
+            self.style.SUCCESS(f"Purged {purged} expired idempotency keys.")
+        )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from movies.search import is_supported, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Recreates the movie full-text search triggers and rebuilds the index from movies_movie."
+
+    def handle(self, *args, **options):
+        if not is_supported():
+            raise CommandError("Full-text search needs the SQLite FTS5 extension.")
+
+        rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS("Movie search index rebuilt."))
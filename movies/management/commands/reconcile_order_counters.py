@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from movies.models import MovieOrder, MovieOrderCounter
+
+
+class Command(BaseCommand):
+    help = "Recomputes the per-movie order counters from movies_movieorder."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--movie",
+            type=int,
+            action="append",
+            dest="movie_ids",
+            help="Only reconcile this movie id (repeatable).",
+        )
+
+    def handle(self, *args, movie_ids=None, **options):
+        orders = MovieOrder.objects.all()
+        counters = MovieOrderCounter.objects.all()
+        if movie_ids:
+            orders = orders.filter(movie_id__in=movie_ids)
+            counters = counters.filter(movie_id__in=movie_ids)
+
+        totals = (
+            orders.values("movie_id")
+            .annotate(orders_count=Count("id"), revenue=Sum("price"))
+            .order_by("movie_id")
+        )
+
+        with transaction.atomic():
+            counters.delete()
+            reconciled = MovieOrderCounter.objects.bulk_create(
+                MovieOrderCounter(
+                    movie_id=row["movie_id"],
+                    shard=0,
+                    orders_count=row["orders_count"],
+                    revenue=row["revenue"],
+                )
+                for row in totals
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reconciled order counters for {len(reconciled)} movies."
+            )
+        )
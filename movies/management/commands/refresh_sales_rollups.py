@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from movies.rollups import refresh_sales_rollups
+
+
+class Command(BaseCommand):
+    help = "Folds orders placed since the last run into the hourly and daily sales rollups."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--lag",
+            type=int,
+            help="Leave orders younger than this many seconds (default: SALES_ROLLUP_LAG).",
+        )
+
+    def handle(self, *args, batch_size, lag, **options):
+        folded = refresh_sales_rollups(batch_size=batch_size, lag=lag)
+        self.stdout.write(
+            self.style.SUCCESS(f"Folded {folded} orders into the sales rollups.")
+        )
@@ -0,0 +1,57 @@
+# Generated by Django 4.1.6 on 2026-10-18 01:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("movies", "0002_movieorder_movie_orders"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="movieorder",
+            name="movie",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="movie_order",
+                to="movies.movie",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="movieorder",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="user_movie_order",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["title", "id"], name="movie_title_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["rating", "title"], name="movie_rating_title_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movieorder",
+            index=models.Index(
+                fields=["movie", "buyed_at"], name="order_movie_buyed_at_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movieorder",
+            index=models.Index(
+                fields=["user", "buyed_at"], name="order_user_buyed_at_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.1.6 on 2026-10-18 01:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+import movies.search
+
+
+def install_search_index(apps, schema_editor):
+    if movies.search.is_supported(schema_editor.connection):
+        movies.search.rebuild_search_index(schema_editor.connection)
+
+
+def uninstall_search_index(apps, schema_editor):
+    if movies.search.is_supported(schema_editor.connection):
+        movies.search.uninstall_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0003_movie_and_order_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieSearch",
+            fields=[
+                (
+                    "movie",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search",
+                        serialize=False,
+                        to="movies.movie",
+                    ),
+                ),
+                ("title", models.TextField()),
+                ("synopsis", models.TextField(null=True)),
+                ("document", movies.search.FullTextField(db_column="movies_movie_fts")),
+                ("rank", models.FloatField()),
+            ],
+            options={
+                "db_table": "movies_movie_fts",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.6 on 2026-10-18 01:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0004_movie_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="duration_minutes",
+            field=models.PositiveIntegerField(db_index=True, default=None, null=True),
+        ),
+    ]
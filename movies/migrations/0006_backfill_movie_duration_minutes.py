@@ -0,0 +1,48 @@
+from django.db import migrations, transaction
+
+from movies.durations import parse_duration_minutes
+
+BATCH_SIZE = 1000
+
+
+def backfill_duration_minutes(apps, schema_editor):
+    """
+    Fills `duration_minutes` in id order, one transaction per batch. Only
+    rows still missing the value are read, so an interrupted run resumes
+    where it stopped when the migration is applied again.
+    """
+    Movie = apps.get_model("movies", "Movie")
+    db_alias = schema_editor.connection.alias
+    pending = Movie.objects.using(db_alias).filter(
+        duration_minutes__isnull=True, duration__isnull=False
+    )
+
+    last_id = 0
+    while True:
+        batch = list(
+            pending.filter(id__gt=last_id)
+            .order_by("id")
+            .only("id", "duration")[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+
+        for movie in batch:
+            movie.duration_minutes = parse_duration_minutes(movie.duration)
+
+        with transaction.atomic(using=db_alias):
+            Movie.objects.using(db_alias).bulk_update(batch, ["duration_minutes"])
+
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("movies", "0005_movie_duration_minutes"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_duration_minutes, migrations.RunPython.noop),
+    ]
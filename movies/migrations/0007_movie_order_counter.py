@@ -0,0 +1,48 @@
+# Generated by Django 4.1.6 on 2026-10-18 01:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0006_backfill_movie_duration_minutes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieOrderCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("shard", models.PositiveSmallIntegerField()),
+                ("orders_count", models.PositiveBigIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "movie",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="order_counters",
+                        to="movies.movie",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="movieordercounter",
+            constraint=models.UniqueConstraint(
+                fields=("movie", "shard"), name="unique_movie_order_counter_shard"
+            ),
+        ),
+    ]
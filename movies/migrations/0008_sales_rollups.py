@@ -0,0 +1,127 @@
+# Generated by Django 4.1.6 on 2026-10-18 01:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0007_movie_order_counter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieSalesRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")], max_length=4
+                    ),
+                ),
+                ("bucket", models.DateTimeField()),
+                ("orders_count", models.PositiveBigIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="RatingSalesRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")], max_length=4
+                    ),
+                ),
+                ("bucket", models.DateTimeField()),
+                (
+                    "rating",
+                    models.CharField(
+                        choices=[
+                            ("G", "Default"),
+                            ("PG", "Pg"),
+                            ("PG-13", "Pg 13"),
+                            ("R", "R"),
+                            ("NC-17", "Nc 17"),
+                        ],
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                ("orders_count", models.PositiveBigIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="RollupWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("last_order_id", models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="ratingsalesrollup",
+            constraint=models.UniqueConstraint(
+                fields=("granularity", "bucket", "rating"),
+                name="unique_rating_sales_rollup_bucket",
+            ),
+        ),
+        migrations.AddField(
+            model_name="moviesalesrollup",
+            name="movie",
+            field=models.ForeignKey(
+                db_constraint=False,
+                db_index=False,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="sales_rollups",
+                to="movies.movie",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="moviesalesrollup",
+            index=models.Index(
+                fields=["movie", "granularity", "bucket"],
+                name="movie_sales_rollup_movie_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="moviesalesrollup",
+            constraint=models.UniqueConstraint(
+                fields=("granularity", "bucket", "movie"),
+                name="unique_movie_sales_rollup_bucket",
+            ),
+        ),
+    ]
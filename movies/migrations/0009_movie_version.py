@@ -0,0 +1,31 @@
+# Generated by Django 4.1.6 on 2026-10-18 02:24
+
+from django.db import migrations, models
+import movies.search
+
+
+def install_search_index(apps, schema_editor):
+    # SQLite adds these columns by rebuilding movies_movie, which drops the
+    # triggers that keep the FTS index in sync.
+    if movies.search.is_supported(schema_editor.connection):
+        movies.search.install_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0008_sales_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(install_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.6 on 2026-10-18 02:46
+
+from django.db import migrations, models
+import movies.search
+
+
+def install_search_index(apps, schema_editor):
+    # SQLite drops the single-column index by rebuilding movies_movie, which
+    # drops the triggers that keep the FTS index in sync.
+    if movies.search.is_supported(schema_editor.connection):
+        movies.search.install_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0010_idempotency_key"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="movie",
+            name="duration_minutes",
+            field=models.PositiveIntegerField(default=None, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["duration_minutes", "id"], name="movie_duration_id_idx"
+            ),
+        ),
+        migrations.RunPython(install_search_index, migrations.RunPython.noop),
+    ]
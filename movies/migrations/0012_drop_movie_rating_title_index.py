@@ -0,0 +1,16 @@
+# Generated by Django 4.1.6 on 2026-10-18 03:11
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("movies", "0011_movie_duration_id_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="movie",
+            name="movie_rating_title_idx",
+        ),
+    ]
@@ -1,4 +1,12 @@
-from django.db import models
+import random
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+
+from _kenziebuster.conditional import VersionedModel
+
+from .search import FTS_TABLE, FullTextField
 
 
 class MovieChoices(models.TextChoices):
@@ -9,9 +17,12 @@ class MovieChoices(models.TextChoices):
     NC_17 = "NC-17"
 
 
-class Movie(models.Model):
+class Movie(VersionedModel):
     title = models.CharField(max_length=127, null=False)
     duration = models.CharField(max_length=10, null=True, default=None)
+    # `duration` parsed to minutes, kept by MovieSerializer for range filters.
+    # Covered by the (duration_minutes, id) index below.
+    duration_minutes = models.PositiveIntegerField(null=True, default=None)
     rating = models.CharField(
         max_length=20,
         null=True,
@@ -33,22 +44,191 @@ class Movie(models.Model):
         related_name="ordered_movies",
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["title", "id"], name="movie_title_id_idx"),
+            # Covers duration range filters: their count and the ids of a page.
+            models.Index(fields=["duration_minutes", "id"], name="movie_duration_id_idx"),
+        ]
+
+
+class MovieSearch(models.Model):
+    """
+    Read-only view of the FTS5 index over `Movie.title` and `Movie.synopsis`,
+    created and kept in sync by the triggers in `movies.search`.
+    """
+
+    movie = models.OneToOneField(
+        "movies.Movie",
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="search",
+    )
+    title = models.TextField()
+    synopsis = models.TextField(null=True)
+    document = FullTextField(db_column=FTS_TABLE)
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = FTS_TABLE
+
 
 class MovieOrder(models.Model):
     user = models.ForeignKey(
         "users.User",
         on_delete=models.CASCADE,
-        related_name="user_movie_order"
+        related_name="user_movie_order",
+        # Covered by the (user, buyed_at) index below.
+        db_index=False,
     )
 
     movie = models.ForeignKey(
         "movies.Movie",
         on_delete=models.CASCADE,
-        related_name="movie_order"
+        related_name="movie_order",
+        # Covered by the (movie, buyed_at) index below.
+        db_index=False,
     )
 
     buyed_at = models.DateTimeField(auto_now_add=True)
     price = models.DecimalField(max_digits=8, decimal_places=2, null=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["movie", "buyed_at"], name="order_movie_buyed_at_idx"),
+            models.Index(fields=["user", "buyed_at"], name="order_user_buyed_at_idx"),
+        ]
+
     def __repr__(self):
-        return f"<MovieOrder [{self.id}] - {self.price}>"
\ No newline at end of file
+        return f"<MovieOrder [{self.id}] - {self.price}>"
+
+
+class MovieOrderCounter(models.Model):
+    """
+    Running order count and revenue per movie, split over
+    `MOVIE_ORDER_COUNTER_SHARDS` rows so concurrent orders for a hot title
+    update different rows. A movie's totals are the sum of its shards.
+    """
+
+    movie = models.ForeignKey(
+        "movies.Movie",
+        on_delete=models.CASCADE,
+        related_name="order_counters",
+        # Covered by the (movie, shard) unique constraint below.
+        db_index=False,
+    )
+    shard = models.PositiveSmallIntegerField()
+    orders_count = models.PositiveBigIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["movie", "shard"], name="unique_movie_order_counter_shard"
+            ),
+        ]
+
+    @classmethod
+    def record(cls, order: MovieOrder) -> None:
+        """Adds `order` to a random shard, call it in the order's transaction."""
+        shard = random.randrange(settings.MOVIE_ORDER_COUNTER_SHARDS)
+        increment = {"orders_count": F("orders_count") + 1, "revenue": F("revenue") + order.price}
+        shard_rows = cls.objects.filter(movie_id=order.movie_id, shard=shard)
+
+        if shard_rows.update(**increment):
+            return
+
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    movie_id=order.movie_id, shard=shard, orders_count=1, revenue=order.price
+                )
+        except IntegrityError:
+            # A concurrent order created this shard first.
+            shard_rows.update(**increment)
+
+
+class IdempotencyKey(models.Model):
+    """
+    An `Idempotency-Key` sent with an order, and the response it got.
+    Kept for `IDEMPOTENCY_KEY_TTL` seconds, see `movies.idempotency`.
+    """
+
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+        # Covered by the (user, key) unique constraint below.
+        db_index=False,
+    )
+    key = models.CharField(max_length=255)
+    # sha256 of the method, path and body the key was first sent with.
+    request_hash = models.CharField(max_length=64)
+    # Empty until the original request finishes, in the same transaction.
+    status_code = models.PositiveSmallIntegerField(null=True, default=None)
+    response = models.JSONField(null=True, default=None)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="unique_idempotency_key_per_user"),
+        ]
+
+
+class RollupGranularity(models.TextChoices):
+    HOUR = "hour"
+    DAY = "day"
+
+
+class MovieSalesRollup(models.Model):
+    granularity = models.CharField(max_length=4, choices=RollupGranularity.choices)
+    bucket = models.DateTimeField()
+    # Sales history outlives the movie, so deleting one leaves its rollups.
+    movie = models.ForeignKey(
+        "movies.Movie",
+        on_delete=models.DO_NOTHING,
+        related_name="sales_rollups",
+        db_index=False,
+        db_constraint=False,
+    )
+    orders_count = models.PositiveBigIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "bucket", "movie"],
+                name="unique_movie_sales_rollup_bucket",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["movie", "granularity", "bucket"],
+                name="movie_sales_rollup_movie_idx",
+            ),
+        ]
+
+
+class RatingSalesRollup(models.Model):
+    granularity = models.CharField(max_length=4, choices=RollupGranularity.choices)
+    bucket = models.DateTimeField()
+    rating = models.CharField(max_length=20, null=True, choices=MovieChoices.choices)
+    orders_count = models.PositiveBigIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "bucket", "rating"],
+                name="unique_rating_sales_rollup_bucket",
+            ),
+        ]
+
+
+class RollupWatermark(models.Model):
+    """Highest MovieOrder id already folded into a set of rollup tables."""
+
+    name = models.CharField(max_length=50, unique=True)
+    last_order_id = models.PositiveBigIntegerField(default=0)
@@ -0,0 +1,206 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage, Paginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.views import Request
+
+from .fragments import page_rows
+
+
+class MovieRowsPaginator(Paginator):
+    """
+    Counts the plain `Movie` queryset and turns only the page slice into
+    `page_rows()`. Counted as rows, the owner join and annotations would
+    wrap the COUNT in a subquery over every matching movie.
+    """
+
+    def _get_page(self, object_list, *args, **kwargs):
+        query = object_list.query
+        if query.has_filters() and query.order_by == ("id",):
+            # Filtered pages sort only the matching ids, read from the
+            # filter's covering index, and fetch the page's rows by pk.
+            object_list = object_list.model.objects.filter(
+                pk__in=object_list.values("pk")
+            ).order_by("id")
+        return super()._get_page(page_rows(object_list), *args, **kwargs)
+
+
+class MovieCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the catalog, opted into with `?pagination=cursor`.
+
+    Pages on `(id)` by default or on `(title, id)` with `?ordering=title`, so
+    every page costs the same index seek and no `COUNT(*)` is issued.
+
+    DRF's CursorPagination only filters on the first ordering field and
+    OFFSETs past the rows that share it. Here the cursor position holds
+    every ordering field, so pages over duplicate titles still seek on
+    `(title, id)` and never OFFSET.
+    """
+
+    ordering = ("id",)
+    orderings = {
+        "id": ("id",),
+        "title": ("title", "id"),
+    }
+    ordering_query_param = "ordering"
+
+    @classmethod
+    def is_requested(cls, request: Request) -> bool:
+        return (
+            request.query_params.get("pagination") == "cursor"
+            or cls.cursor_query_param in request.query_params
+        )
+
+    def get_ordering(self, request, queryset, view):
+        key = request.query_params.get(self.ordering_query_param, "id")
+        return self.orderings.get(key, self.ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # CursorPagination.paginate_queryset, filtering on the whole
+        # position instead of `ordering[0]`.
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(
+                *(
+                    order[1:] if order.startswith("-") else "-" + order
+                    for order in self.ordering
+                )
+            )
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = queryset.filter(
+                self.position_filter(self.decode_position(current_position), reverse)
+            )
+
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = list(results[: self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def position_filter(self, position: list, reverse: bool) -> Q:
+        """
+        Rows after `position` in `self.ordering`, as
+        `a >= x AND (a > x OR (b >= y AND (b > y OR ...)))`, whose leading
+        range keeps the seek on the ordering index.
+        """
+        *fields, last = zip(self.ordering, position)
+        order, value = last
+        condition = Q(**{self._lookup(order, reverse, strict=True): value})
+        for order, value in reversed(fields):
+            condition = Q(**{self._lookup(order, reverse, strict=False): value}) & (
+                Q(**{self._lookup(order, reverse, strict=True): value}) | condition
+            )
+        return condition
+
+    @staticmethod
+    def _lookup(order: str, reverse: bool, strict: bool) -> str:
+        descending = order.startswith("-") != reverse
+        return (
+            order.lstrip("-")
+            + ("__lt" if descending else "__gt")
+            + ("" if strict else "e")
+        )
+
+    def decode_position(self, position: str) -> list:
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            # A cursor from another `?ordering=`.
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def _get_position_from_instance(self, instance, ordering):
+        fields = [order.lstrip("-") for order in ordering]
+        if isinstance(instance, dict):
+            values = [instance[field] for field in fields]
+        else:
+            values = [getattr(instance, field) for field in fields]
+        return json.dumps(values, separators=(",", ":"))
+
+
+class AsyncMovieCursorPagination(MovieCursorPagination):
+    async def apaginate_queryset(self, queryset, request, view=None):
+        # CursorPagination slices and evaluates the page in one call (no
+        # COUNT), so it runs on the sync thread as a whole.
+        return await sync_to_async(self.paginate_queryset)(queryset, request, view)
+
+
+class AsyncPageNumberPagination(PageNumberPagination):
+    """
+    PageNumberPagination for async views: the count and the page rows are
+    fetched with the async ORM, the links and envelope are unchanged.
+    """
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count is a cached_property, seeding it keeps page() lazy.
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+
+        self.page.object_list = [obj async for obj in self.page.object_list]
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+        self.request = request
+        return list(self.page)
@@ -0,0 +1,36 @@
+import json
+
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline-delimited JSON lazily, one line at a time.
+
+    Lines that are not valid JSON objects are yielded as `ValueError`s so
+    callers can report them per row instead of rejecting the whole body.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return self.iter_rows(stream)
+
+    @staticmethod
+    def iter_rows(stream):
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                row = json.loads(line)
+            except ValueError as err:
+                yield ValueError(f"Invalid JSON: {err}")
+                continue
+
+            if not isinstance(row, dict):
+                yield ValueError("Expected a JSON object.")
+                continue
+
+            yield row
@@ -8,4 +8,9 @@ class IsEmployeeOrReadOnly(permissions.BasePermission):
             return True
 
         if request.user.is_authenticated and request.user.is_superuser:
-            return True
\ No newline at end of file
+            return True
+
+
+class IsEmployee(permissions.BasePermission):
+    def has_permission(self, request: Request, view: View):
+        return request.user.is_authenticated and request.user.is_superuser
@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+
+from .models import (
+    MovieOrder,
+    MovieSalesRollup,
+    RatingSalesRollup,
+    RollupGranularity,
+    RollupWatermark,
+)
+
+WATERMARK_NAME = "sales"
+
+TRUNCATE = {
+    RollupGranularity.HOUR: TruncHour,
+    RollupGranularity.DAY: TruncDay,
+}
+
+DIMENSIONS = (
+    (MovieSalesRollup, "movie_id", F("movie_id")),
+    (RatingSalesRollup, "rating", F("movie__rating")),
+)
+
+
+def _add_to_rollups(
+    model, field: str, granularity: str, totals, chunk_size: int = 500
+) -> None:
+    """
+    Adds `totals` (rows of bucket, dimension, orders_count and revenue) to
+    `model`: rows that exist are incremented in SQL with one bulk_update,
+    the rest are bulk created, instead of two round trips per row.
+    """
+    pending = {(row["bucket"], row["dimension"]): row for row in totals}
+    keys = list(pending)
+    existing = []
+
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start : start + chunk_size]
+        dimensions = {dimension for _, dimension in chunk}
+        lookup = Q(**{f"{field}__in": dimensions - {None}})
+        if None in dimensions:
+            lookup |= Q(**{f"{field}__isnull": True})
+
+        rollups = model.objects.filter(
+            lookup, granularity=granularity, bucket__in={bucket for bucket, _ in chunk}
+        ).values_list("id", "bucket", field)
+        for rollup_id, bucket, dimension in rollups:
+            row = pending.pop((bucket, dimension), None)
+            if row is not None:
+                existing.append(
+                    model(
+                        id=rollup_id,
+                        orders_count=F("orders_count") + row["orders_count"],
+                        revenue=F("revenue") + row["revenue"],
+                    )
+                )
+
+    model.objects.bulk_update(
+        existing, ["orders_count", "revenue"], batch_size=chunk_size
+    )
+    model.objects.bulk_create(
+        [
+            model(
+                granularity=granularity,
+                bucket=bucket,
+                orders_count=row["orders_count"],
+                revenue=row["revenue"],
+                **{field: dimension},
+            )
+            for (bucket, dimension), row in pending.items()
+        ],
+        batch_size=chunk_size,
+    )
+
+
+def refresh_sales_rollups(batch_size: int = 10_000, lag: int = None) -> int:
+    """
+    Folds the orders placed since the last refresh into the hourly and daily
+    rollups, `batch_size` orders per transaction, and returns how many orders
+    were added. The high-water mark is the last folded order id.
+
+    Ids are handed out before commit, so with concurrent writers an order
+    can become visible after one with a higher id. The refresh stops at
+    the first order younger than `lag` seconds (`SALES_ROLLUP_LAG` by
+    default): lower ids still in flight commit before the next refresh
+    reaches them, as long as no order transaction outlasts the lag.
+    """
+    if lag is None:
+        lag = settings.SALES_ROLLUP_LAG
+
+    folded = 0
+    while True:
+        with transaction.atomic():
+            watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(
+                name=WATERMARK_NAME
+            )
+            pending = MovieOrder.objects.filter(id__gt=watermark.last_order_id)
+            if lag:
+                horizon = timezone.now() - timedelta(seconds=lag)
+                first_recent = (
+                    pending.filter(buyed_at__gt=horizon)
+                    .order_by("id")
+                    .values_list("id", flat=True)
+                    .first()
+                )
+                if first_recent is not None:
+                    pending = pending.filter(id__lt=first_recent)
+
+            batch_ids = list(
+                pending.order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not batch_ids:
+                return folded
+
+            orders = MovieOrder.objects.filter(
+                id__gt=watermark.last_order_id, id__lte=batch_ids[-1]
+            )
+            for granularity, truncate in TRUNCATE.items():
+                for model, field, expression in DIMENSIONS:
+                    totals = (
+                        orders.annotate(
+                            bucket=truncate("buyed_at"), dimension=expression
+                        )
+                        .values("bucket", "dimension")
+                        .annotate(orders_count=Count("id"), revenue=Sum("price"))
+                        .order_by()
+                    )
+                    _add_to_rollups(model, field, granularity, totals)
+
+            watermark.last_order_id = batch_ids[-1]
+            watermark.save(update_fields=["last_order_id"])
+            folded += len(batch_ids)
@@ -0,0 +1,105 @@
+import re
+
+from django.db import connection, connections
+from django.db.models import Lookup, Q, QuerySet, TextField
+
+FTS_TABLE = "movies_movie_fts"
+
+INSTALL_STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE}
+    USING fts5(title, synopsis, content='movies_movie', content_rowid='id')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON movies_movie BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, synopsis)
+        VALUES (new.id, new.title, new.synopsis);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON movies_movie BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, synopsis)
+        VALUES ('delete', old.id, old.title, old.synopsis);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, synopsis
+    ON movies_movie BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, synopsis)
+        VALUES ('delete', old.id, old.title, old.synopsis);
+        INSERT INTO {FTS_TABLE}(rowid, title, synopsis)
+        VALUES (new.id, new.title, new.synopsis);
+    END
+    """,
+]
+
+UNINSTALL_STATEMENTS = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def is_supported(conn=connection) -> bool:
+    return conn.vendor == "sqlite"
+
+
+def install_search_index(conn=connection) -> None:
+    """
+    Creates the FTS5 table and the triggers that keep it in sync with
+    movies_movie. Safe to run again: SQLite drops a table's triggers when a
+    migration rebuilds it, and this puts them back.
+    """
+    with conn.cursor() as cursor:
+        for statement in INSTALL_STATEMENTS:
+            cursor.execute(statement)
+
+
+def uninstall_search_index(conn=connection) -> None:
+    with conn.cursor() as cursor:
+        for statement in UNINSTALL_STATEMENTS:
+            cursor.execute(statement)
+
+
+def rebuild_search_index(conn=connection) -> None:
+    install_search_index(conn)
+    with conn.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+class FullTextField(TextField):
+    """The hidden FTS5 column named after its table, the target of MATCH."""
+
+
+@FullTextField.register_lookup
+class Match(Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", lhs_params + rhs_params
+
+
+def build_match_query(text: str) -> str:
+    # Quoting every word keeps user input from being parsed as FTS5 syntax.
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"' for word in words)
+
+
+def search_movies(queryset: QuerySet, text: str) -> QuerySet:
+    """Filters `queryset` to movies whose title or synopsis match, best first."""
+    match_query = build_match_query(text)
+    if not match_query:
+        return queryset.none()
+
+    if not is_supported(connections[queryset.db]):
+        return queryset.filter(
+            Q(title__icontains=text) | Q(synopsis__icontains=text)
+        ).order_by("id")
+
+    # Ties on rank (e.g. equal titles) need `id` for a stable page order.
+    return queryset.filter(search__document__match=match_query).order_by(
+        "search__rank", "id"
+    )
@@ -1,12 +1,66 @@
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
+from _kenziebuster.metrics import TimedSerializer
 from users.models import User
 from users.serializers import UserSerializer
 
-from .models import Movie, MovieChoices, MovieOrder
+from .durations import parse_duration_minutes
+from .models import (
+    Movie,
+    MovieChoices,
+    MovieOrder,
+    MovieOrderCounter,
+    MovieSalesRollup,
+    RatingSalesRollup,
+    RollupGranularity,
+)
 
 
-class MovieSerializer(serializers.Serializer):
+class ValuesRowMixin:
+    """
+    Read-only fast path for list endpoints. `values_rows()` selects the
+    output fields straight from the database, with method fields filled
+    by `values_expressions`. `to_representation()` turns those row dicts
+    into the same output a model instance gives, without building the
+    instance or resolving attributes per field.
+    """
+
+    values_expressions = {}
+
+    @classmethod
+    def values_rows(cls, queryset: QuerySet, *extra, **expressions) -> QuerySet:
+        """Rows with the output fields, plus `extra` columns the caller needs."""
+        expressions = {**cls.values_expressions, **expressions}
+        columns = [name for name in cls._declared_fields if name not in expressions]
+        return queryset.values(*columns, *extra, **expressions)
+
+    @cached_property
+    def _row_plan(self) -> list:
+        # Method fields arrive computed, the rest keep their own conversion.
+        plan = []
+        for field in self._readable_fields:
+            if isinstance(field, serializers.DateTimeField) and not hasattr(field, "timezone"):
+                # Resolved once per list instead of through the thread-local per row.
+                field.timezone = field.default_timezone()
+            method = isinstance(field, serializers.SerializerMethodField)
+            plan.append((field.field_name, None if method else field))
+        return plan
+
+    def to_representation(self, instance):
+        if not isinstance(instance, dict):
+            return super().to_representation(instance)
+
+        ret = {}
+        for name, field in self._row_plan:
+            value = instance[name]
+            ret[name] = value if value is None or field is None else field.to_representation(value)
+        return ret
+
+
+class MovieSerializer(ValuesRowMixin, TimedSerializer):
     id = serializers.IntegerField(read_only=True)
     title = serializers.CharField(max_length=127)
     duration = serializers.CharField(
@@ -22,15 +76,41 @@ class MovieSerializer(serializers.Serializer):
     synopsis = serializers.CharField(allow_null=True, default=None)
     added_by = serializers.SerializerMethodField()
 
+    values_expressions = {"added_by": F("user__email")}
+
     def get_added_by(self, obj: Movie):
         return obj.user.email
 
+    def instance_fields(self, validated_data: dict) -> dict:
+        """Model field values for a new Movie, derived columns included."""
+        return {
+            **validated_data,
+            "duration_minutes": parse_duration_minutes(validated_data.get("duration")),
+        }
+
+    def build_instance(self, validated_data: dict) -> Movie:
+        """Unsaved Movie with its derived columns filled, shared with bulk inserts."""
+        return Movie(**self.instance_fields(validated_data))
+
     def create(self, validated_data: dict):
-        return Movie.objects.create(**validated_data)
+        movie = self.build_instance(validated_data)
+        movie.save()
+        return movie
+
 
+class MovieFilterSerializer(TimedSerializer):
+    min_duration = serializers.IntegerField(min_value=0, required=False)
+    max_duration = serializers.IntegerField(min_value=0, required=False)
 
+    def filter_queryset(self, queryset):
+        if "min_duration" in self.validated_data:
+            queryset = queryset.filter(duration_minutes__gte=self.validated_data["min_duration"])
+        if "max_duration" in self.validated_data:
+            queryset = queryset.filter(duration_minutes__lte=self.validated_data["max_duration"])
+        return queryset
 
-class MovieOrderSerializer(serializers.Serializer):
+
+class MovieOrderSerializer(ValuesRowMixin, TimedSerializer):
     id = serializers.IntegerField(read_only=True)
     title = serializers.SerializerMethodField(method_name="get_title")
     buyed_by = serializers.SerializerMethodField(method_name="get_buyed_by")
@@ -41,6 +121,8 @@ class MovieOrderSerializer(serializers.Serializer):
         allow_null=False
     )
 
+    values_expressions = {"title": F("movie__title"), "buyed_by": F("user__email")}
+
     def get_title(self, obj: MovieOrder):
         return obj.movie.title
 
@@ -48,4 +130,57 @@ class MovieOrderSerializer(serializers.Serializer):
         return obj.user.email
 
     def create(self, validated_data: dict):
-        return MovieOrder.objects.create(**validated_data)
\ No newline at end of file
+        with transaction.atomic():
+            order = MovieOrder.objects.create(**validated_data)
+            MovieOrderCounter.record(order)
+
+        return order
+
+
+class MovieStatsSerializer(TimedSerializer):
+    movie_id = serializers.IntegerField()
+    orders_count = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class MovieSalesReportSerializer(TimedSerializer):
+    bucket = serializers.DateTimeField()
+    movie_id = serializers.IntegerField()
+    orders_count = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class RatingSalesReportSerializer(TimedSerializer):
+    bucket = serializers.DateTimeField()
+    rating = serializers.CharField(allow_null=True)
+    orders_count = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class SalesReportFilterSerializer(TimedSerializer):
+    reports = {
+        "movie": (MovieSalesRollup, "movie_id", MovieSalesReportSerializer),
+        "rating": (RatingSalesRollup, "rating", RatingSalesReportSerializer),
+    }
+
+    granularity = serializers.ChoiceField(
+        choices=RollupGranularity.choices, default=RollupGranularity.DAY
+    )
+    group_by = serializers.ChoiceField(choices=list(reports), default="movie")
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+
+    def get_report_serializer_class(self):
+        return self.reports[self.validated_data["group_by"]][2]
+
+    def get_queryset(self):
+        data = self.validated_data
+        model, dimension, _ = self.reports[data["group_by"]]
+        queryset = model.objects.filter(granularity=data["granularity"])
+
+        if "start" in data:
+            queryset = queryset.filter(bucket__gte=data["start"])
+        if "end" in data:
+            queryset = queryset.filter(bucket__lt=data["end"])
+
+        return queryset.order_by("bucket", dimension)
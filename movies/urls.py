@@ -1,9 +1,28 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import MovieView, MovieDetailView, MovieOrderView
+from .async_views import AsyncMovieDetailView, AsyncMovieOrderView, AsyncMovieView
+from .views import (
+    MovieBulkView,
+    MovieDetailView,
+    MovieExportView,
+    MovieOrderView,
+    MovieStatsView,
+    MovieView,
+    SalesReportView,
+)
+
+if settings.ASYNC_VIEWS:
+    MovieView = AsyncMovieView
+    MovieDetailView = AsyncMovieDetailView
+    MovieOrderView = AsyncMovieOrderView
 
 urlpatterns = [
     path("movies/", MovieView.as_view()),
+    path("movies/bulk/", MovieBulkView.as_view()),
+    path("movies/export/", MovieExportView.as_view()),
     path("movies/<int:movie_id>/", MovieDetailView.as_view()),
-    path("movies/<int:movie_id>/orders/", MovieOrderView.as_view())
+    path("movies/<int:movie_id>/orders/", MovieOrderView.as_view()),
+    path("movies/<int:movie_id>/stats/", MovieStatsView.as_view()),
+    path("reports/sales/", SalesReportView.as_view()),
 ]
@@ -1,62 +1,273 @@
+from collections.abc import Iterator
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.serializers import as_serializer_error
 from rest_framework.views import APIView, Request, Response, status
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from .models import Movie
-from .permissions import IsEmployeeOrReadOnly
-from .serializers import MovieOrderSerializer, MovieSerializer
+from _kenziebuster.conditional import (
+    forget_validators,
+    get_validators,
+    model_validators,
+    set_validators,
+    validators_key,
+)
+from _kenziebuster.query_budget import query_budget
+from _kenziebuster.routers import reading_from_replica
+from users.authentication import AnonymousSafeMethodsMixin, CachedJWTAuthentication
+from users.models import User
+
+from .cache import (
+    bump_catalog_version,
+    catalog_version,
+    get_cached_list,
+    list_validators,
+    set_cached_list,
+)
+from .exports import EXPORT_FORMATS, iter_catalog_rows
+from .fragments import movie_fragments, page_response, page_rows, render_page
+from .idempotency import key_queries, run_once
+from .models import Movie, MovieOrderCounter
+from .pagination import MovieCursorPagination, MovieRowsPaginator
+from .parsers import NDJSONParser
+from .permissions import IsEmployee, IsEmployeeOrReadOnly
+from .search import search_movies
+from .serializers import (
+    MovieFilterSerializer,
+    MovieOrderSerializer,
+    MovieSerializer,
+    MovieStatsSerializer,
+    SalesReportFilterSerializer,
+)
 
 
-class MovieView(APIView, PageNumberPagination):
-    authentication_classes = [JWTAuthentication]
+class MovieView(AnonymousSafeMethodsMixin, APIView, PageNumberPagination):
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsEmployeeOrReadOnly]
+    replica_reads = True
+    django_paginator_class = MovieRowsPaginator
 
+    @query_budget(2)
     def get(self, req: Request) -> Response:
-        movies_list = Movie.objects.all()
-        result_page = self.paginate_queryset(movies_list, req)
-        serializer = MovieSerializer(result_page, many=True)
-        return self.get_paginated_response(serializer.data)
+        version = catalog_version()
+        validators = list_validators(req, version)
+        not_modified = validators.not_modified(req)
+        if not_modified is not None:
+            return not_modified
 
-        return Response(serializer.data, status.HTTP_200_OK)
-    
+        cache_key, cached = get_cached_list(req, version)
+        if cached is not None:
+            response = page_response(req, cached)
+            response["X-Cache"] = "HIT"
+            return validators.apply(response)
+
+        filters = MovieFilterSerializer(data=req.query_params)
+        filters.is_valid(raise_exception=True)
+        # Page numbers count this queryset as is, the page turns into rows.
+        movies_list = filters.filter_queryset(Movie.objects.order_by("id"))
+
+        paginator = self
+        if "q" in req.query_params:
+            # Ranked results are paged by number, a rank makes no stable cursor.
+            movies_list = search_movies(movies_list, req.query_params["q"])
+        elif MovieCursorPagination.is_requested(req):
+            # Cursor pages never count, they slice the rows directly.
+            paginator = MovieCursorPagination()
+            movies_list = page_rows(movies_list)
+
+        result_page = paginator.paginate_queryset(movies_list, req, view=self)
+        envelope = paginator.get_paginated_response([]).data
+        content = render_page(envelope, result_page)
+
+        set_cached_list(cache_key, content)
+        response = page_response(req, content)
+        response["X-Cache"] = "MISS"
+        if reading_from_replica():
+            # The ETag names the current version, which a lagging replica may predate.
+            return response
+        return validators.apply(response)
+
+    @query_budget(1)
     def post(self, req: Request) -> Response:
         serializer = MovieSerializer(data=req.data)
         serializer.is_valid(raise_exception=True)
         serializer.save(user=req.user)
+        bump_catalog_version()
 
         return Response(serializer.data, status.HTTP_201_CREATED)
 
 
-class MovieDetailView(APIView):
-    authentication_classes = [JWTAuthentication]
+class MovieBulkView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsEmployeeOrReadOnly]
-    
+    parser_classes = [JSONParser, NDJSONParser]
+
+    def get_batch_size(self, req: Request) -> int:
+        batch_size = req.query_params.get("batch_size", settings.MOVIES_BULK_BATCH_SIZE)
+        try:
+            batch_size = int(batch_size)
+        except (TypeError, ValueError):
+            raise ValidationError({"batch_size": ["A valid integer is required."]})
+
+        if batch_size < 1:
+            raise ValidationError({"batch_size": ["Ensure this value is greater than or equal to 1."]})
+
+        return min(batch_size, settings.MOVIES_BULK_MAX_BATCH_SIZE)
+
+    def post(self, req: Request) -> Response:
+        batch_size = self.get_batch_size(req)
+        rows = req.data
+        if not isinstance(rows, (list, Iterator)):
+            raise ValidationError({"detail": ["Expected a list of movies."]})
+
+        # One child serializer validates every row, like MovieSerializer(many=True).
+        child = MovieSerializer()
+        created = 0
+        errors = []
+        batch = []
+
+        with transaction.atomic():
+            for index, row in enumerate(rows):
+                if isinstance(row, ValueError):
+                    errors.append({"index": index, "errors": {"detail": [str(row)]}})
+                    continue
+
+                try:
+                    validated_data = child.run_validation(row)
+                except ValidationError as exc:
+                    errors.append({"index": index, "errors": as_serializer_error(exc)})
+                    continue
+
+                batch.append(child.build_instance({**validated_data, "user": req.user}))
+                if len(batch) >= batch_size:
+                    created += len(Movie.objects.bulk_create(batch))
+                    batch = []
+
+            if batch:
+                created += len(Movie.objects.bulk_create(batch))
+
+        if created:
+            bump_catalog_version()
+
+        status_code = status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST
+        return Response({"created": created, "errors": errors}, status_code)
+
+
+class MovieExportView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsEmployeeOrReadOnly]
+
+    def get(self, req: Request) -> StreamingHttpResponse:
+        output = req.query_params.get("output", "ndjson")
+        if output not in EXPORT_FORMATS:
+            raise ValidationError({"output": [f"Choose one of: {', '.join(EXPORT_FORMATS)}."]})
+
+        render_lines, content_type = EXPORT_FORMATS[output]
+        rows = iter_catalog_rows(chunk_size=settings.MOVIES_EXPORT_CHUNK_SIZE)
+
+        response = StreamingHttpResponse(render_lines(rows), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="movies.{output}"'
+        return response
+
+
+class MovieDetailView(AnonymousSafeMethodsMixin, APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsEmployeeOrReadOnly]
+    replica_reads = True
+
+    @query_budget(1)
     def get(self, req: Request, movie_id: int) -> Response:
-        movie = get_object_or_404(id=movie_id)
+        key = validators_key(Movie, movie_id)
+        # added_by comes from the owner, whose row is unknown until the movie loads.
+        validators, generations = get_validators(key, depends_on=(validators_key(User),))
+        if validators is not None:
+            not_modified = validators.not_modified(req)
+            if not_modified is not None:
+                return not_modified
+
+        movie = get_object_or_404(Movie.objects.select_related("user"), id=movie_id)
+        validators = model_validators(movie, movie.user)
+        set_validators(key, validators, generations)
+
+        not_modified = validators.not_modified(req)
+        if not_modified is not None:
+            return not_modified
+
         serializer = MovieSerializer(movie)
 
-        return Response(serializer.data, status.HTTP_200_OK)
-    
+        return validators.apply(Response(serializer.data, status.HTTP_200_OK))
+
+    @query_budget(4)
     def delete(self, req: Request, movie_id: int) -> Response:
         movie = get_object_or_404(Movie, id=movie_id)
 
         movie.delete()
+        bump_catalog_version()
+        movie_fragments.invalidate(movie_id)
+        forget_validators(validators_key(Movie, movie_id))
 
         return Response(status=status.HTTP_204_NO_CONTENT)
     
 
 class MovieOrderView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    @query_budget(4, extra=key_queries)
     def post(self, req: Request, movie_id: int) -> Response:
-        movie = get_object_or_404(Movie, id=movie_id)
-        seriaizer = MovieOrderSerializer(data=req.data)
-        seriaizer.is_valid(raise_exception=True)
+        # The response only needs the title, and the buyer is already on the
+        # request, so one narrow lookup plus the INSERT is the whole cost.
+        movie = get_object_or_404(Movie.objects.only("id", "title"), id=movie_id)
+        serializer = MovieOrderSerializer(data=req.data)
+        serializer.is_valid(raise_exception=True)
+
+        def place_order() -> Response:
+            serializer.save(user=req.user, movie=movie)
+            return Response(serializer.data, status.HTTP_201_CREATED)
+
+        return run_once(req, place_order)
 
-        seriaizer.save(user=req.user, movie=movie)
 
-        return Response(seriaizer.data, status.HTTP_201_CREATED)
+class MovieStatsView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsEmployee]
 
+    @query_budget(2)
+    def get(self, req: Request, movie_id: int) -> Response:
+        totals = MovieOrderCounter.objects.filter(movie_id=movie_id).aggregate(
+            orders_count=Sum("orders_count"), revenue=Sum("revenue")
+        )
+        if totals["orders_count"] is None:
+            get_object_or_404(Movie.objects.only("id"), id=movie_id)
+
+        serializer = MovieStatsSerializer(
+            {
+                "movie_id": movie_id,
+                "orders_count": totals["orders_count"] or 0,
+                "revenue": totals["revenue"] or 0,
+            }
+        )
+        return Response(serializer.data, status.HTTP_200_OK)
+
+
+class SalesReportView(APIView, PageNumberPagination):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsEmployee]
+    page_size = 100
+
+    @query_budget(2)
+    def get(self, req: Request) -> Response:
+        filters = SalesReportFilterSerializer(data=req.query_params)
+        filters.is_valid(raise_exception=True)
+
+        result_page = self.paginate_queryset(filters.get_queryset(), req, view=self)
+        serializer_class = filters.get_report_serializer_class()
+        serializer = serializer_class(result_page, many=True)
+        return self.get_paginated_response(serializer.data)
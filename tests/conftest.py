@@ -0,0 +1,17 @@
+import pytest
+from django.core.cache import cache
+
+from _kenziebuster.metrics import reset_metrics
+from movies.fragments import movie_fragments
+from users.authentication import user_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Test transactions roll back the database but not the cache, so entries
+    # keyed by catalog version or primary key would leak between tests.
+    cache.clear()
+    user_cache.clear()
+    reset_metrics()
+    movie_fragments.clear()
+    yield
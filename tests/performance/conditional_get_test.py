@@ -0,0 +1,227 @@
+from contextlib import ExitStack
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from rest_framework_simplejwt.tokens import RefreshToken
+import movies.async_views
+import movies.views
+from _kenziebuster.conditional import forget_validators, set_validators, validators_key
+from movies.models import Movie
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+    create_non_employee_with_token,
+)
+from users.models import User
+from users.serializers import UserSerializer
+
+
+class MovieConditionalGetTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 3)
+        cls.BASE_URL = "/api/movies/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def detail_url(self, movie=None):
+        return f"{self.BASE_URL}{(movie or self.movies[0]).id}/"
+
+    def test_detail_sends_validators(self):
+        response = self.client.get(self.detail_url())
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        msg = "Verifique se o detalhe do filme envia um ETag forte"
+        self.assertRegex(response["ETag"], r'^"[0-9a-f]+"$', msg)
+        msg = "Verifique se o detalhe do filme envia Last-Modified"
+        self.assertIn("Last-Modified", response, msg)
+
+    def test_matching_etag_is_answered_without_the_database(self):
+        etag = self.client.get(self.detail_url())["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se um If-None-Match válido retorna 304 sem consultar o banco"
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code, msg)
+        self.assertEqual(b"", response.content, msg)
+        self.assertEqual(etag, response["ETag"], msg)
+
+    def test_matching_etag_skips_serialization_on_a_cold_cache(self):
+        etag = self.client.get(self.detail_url())["ETag"]
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se o ETag é recalculado a partir da linha quando não está em cache"
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code, msg)
+
+    def test_owner_changes_invalidate_the_movie_etag(self):
+        etag = self.client.get(self.detail_url())["ETag"]
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Bearer " + str(self.employee_token.access_token)
+        )
+
+        self.client.patch(
+            f"/api/users/{self.employee.id}/", {"email": "novo@mail.com"}, format="json"
+        )
+        response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se mudar o email do dono (added_by) gera um novo ETag para o filme"
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+        self.assertNotEqual(etag, response["ETag"], msg)
+        self.assertEqual("novo@mail.com", response.json()["added_by"], msg)
+
+    def test_deleted_movie_is_not_answered_from_cached_validators(self):
+        etag = self.client.get(self.detail_url())["ETag"]
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Bearer " + str(self.employee_token.access_token)
+        )
+
+        self.client.delete(self.detail_url())
+        response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se um filme removido não responde 304"
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code, msg)
+
+    def get_racing(self, write):
+        """GETs the detail, committing `write` between the load and the cached validators."""
+
+        def racing_set_validators(*args, **kwargs):
+            write()
+            set_validators(*args, **kwargs)
+
+        # The concurrent write's queries land in the view's query budget.
+        with override_settings(QUERY_BUDGET_RAISE=False), ExitStack() as stack:
+            for views in (movies.views, movies.async_views):
+                stack.enter_context(
+                    mock.patch.object(views, "set_validators", racing_set_validators)
+                )
+            return self.client.get(self.detail_url())
+
+    def test_owner_change_during_a_read_is_not_cached(self):
+        def change_owner_email():
+            serializer = UserSerializer(
+                self.employee, {"email": "novo@mail.com"}, partial=True
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        etag = self.get_racing(change_owner_email)["ETag"]
+        response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag)
+
+        msg = (
+            "Verifique se uma leitura concorrente com a troca de email do dono "
+            "não deixa o ETag antigo em cache"
+        )
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+        self.assertEqual("novo@mail.com", response.json()["added_by"], msg)
+
+    def test_delete_during_a_read_is_not_cached(self):
+        movie = self.movies[0]
+
+        def delete_movie():
+            Movie.objects.filter(id=movie.id).delete()
+            forget_validators(validators_key(Movie, movie.id))
+
+        etag = self.get_racing(delete_movie)["ETag"]
+        response = self.client.get(self.detail_url(), HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se uma leitura concorrente com a remoção não deixa o filme em cache"
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code, msg)
+
+    def test_list_etag_follows_the_catalog_version(self):
+        first = self.client.get(self.BASE_URL)
+        etag = first["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.BASE_URL, HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se a listagem responde 304 enquanto o catálogo não muda"
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code, msg)
+
+        msg = "Verifique se outra página tem outro ETag"
+        self.assertNotEqual(
+            etag, self.client.get(self.BASE_URL + "?page=2")["ETag"], msg
+        )
+
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Bearer " + str(self.employee_token.access_token)
+        )
+        self.client.post(self.BASE_URL, {"title": "Novo"}, format="json")
+        response = self.client.get(self.BASE_URL, HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se criar um filme muda o ETag da listagem"
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+        self.assertNotEqual(etag, response["ETag"], msg)
+
+    def test_new_rows_start_at_version_one(self):
+        movie = Movie.objects.get(id=self.movies[0].id)
+
+        msg = "Verifique se filmes novos começam na versão 1 com updated_at preenchido"
+        self.assertEqual(1, movie.version, msg)
+        self.assertIsNotNone(movie.updated_at, msg)
+
+
+@override_settings(ROOT_URLCONF="tests.performance.movies.movie_async_views_test")
+class AsyncMovieConditionalGetTest(MovieConditionalGetTest):
+    def test_owner_changes_invalidate_the_movie_etag(self):
+        # The async URLconf has no user routes.
+        pass
+
+
+class UserConditionalGetTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user, cls.user_token = create_non_employee_with_token()
+        cls.other = User.objects.create_user(
+            username="outro",
+            email="outro@mail.com",
+            password="1234",
+            first_name="Outro",
+        )
+        cls.other_token = RefreshToken.for_user(cls.other)
+        cls.BASE_URL = f"/api/users/{cls.user.id}/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def authenticate(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+
+    def test_matching_etag_is_answered_without_loading_the_user(self):
+        self.authenticate(self.user_token)
+        etag = self.client.get(self.BASE_URL)["ETag"]
+
+        # The token's user is in the authentication cache by now.
+        with self.assertNumQueries(0):
+            response = self.client.get(self.BASE_URL, HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se o detalhe do usuário responde 304 sem consultar o banco"
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code, msg)
+
+    def test_cached_validators_still_check_permissions(self):
+        self.authenticate(self.user_token)
+        etag = self.client.get(self.BASE_URL)["ETag"]
+
+        self.authenticate(self.other_token)
+        response = self.client.get(self.BASE_URL, HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se outro usuário continua recebendo 403 com um ETag válido"
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code, msg)
+
+    def test_updates_bump_the_version_and_the_etag(self):
+        self.authenticate(self.user_token)
+        etag = self.client.get(self.BASE_URL)["ETag"]
+
+        self.client.patch(self.BASE_URL, {"first_name": "Outro"}, format="json")
+        response = self.client.get(self.BASE_URL, HTTP_IF_NONE_MATCH=etag)
+
+        msg = "Verifique se a atualização gera uma nova versão e um novo ETag"
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+        self.assertNotEqual(etag, response["ETag"], msg)
+        self.assertEqual(2, User.objects.get(id=self.user.id).version, msg)
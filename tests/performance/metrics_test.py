@@ -0,0 +1,111 @@
+import re
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+)
+
+SERVER_TIMING = re.compile(
+    r'^sql;dur=[\d.]+;desc="(?P<queries>\d+) queries", serializer;dur=(?P<serializer>[\d.]+), '
+    r"view;dur=[\d.]+, total;dur=[\d.]+$"
+)
+
+
+@override_settings(METRICS_TOKEN="s3cret")
+class MetricsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 3)
+        cls.BASE_URL = "/api/movies/"
+        cls.METRICS_URL = "/api/metrics/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def get_metrics(self, token="s3cret"):
+        return self.client.get(self.METRICS_URL, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_responses_carry_server_timing(self):
+        response = self.client.get(self.BASE_URL)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        match = SERVER_TIMING.match(response["Server-Timing"])
+        msg = "Verifique se o header Server-Timing traz sql, serializer, view e total"
+        self.assertIsNotNone(match, msg)
+        msg = "Verifique se o Server-Timing conta as queries da listagem"
+        self.assertEqual("2", match["queries"], msg)
+        msg = "Verifique se o tempo dos serializers é medido"
+        self.assertGreater(float(match["serializer"]), 0, msg)
+
+    def test_metrics_endpoint_exposes_histograms_per_route(self):
+        self.client.get(self.BASE_URL)
+        self.client.get(f"{self.BASE_URL}{self.movies[0].id}/")
+        self.client.get(f"{self.BASE_URL}{self.movies[1].id}/")
+
+        response = self.get_metrics()
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("text/plain; version=0.0.4", response["Content-Type"])
+        body = response.content.decode()
+        expected_lines = [
+            "# TYPE kenziebuster_request_duration_seconds histogram",
+            'kenziebuster_request_duration_seconds_count{route="api/movies/",method="GET"} 1',
+            'kenziebuster_request_duration_seconds_count{route="api/movies/<int:movie_id>/",method="GET"} 2',
+            'kenziebuster_sql_queries_bucket{route="api/movies/",method="GET",le="2"} 1',
+            'kenziebuster_sql_queries_bucket{route="api/movies/",method="GET",le="1"} 0',
+            'kenziebuster_sql_queries_bucket{route="api/movies/<int:movie_id>/",method="GET",le="1"} 2',
+            "# TYPE kenziebuster_catalog_cache_requests_total counter",
+            "# TYPE kenziebuster_jwt_user_cache_entries gauge",
+        ]
+        for line in expected_lines:
+            msg = f"Verifique se a linha `{line}` está nas métricas"
+            self.assertIn(line + "\n", body, msg)
+
+    def test_unmatched_requests_share_one_route_label(self):
+        self.client.get("/api/does-not-exist/")
+        self.client.get("/api/nor-does-this/")
+
+        body = self.get_metrics().content.decode()
+
+        line = 'kenziebuster_request_duration_seconds_count{route="<unmatched>",method="GET"} 2'
+        msg = "Verifique se URLs sem rota não criam uma série por caminho"
+        self.assertIn(line, body, msg)
+
+    def test_unknown_methods_share_one_method_label(self):
+        for method in ("BREW", "PROPFIND", "X-RANDOM-1", "X-RANDOM-2"):
+            self.client.generic(method, self.BASE_URL)
+
+        body = self.get_metrics().content.decode()
+        series = re.findall(
+            r"^kenziebuster_request_duration_seconds_count\{(.*)\} ", body, re.M
+        )
+
+        msg = "Verifique se métodos HTTP desconhecidos não criam uma série por método"
+        self.assertListEqual(['route="api/movies/",method="OTHER"'], series, msg)
+
+    def test_metrics_endpoint_requires_the_token(self):
+        msg = "Verifique se as métricas exigem o token do coletor"
+        self.assertEqual(
+            status.HTTP_401_UNAUTHORIZED,
+            self.client.get(self.METRICS_URL).status_code,
+            msg,
+        )
+        self.assertEqual(
+            status.HTTP_401_UNAUTHORIZED, self.get_metrics("errado").status_code, msg
+        )
+
+        with override_settings(METRICS_TOKEN=None):
+            msg = "Verifique se as métricas ficam desligadas sem METRICS_TOKEN"
+            self.assertEqual(
+                status.HTTP_404_NOT_FOUND, self.get_metrics().status_code, msg
+            )
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled_metrics_skip_the_middleware(self):
+        response = self.client.get(self.BASE_URL)
+
+        msg = "Verifique se o Server-Timing some com METRICS_ENABLED desligado"
+        self.assertNotIn("Server-Timing", response, msg)
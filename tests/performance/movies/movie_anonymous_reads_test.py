@@ -0,0 +1,80 @@
+from unittest import mock
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+)
+from users.authentication import CachedJWTAuthentication
+
+
+class MovieAnonymousReadsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 3)
+        cls.BASE_URL = "/api/movies/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def setUp(self):
+        patcher = mock.patch.object(
+            CachedJWTAuthentication,
+            "get_validated_token",
+            autospec=True,
+            side_effect=CachedJWTAuthentication.get_validated_token,
+        )
+        self.get_validated_token = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def authenticate(self, token: str):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+    def test_reads_with_a_token_skip_authentication(self):
+        self.authenticate(str(self.employee_token.access_token))
+        urls = [self.BASE_URL, f"{self.BASE_URL}{self.movies[0].id}/"]
+
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+
+                self.assertEqual(status.HTTP_200_OK, response.status_code)
+                msg = "Verifique se GETs no catálogo não decodificam o token"
+                self.assertFalse(self.get_validated_token.called, msg)
+
+    def test_detail_read_runs_only_the_movie_query(self):
+        self.authenticate(str(self.employee_token.access_token))
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f"{self.BASE_URL}{self.movies[0].id}/")
+
+        msg = "Verifique se o detalhe não busca o usuário do token"
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+
+    def test_reads_with_an_invalid_token_are_anonymous(self):
+        self.authenticate("invalid")
+
+        response = self.client.get(self.BASE_URL)
+
+        msg = "Verifique se um token inválido não bloqueia a leitura do catálogo"
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+
+    def test_writes_still_authenticate(self):
+        self.authenticate("invalid")
+
+        response = self.client.post(self.BASE_URL, {"title": "Novo"}, format="json")
+
+        msg = "Verifique se escritas continuam exigindo um token válido"
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code, msg)
+
+        self.authenticate(str(self.employee_token.access_token))
+        response = self.client.post(self.BASE_URL, {"title": "Novo"}, format="json")
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code, msg)
+        self.get_validated_token.assert_called()
+
+
+@override_settings(ROOT_URLCONF="tests.performance.movies.movie_async_views_test")
+class AsyncMovieAnonymousReadsTest(MovieAnonymousReadsTest):
+    pass
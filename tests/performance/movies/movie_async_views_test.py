@@ -0,0 +1,158 @@
+import asyncio
+
+from django.test import override_settings
+from django.urls import path
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from _kenziebuster.query_budget import count_queries
+from movies.async_views import AsyncMovieDetailView, AsyncMovieOrderView, AsyncMovieView
+from movies.models import Movie, MovieOrderCounter
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+    create_non_employee_with_token,
+)
+from tests.query_budget import QueryBudgetTestMixin
+
+# Same routes as movies.urls with ASYNC_VIEWS on.
+urlpatterns = [
+    path("api/movies/", AsyncMovieView.as_view()),
+    path("api/movies/<int:movie_id>/", AsyncMovieDetailView.as_view()),
+    path("api/movies/<int:movie_id>/orders/", AsyncMovieOrderView.as_view()),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncMovieViewsTest(QueryBudgetTestMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.non_employee, cls.non_employee_token = create_non_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 5)
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def authenticate(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+
+    def test_views_run_natively_on_the_event_loop(self):
+        for view_class in (AsyncMovieView, AsyncMovieDetailView, AsyncMovieOrderView):
+            with self.subTest(view=view_class.__name__):
+                self.assertTrue(asyncio.iscoroutinefunction(view_class.as_view()))
+
+    def test_list_movies(self):
+        response = self.assertWithinQueryBudget(
+            AsyncMovieView.get, lambda: self.client.get(self.BASE_URL + "?page=2")
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("MISS", response["X-Cache"])
+        expected = {
+            "count": 5,
+            "next": "http://testserver/api/movies/?page=3",
+            "previous": "http://testserver/api/movies/",
+        }
+        for key, value in expected.items():
+            self.assertEqual(value, response.json()[key])
+        self.assertListEqual(
+            [movie.id for movie in self.movies[2:4]],
+            [movie["id"] for movie in response.json()["results"]],
+        )
+
+        response = self.client.get(self.BASE_URL + "?page=2")
+        self.assertEqual("HIT", response["X-Cache"])
+
+    def test_list_movies_with_cursor_and_invalid_page(self):
+        response = self.client.get(self.BASE_URL + "?pagination=cursor")
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(self.movies[0].id, response.json()["results"][0]["id"])
+
+        response = self.client.get(self.BASE_URL + "?page=9")
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    def test_create_movie(self):
+        self.authenticate(self.employee_token)
+        movie_data = {"title": "Revolver", "duration": "1h50"}
+
+        response = self.assertWithinQueryBudget(
+            AsyncMovieView.post,
+            lambda: self.client.post(self.BASE_URL, data=movie_data, format="json"),
+            extra_queries=1,
+        )
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual(self.employee.email, response.json()["added_by"])
+        movie = Movie.objects.get(id=response.json()["id"])
+        self.assertEqual(110, movie.duration_minutes)
+
+    def test_create_movie_permissions(self):
+        response = self.client.post(
+            self.BASE_URL, data={"title": "Revolver"}, format="json"
+        )
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+        self.authenticate(self.non_employee_token)
+        response = self.client.post(
+            self.BASE_URL, data={"title": "Revolver"}, format="json"
+        )
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer invalid")
+        response = self.client.post(
+            self.BASE_URL, data={"title": "Revolver"}, format="json"
+        )
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+        self.assertEqual("token_not_valid", response.json()["code"])
+
+    def test_retrieve_and_delete_movie(self):
+        url = f"{self.BASE_URL}{self.movies[0].id}/"
+        response = self.assertWithinQueryBudget(
+            AsyncMovieDetailView.get, lambda: self.client.get(url)
+        )
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(self.movies[0].title, response.json()["title"])
+
+        self.authenticate(self.employee_token)
+        response = self.assertWithinQueryBudget(
+            AsyncMovieDetailView.delete,
+            lambda: self.client.delete(url),
+            extra_queries=1,
+        )
+        self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code)
+
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+        self.assertDictEqual({"detail": "Not found."}, response.json())
+
+    def test_order_movie(self):
+        self.authenticate(self.non_employee_token)
+        url = f"{self.BASE_URL}{self.movies[0].id}/orders/"
+
+        response = self.assertWithinQueryBudget(
+            AsyncMovieOrderView.post,
+            lambda: self.client.post(url, data={"price": 10.5}, format="json"),
+            extra_queries=1,
+        )
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual(self.movies[0].title, response.json()["title"])
+        self.assertEqual(self.non_employee.email, response.json()["buyed_by"])
+        self.assertEqual(
+            1, MovieOrderCounter.objects.filter(movie=self.movies[0]).count()
+        )
+
+        response = self.client.post(
+            f"{self.BASE_URL}0/orders/", data={"price": 1}, format="json"
+        )
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    async def test_concurrent_query_counters_are_isolated(self):
+        async def run(queries):
+            async with count_queries() as counter:
+                for _ in range(queries):
+                    await Movie.objects.acount()
+                    await asyncio.sleep(0)
+            return len(counter)
+
+        self.assertListEqual([1, 3], await asyncio.gather(run(1), run(3)))
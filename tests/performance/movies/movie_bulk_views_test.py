@@ -0,0 +1,93 @@
+import json
+
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.models import Movie
+from tests.factories import create_employee_with_token, create_non_employee_with_token
+from _kenziebuster.query_budget import count_queries
+
+
+class MovieBulkViewsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/bulk/"
+        cls.employee, cls.employee_token = create_employee_with_token()
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def setUp(self) -> None:
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+    def test_bulk_creation_from_json_array_in_batches(self):
+        movies_data = [
+            {"title": f"Movie {index}", "duration": "90min"} for index in range(10)
+        ]
+
+        with count_queries() as counter:
+            response = self.client.post(
+                self.BASE_URL + "?batch_size=4", data=movies_data, format="json"
+            )
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertDictEqual({"created": 10, "errors": []}, response.json())
+        self.assertEqual(10, Movie.objects.filter(user=self.employee).count())
+
+        inserts = [sql for sql in counter.queries if sql.startswith("INSERT")]
+        msg = "Verifique se os filmes são inseridos em lotes de `batch_size`"
+        self.assertEqual(3, len(inserts), msg)
+
+    def test_bulk_creation_keeps_valid_rows(self):
+        movies_data = [
+            {"title": "Frozen"},
+            {"rating": "AAAAA"},
+            {"title": "Revolver", "rating": "R"},
+        ]
+        response = self.client.post(self.BASE_URL, data=movies_data, format="json")
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        resulted_data = response.json()
+        self.assertEqual(2, resulted_data["created"])
+        self.assertEqual(1, len(resulted_data["errors"]))
+        self.assertEqual(1, resulted_data["errors"][0]["index"])
+        self.assertSetEqual(
+            {"title", "rating"}, set(resulted_data["errors"][0]["errors"])
+        )
+        self.assertSetEqual(
+            {"Frozen", "Revolver"}, set(Movie.objects.values_list("title", flat=True))
+        )
+
+    def test_bulk_creation_from_ndjson(self):
+        body = "\n".join(
+            [
+                json.dumps({"title": "Frozen"}),
+                "{not json",
+                "",
+                json.dumps({"title": "Up"}),
+            ]
+        )
+        response = self.client.post(
+            self.BASE_URL, data=body, content_type="application/x-ndjson"
+        )
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        resulted_data = response.json()
+        self.assertEqual(2, resulted_data["created"])
+        self.assertEqual([1], [error["index"] for error in resulted_data["errors"]])
+
+    def test_bulk_creation_without_list(self):
+        response = self.client.post(
+            self.BASE_URL, data={"title": "Frozen"}, format="json"
+        )
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertFalse(Movie.objects.exists())
+
+    def test_bulk_creation_with_non_employee_token(self):
+        _, token = create_non_employee_with_token()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+        response = self.client.post(
+            self.BASE_URL, data=[{"title": "Frozen"}], format="json"
+        )
+
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
@@ -0,0 +1,90 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.models import Movie
+from movies.views import MovieView
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+)
+from tests.query_budget import QueryBudgetTestMixin
+
+
+class MovieCursorPaginationTest(QueryBudgetTestMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/?pagination=cursor"
+        employee, _ = create_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(employee, 7)
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def walk(self, url: str) -> list[dict]:
+        results = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            data = response.json()
+            msg = "Verifique se a paginação por cursor não retorna `count`"
+            self.assertSetEqual({"next", "previous", "results"}, set(data.keys()), msg)
+            results.extend(data["results"])
+            url = data["next"]
+        return results
+
+    def test_cursor_pagination_walks_whole_catalog_by_id(self):
+        results = self.walk(self.BASE_URL)
+
+        expected_ids = [movie.id for movie in self.movies]
+        self.assertListEqual(expected_ids, [movie["id"] for movie in results])
+
+    def test_cursor_pagination_by_title(self):
+        results = self.walk(self.BASE_URL + "&ordering=title")
+
+        expected_titles = sorted(movie.title for movie in self.movies)
+        self.assertListEqual(expected_titles, [movie["title"] for movie in results])
+
+    def test_cursor_pagination_by_duplicate_titles(self):
+        Movie.objects.exclude(pk=self.movies[0].pk).update(title="Movie Z")
+        Movie.objects.filter(pk=self.movies[3].pk).update(title="Movie 3")
+
+        with CaptureQueriesContext(connection) as queries:
+            results = self.walk(self.BASE_URL + "&ordering=title")
+
+        expected = list(
+            Movie.objects.order_by("title", "id").values_list("title", "id")
+        )
+        msg = "Verifique se títulos repetidos são paginados por `(title, id)` sem pular filmes"
+        self.assertListEqual(
+            expected, [(movie["title"], movie["id"]) for movie in results], msg
+        )
+        msg = "Verifique se a paginação por cursor não usa OFFSET"
+        self.assertFalse(
+            [query["sql"] for query in queries if "OFFSET" in query["sql"]], msg
+        )
+
+        url = self.client.get(self.BASE_URL + "&ordering=title").json()["next"]
+        url = self.client.get(self.client.get(url).json()["next"]).json()["previous"]
+        previous = self.client.get(url).json()
+        msg = "Verifique se o link `previous` volta para a página anterior entre títulos repetidos"
+        self.assertListEqual(
+            expected[2:4],
+            [(movie["title"], movie["id"]) for movie in previous["results"]],
+            msg,
+        )
+
+    def test_cursor_from_another_ordering(self):
+        next_url = self.client.get(self.BASE_URL).json()["next"]
+
+        response = self.client.get(next_url + "&ordering=title")
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    def test_cursor_pagination_skips_count(self):
+        response = self.assertWithinQueryBudget(
+            MovieView.get, lambda: self.client.get(self.BASE_URL)
+        )
+        self.assertNotIn("count", response.json())
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/api/movies/?cursor=invalid")
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
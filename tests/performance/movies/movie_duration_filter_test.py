@@ -0,0 +1,95 @@
+from importlib import import_module
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.db import connection
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.models import Movie
+from tests.factories import create_employee_with_token
+
+backfill = import_module("movies.migrations.0006_backfill_movie_duration_minutes")
+
+
+class MovieDurationFilterTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        cls.employee, cls.employee_token = create_employee_with_token()
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def create_movies(self, durations):
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        movies_data = [
+            {"title": f"Movie {duration}", "duration": duration}
+            for duration in durations
+        ]
+        self.client.post(self.BASE_URL + "bulk/", data=movies_data, format="json")
+        self.client.credentials()
+
+    def test_creation_stores_parsed_duration(self):
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        response = self.client.post(
+            self.BASE_URL,
+            data={"title": "Frozen", "duration": "1h42min"},
+            format="json",
+        )
+
+        self.assertNotIn("duration_minutes", response.json())
+        self.assertEqual(
+            102, Movie.objects.get(id=response.json()["id"]).duration_minutes
+        )
+
+    def test_duration_range_filters(self):
+        self.create_movies(["90min", "110min", "2h", "150min", "longo"])
+
+        response = self.client.get(
+            self.BASE_URL, {"max_duration": 120, "min_duration": 100}
+        )
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(2, response.json()["count"])
+
+        response = self.client.get(self.BASE_URL, {"min_duration": 120})
+        self.assertEqual(2, response.json()["count"])
+
+    def test_filtered_pages_are_ordered_by_id(self):
+        self.create_movies(["150min", "90min", "2h", "110min"])
+
+        response = self.client.get(self.BASE_URL, {"min_duration": 100})
+        msg = "Verifique se a listagem filtrada mantém a ordem por id"
+        self.assertListEqual(
+            ["Movie 150min", "Movie 2h"],
+            [movie["title"] for movie in response.json()["results"]],
+            msg,
+        )
+        response = self.client.get(self.BASE_URL, {"min_duration": 100, "page": 2})
+        self.assertListEqual(
+            ["Movie 110min"],
+            [movie["title"] for movie in response.json()["results"]],
+            msg,
+        )
+
+    def test_invalid_duration_filter(self):
+        response = self.client.get(self.BASE_URL, {"min_duration": "abc"})
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertIn("min_duration", response.json())
+
+    def test_backfill_migration_resumes_pending_rows(self):
+        Movie.objects.bulk_create(
+            Movie(title=f"Movie {index}", duration=f"{index}min", user=self.employee)
+            for index in range(1, 6)
+        )
+        Movie.objects.filter(title="Movie 1").update(duration_minutes=999)
+
+        backfill.backfill_duration_minutes(apps, SimpleNamespace(connection=connection))
+
+        self.assertListEqual(
+            [999, 2, 3, 4, 5],
+            list(
+                Movie.objects.order_by("id").values_list("duration_minutes", flat=True)
+            ),
+        )
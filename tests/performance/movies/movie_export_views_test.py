@@ -0,0 +1,54 @@
+import csv
+import io
+import json
+
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+)
+from _kenziebuster.query_budget import count_queries
+
+
+class MovieExportViewsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/export/"
+        cls.employee, _ = create_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 5)
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def test_ndjson_export_matches_movie_listing_fields(self):
+        with count_queries() as counter:
+            response = self.client.get(self.BASE_URL)
+            content = b"".join(response.streaming_content).decode()
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("application/x-ndjson", response["Content-Type"])
+
+        rows = [json.loads(line) for line in content.splitlines()]
+        listed = self.client.get(f"/api/movies/{self.movies[0].id}/").json()
+        self.assertEqual(5, len(rows))
+        self.assertDictEqual(listed, rows[0])
+
+        msg = (
+            "Verifique se o export busca `added_by` com um join, sem queries por linha"
+        )
+        self.assertEqual(1, len(counter), msg)
+
+    def test_csv_export(self):
+        response = self.client.get(self.BASE_URL + "?output=csv")
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertEqual("text/csv", response["Content-Type"])
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(5, len(rows))
+        self.assertEqual(self.employee.email, rows[-1]["added_by"])
+        self.assertEqual(str(self.movies[-1].id), rows[-1]["id"])
+
+    def test_export_with_unknown_output(self):
+        response = self.client.get(self.BASE_URL + "?output=xml")
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
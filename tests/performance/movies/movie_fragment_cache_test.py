@@ -0,0 +1,151 @@
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.fragments import FragmentCache, movie_fragments
+from movies.models import Movie
+from movies.serializers import MovieSerializer
+from tests.factories import (
+    create_employee_with_token,
+    create_movie_with_employee,
+    create_multiple_movies_with_employee,
+)
+
+
+class MovieFragmentCacheTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 3)
+        create_movie_with_employee(
+            {
+                "title": "Ação “especial”",
+                "duration": None,
+                "rating": None,
+                "synopsis": "ñ ",
+            },
+            cls.employee,
+        )
+        cls.BASE_URL = "/api/movies/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def authenticate(self):
+        self.client.credentials(
+            HTTP_AUTHORIZATION="Bearer " + str(self.employee_token.access_token)
+        )
+
+    def test_spliced_pages_match_the_serializer_output(self):
+        instances = Movie.objects.select_related("user").order_by("id")
+        pages = [
+            (
+                self.BASE_URL,
+                {
+                    "count": 4,
+                    "next": "http://testserver/api/movies/?page=2",
+                    "previous": None,
+                },
+            ),
+            (
+                self.BASE_URL + "?page=2",
+                {"count": 4, "next": None, "previous": "http://testserver/api/movies/"},
+            ),
+        ]
+
+        for (url, envelope), page in zip(pages, (instances[:2], instances[2:])):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+
+                data = {**envelope, "results": MovieSerializer(page, many=True).data}
+                msg = "Verifique se a página montada com fragmentos é idêntica à do serializer"
+                self.assertEqual(JSONRenderer().render(data), response.content, msg)
+                self.assertEqual("application/json", response["Content-Type"], msg)
+
+    def test_rows_are_rendered_once(self):
+        self.client.get(self.BASE_URL)
+        cache.clear()
+
+        before = movie_fragments.stats()
+        response = self.client.get(self.BASE_URL)
+        after = movie_fragments.stats()
+
+        self.assertEqual("MISS", response["X-Cache"])
+        msg = "Verifique se uma página fora do cache reaproveita os fragmentos já renderizados"
+        self.assertEqual(before["hits"] + 2, after["hits"], msg)
+        self.assertEqual(before["misses"], after["misses"], msg)
+
+    def test_owner_changes_rerender_the_fragment(self):
+        self.client.get(self.BASE_URL)
+        self.authenticate()
+
+        self.client.patch(
+            f"/api/users/{self.employee.id}/", {"email": "novo@mail.com"}, format="json"
+        )
+        response = self.client.get(self.BASE_URL)
+
+        msg = "Verifique se o fragmento é renderizado de novo quando o added_by muda"
+        self.assertEqual(
+            ["novo@mail.com"] * 2,
+            [movie["added_by"] for movie in response.json()["results"]],
+            msg,
+        )
+
+    def test_deleted_movies_leave_the_cache(self):
+        self.client.get(self.BASE_URL)
+        entries = movie_fragments.stats()["entries"]
+        self.authenticate()
+
+        self.client.delete(f"{self.BASE_URL}{self.movies[0].id}/")
+
+        msg = "Verifique se remover um filme descarta o fragmento dele"
+        self.assertEqual(entries - 1, movie_fragments.stats()["entries"], msg)
+
+    def test_browsable_api_still_renders(self):
+        response = self.client.get(self.BASE_URL, HTTP_ACCEPT="text/html")
+
+        msg = "Verifique se clientes que pedem HTML continuam recebendo a API navegável"
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+        self.assertIn("text/html", response["Content-Type"], msg)
+
+    @override_settings(METRICS_TOKEN="s3cret")
+    def test_metrics_report_the_cache_size(self):
+        self.client.get(self.BASE_URL)
+
+        body = self.client.get(
+            "/api/metrics/", HTTP_AUTHORIZATION="Bearer s3cret"
+        ).content.decode()
+
+        line = f"kenziebuster_movie_fragment_cache_bytes {movie_fragments.stats()['bytes']}\n"
+        msg = "Verifique se o tamanho do cache de fragmentos aparece nas métricas"
+        self.assertIn(line, body, msg)
+
+
+class FragmentCacheTest(APITestCase):
+    def test_size_is_bounded_by_lru_eviction(self):
+        fragments = FragmentCache(maxbytes=10)
+
+        fragments.set(1, (1, 1), b"aaaa")
+        fragments.set(2, (1, 1), b"bbbb")
+        fragments.get_many({1: (1, 1)})
+        fragments.set(3, (1, 1), b"cccc")
+
+        msg = "Verifique se o fragmento usado há mais tempo é descartado ao passar do limite"
+        self.assertEqual(
+            {1: b"aaaa", 3: b"cccc"},
+            fragments.get_many({1: (1, 1), 2: (1, 1), 3: (1, 1)}),
+            msg,
+        )
+        self.assertEqual(8, fragments.stats()["bytes"], msg)
+        self.assertEqual(1, fragments.stats()["evictions"], msg)
+
+    def test_stale_stamps_miss(self):
+        fragments = FragmentCache(maxbytes=100)
+        fragments.set(1, (1, 1), b"old")
+
+        msg = "Verifique se um fragmento de outra versão não é usado"
+        self.assertEqual({}, fragments.get_many({1: (2, 1)}), msg)
+
+        fragments.set(1, (2, 1), b"newer")
+        msg = "Verifique se substituir um fragmento atualiza o tamanho do cache"
+        self.assertEqual(5, fragments.stats()["bytes"], msg)
@@ -0,0 +1,167 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from _kenziebuster.query_budget import QueryBudgetExceeded
+from movies.models import IdempotencyKey, Movie, MovieOrder, MovieOrderCounter
+from movies.serializers import MovieOrderSerializer
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+    create_non_employee_with_token,
+)
+
+
+class MovieOrderIdempotencyTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.non_employee, cls.non_employee_token = create_non_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 2)
+        cls.BASE_URL = f"/api/movies/{cls.movies[0].id}/orders/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def order(self, key=None, price="10.50", url=None, token=None):
+        token = token or self.non_employee_token
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+        headers = {} if key is None else {"HTTP_IDEMPOTENCY_KEY": key}
+        return self.client.post(
+            url or self.BASE_URL, {"price": price}, format="json", **headers
+        )
+
+    def test_retries_replay_the_first_response(self):
+        first = self.order("retry-1")
+
+        with self.assertNumQueries(2):
+            retry = self.order("retry-1")
+
+        msg = "Verifique se a repetição devolve a resposta original sem criar outro pedido"
+        self.assertEqual(status.HTTP_201_CREATED, retry.status_code, msg)
+        self.assertEqual(first.json(), retry.json(), msg)
+        self.assertEqual("true", retry["Idempotent-Replayed"], msg)
+        self.assertEqual(1, MovieOrder.objects.count(), msg)
+        self.assertEqual(1, MovieOrderCounter.objects.get().orders_count, msg)
+
+    def test_orders_without_a_key_are_not_deduplicated(self):
+        self.order()
+        self.order()
+
+        msg = "Verifique se pedidos sem Idempotency-Key continuam independentes"
+        self.assertEqual(2, MovieOrder.objects.count(), msg)
+        self.assertFalse(IdempotencyKey.objects.exists(), msg)
+
+    def test_keys_are_scoped_per_user(self):
+        self.order("shared")
+        response = self.order("shared", token=self.employee_token)
+
+        msg = "Verifique se a mesma chave de outro usuário cria um novo pedido"
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code, msg)
+        self.assertEqual(self.employee.email, response.json()["buyed_by"], msg)
+        self.assertEqual(2, MovieOrder.objects.count(), msg)
+
+    def test_reusing_a_key_for_another_request_is_rejected(self):
+        self.order("reused")
+        other_movie_url = f"/api/movies/{self.movies[1].id}/orders/"
+
+        for kwargs in ({"price": "99.00"}, {"url": other_movie_url}):
+            with self.subTest(**kwargs):
+                response = self.order("reused", **kwargs)
+
+                msg = "Verifique se reaproveitar a chave com outro corpo ou filme retorna 422"
+                self.assertEqual(
+                    status.HTTP_422_UNPROCESSABLE_ENTITY, response.status_code, msg
+                )
+                self.assertEqual(1, MovieOrder.objects.count(), msg)
+
+    def test_failed_requests_release_the_key(self):
+        response = self.order("invalid", price="abc")
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+        with mock.patch.object(MovieOrderSerializer, "save", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.order("crashed")
+
+        msg = "Verifique se pedidos que falham não guardam a chave"
+        self.assertFalse(IdempotencyKey.objects.exists(), msg)
+        self.assertEqual(
+            status.HTTP_201_CREATED, self.order("crashed").status_code, msg
+        )
+
+    def test_invalid_keys(self):
+        for key in ("", "k" * 256):
+            with self.subTest(length=len(key)):
+                response = self.order(key)
+
+                msg = "Verifique se chaves vazias ou longas demais retornam 400"
+                self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, msg)
+                self.assertIn("Idempotency-Key", response.json(), msg)
+
+    def test_only_keyed_orders_get_the_key_budget(self):
+        def record(order):
+            # One more query than the order budget, within the key allowance.
+            for _ in range(3):
+                Movie.objects.exists()
+
+        with mock.patch.object(MovieOrderCounter, "record", side_effect=record):
+            msg = (
+                "Verifique se pedidos sem Idempotency-Key mantêm o orçamento de queries"
+            )
+            with self.assertRaises(QueryBudgetExceeded, msg=msg):
+                self.order()
+
+            response = self.order("budget")
+            self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+    @override_settings(IDEMPOTENCY_KEY_TTL=60)
+    def test_expired_keys_start_over(self):
+        self.order("expired")
+        IdempotencyKey.objects.update(created_at=timezone.now() - timedelta(minutes=2))
+
+        response = self.order("expired", price="20.00")
+
+        msg = "Verifique se uma chave expirada pode ser usada de novo"
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code, msg)
+        self.assertEqual("20.00", response.json()["price"], msg)
+        self.assertEqual(1, IdempotencyKey.objects.count(), msg)
+
+    def test_concurrent_duplicates_insert_one_order(self):
+        original = self.order("raced")
+        # The duplicate read no key yet, then lost the claim to the original.
+        with mock.patch.object(QuerySet, "first", return_value=None):
+            duplicate = self.order("raced")
+
+        msg = "Verifique se uma duplicata concorrente devolve a resposta do pedido original"
+        self.assertEqual(original.json(), duplicate.json(), msg)
+        self.assertEqual(1, MovieOrder.objects.count(), msg)
+
+    @override_settings(IDEMPOTENCY_KEY_TTL=60)
+    def test_purge_deletes_expired_keys_in_batches(self):
+        for index in range(5):
+            self.order(f"purge-{index}")
+        IdempotencyKey.objects.filter(key__in=["purge-0", "purge-1", "purge-2"]).update(
+            created_at=timezone.now() - timedelta(minutes=2)
+        )
+        out = StringIO()
+
+        with self.assertNumQueries(5):
+            call_command("purge_idempotency_keys", "--batch-size", "2", stdout=out)
+
+        msg = "Verifique se o comando apaga só as chaves expiradas"
+        self.assertIn("Purged 3 expired idempotency keys.", out.getvalue(), msg)
+        self.assertEqual(
+            ["purge-3", "purge-4"],
+            sorted(IdempotencyKey.objects.values_list("key", flat=True)),
+            msg,
+        )
+
+
+@override_settings(ROOT_URLCONF="tests.performance.movies.movie_async_views_test")
+class AsyncMovieOrderIdempotencyTest(MovieOrderIdempotencyTest):
+    pass
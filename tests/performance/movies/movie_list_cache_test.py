@@ -0,0 +1,62 @@
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.cache import cache_stats
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+)
+
+
+class MovieListCacheTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 3)
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def test_second_listing_is_served_from_cache(self):
+        stats_before = cache_stats()
+        first = self.client.get(self.BASE_URL)
+        second = self.client.get(self.BASE_URL)
+
+        self.assertEqual("MISS", first["X-Cache"])
+        self.assertEqual("HIT", second["X-Cache"])
+        self.assertEqual(first.json(), second.json())
+
+        stats_after = cache_stats()
+        self.assertEqual(stats_before["hits"] + 1, stats_after["hits"])
+        self.assertEqual(stats_before["misses"] + 1, stats_after["misses"])
+
+    def test_query_params_are_part_of_the_key(self):
+        self.client.get(self.BASE_URL)
+        response = self.client.get(self.BASE_URL + "?page=2")
+
+        self.assertEqual("MISS", response["X-Cache"])
+        self.assertEqual(self.movies[2].id, response.json()["results"][0]["id"])
+
+    def test_movie_creation_invalidates_cached_pages(self):
+        self.client.get(self.BASE_URL + "?page=2")
+
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        response = self.client.post(
+            self.BASE_URL, data={"title": "Frozen"}, format="json"
+        )
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        response = self.client.get(self.BASE_URL + "?page=2")
+        self.assertEqual("MISS", response["X-Cache"])
+        self.assertEqual(4, response.json()["count"])
+
+    def test_movie_deletion_invalidates_cached_pages(self):
+        self.client.get(self.BASE_URL)
+
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        self.client.delete(f"{self.BASE_URL}{self.movies[0].id}/")
+
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual("MISS", response["X-Cache"])
+        self.assertEqual(2, response.json()["count"])
@@ -0,0 +1,82 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.models import MovieOrder, MovieOrderCounter
+from tests.factories import (
+    create_employee_with_token,
+    create_movie_with_employee,
+    create_non_employee_with_token,
+)
+
+
+class MovieOrderCounterTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.non_employee, cls.non_employee_token = create_non_employee_with_token()
+        cls.movie = create_movie_with_employee(employee=cls.employee)
+        cls.STATS_URL = f"/api/movies/{cls.movie.id}/stats/"
+        cls.ORDERS_URL = f"/api/movies/{cls.movie.id}/orders/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def place_orders(self, prices):
+        token = str(self.non_employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        for price in prices:
+            response = self.client.post(
+                self.ORDERS_URL, data={"price": price}, format="json"
+            )
+            self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+    def get_stats(self, url=None):
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        return self.client.get(url or self.STATS_URL)
+
+    @override_settings(MOVIE_ORDER_COUNTER_SHARDS=4)
+    def test_orders_are_counted_across_shards(self):
+        self.place_orders(["10.50"] * 20)
+
+        response = self.get_stats()
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertDictEqual(
+            {"movie_id": self.movie.id, "orders_count": 20, "revenue": "210.00"},
+            response.json(),
+        )
+        self.assertLessEqual(MovieOrderCounter.objects.count(), 4)
+
+    def test_stats_for_movie_without_orders(self):
+        response = self.get_stats()
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(0, response.json()["orders_count"])
+        self.assertEqual("0.00", response.json()["revenue"])
+
+    def test_stats_for_missing_movie(self):
+        response = self.get_stats("/api/movies/999/stats/")
+
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    def test_stats_are_employee_only(self):
+        token = str(self.non_employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+        response = self.client.get(self.STATS_URL)
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+    def test_reconcile_command_recomputes_from_orders(self):
+        self.place_orders(["10.00", "20.00"])
+        MovieOrder.objects.create(
+            movie=self.movie, user=self.non_employee, price="5.00"
+        )
+        MovieOrderCounter.objects.update(orders_count=999)
+
+        call_command("reconcile_order_counters", stdout=StringIO())
+
+        response = self.get_stats()
+        self.assertEqual(3, response.json()["orders_count"])
+        self.assertEqual("35.00", response.json()["revenue"])
@@ -0,0 +1,60 @@
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.views import MovieDetailView, MovieOrderView, MovieView
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+    create_non_employee_with_token,
+)
+from tests.query_budget import QueryBudgetTestMixin
+
+
+class MovieQueryBudgetTest(QueryBudgetTestMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 20)
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def test_movies_listing_query_count_does_not_grow_with_catalog(self):
+        response = self.assertWithinQueryBudget(
+            MovieView.get, lambda: self.client.get(self.BASE_URL)
+        )
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        for movie in response.json()["results"]:
+            self.assertEqual(self.employee.email, movie["added_by"])
+
+    def test_movie_detail_query_count(self):
+        url = f"{self.BASE_URL}{self.movies[0].id}/"
+        response = self.assertWithinQueryBudget(
+            MovieDetailView.get, lambda: self.client.get(url)
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(self.employee.email, response.json()["added_by"])
+
+    def test_movie_deletion_query_count(self):
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        url = f"{self.BASE_URL}{self.movies[0].id}/"
+        response = self.assertWithinQueryBudget(
+            MovieDetailView.delete, lambda: self.client.delete(url), extra_queries=1
+        )
+
+        self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code)
+
+    def test_movie_order_query_count(self):
+        _, token = create_non_employee_with_token()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+        url = f"{self.BASE_URL}{self.movies[0].id}/orders/"
+        response = self.assertWithinQueryBudget(
+            MovieOrderView.post,
+            lambda: self.client.post(url, data={"price": 10.5}, format="json"),
+            extra_queries=1,
+        )
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual(self.movies[0].title, response.json()["title"])
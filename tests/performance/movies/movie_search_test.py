@@ -0,0 +1,103 @@
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.models import Movie
+from movies.search import search_movies
+from tests.factories import create_employee_with_token, create_movie_with_employee
+
+
+class MovieSearchTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/movies/"
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.frozen = create_movie_with_employee(
+            {
+                "title": "Frozen",
+                "synopsis": "A princess and her sister in a frozen kingdom.",
+            },
+            cls.employee,
+        )
+        cls.revolver = create_movie_with_employee(
+            {
+                "title": "Revolver",
+                "synopsis": "A gambler takes on a frozen crime lord.",
+            },
+            cls.employee,
+        )
+        create_movie_with_employee(
+            {"title": "Up", "synopsis": "Balloons."}, cls.employee
+        )
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def search(self, text: str) -> dict:
+        response = self.client.get(self.BASE_URL, {"q": text})
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        return response.json()
+
+    def test_search_ranks_title_matches_first(self):
+        resulted_data = self.search("frozen")
+
+        self.assertEqual(2, resulted_data["count"])
+        msg = "Verifique se a busca retorna os resultados ordenados por relevância"
+        self.assertListEqual(
+            [self.frozen.id, self.revolver.id],
+            [movie["id"] for movie in resulted_data["results"]],
+            msg,
+        )
+
+    def test_search_pages_tied_ranks_by_id(self):
+        sequels = [
+            create_movie_with_employee(
+                {"title": "Sequel", "synopsis": "More of the same."}, self.employee
+            )
+            for _ in range(3)
+        ]
+
+        first_page = self.search("sequel")
+        second_page = self.client.get(first_page["next"]).json()
+
+        msg = "Verifique se resultados com a mesma relevância são paginados por id"
+        self.assertListEqual(
+            [movie.id for movie in sequels],
+            [movie["id"] for movie in first_page["results"] + second_page["results"]],
+            msg,
+        )
+        self.assertEqual(
+            ("search__rank", "id"),
+            search_movies(Movie.objects.all(), "sequel").query.order_by,
+            msg,
+        )
+
+    def test_search_ignores_fts_syntax(self):
+        resulted_data = self.search('"gambler* (')
+
+        self.assertEqual(
+            [self.revolver.id], [movie["id"] for movie in resulted_data["results"]]
+        )
+        self.assertEqual(0, self.search("!!!")["count"])
+
+    def test_index_follows_creation_and_deletion(self):
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+        response = self.client.post(
+            self.BASE_URL, data={"title": "Balloon Heist"}, format="json"
+        )
+        movie_id = response.json()["id"]
+        self.assertEqual(1, self.search("heist")["count"])
+
+        self.client.delete(f"{self.BASE_URL}{movie_id}/")
+        self.assertEqual(0, self.search("heist")["count"])
+
+    def test_rebuild_command(self):
+        with connection.cursor() as cursor:
+            # What a migration that rebuilds movies_movie leaves behind.
+            cursor.execute("DROP TRIGGER movies_movie_fts_ai")
+
+        call_command("rebuild_movie_search", stdout=open("/dev/null", "w"))
+
+        Movie.objects.create(title="Frozen II", user=self.employee)
+        self.assertEqual(3, self.search("frozen")["count"])
@@ -0,0 +1,111 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.db.models import Value
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from movies.models import Movie, MovieOrder
+from movies.serializers import MovieOrderSerializer, MovieSerializer
+from tests.factories import (
+    create_employee_with_token,
+    create_movie_with_employee,
+    create_multiple_movies_with_employee,
+    create_non_employee_with_token,
+)
+
+
+class MovieValuesSerializerTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, _ = create_employee_with_token()
+        cls.non_employee, _ = create_non_employee_with_token()
+        create_multiple_movies_with_employee(cls.employee, 3)
+        create_movie_with_employee(
+            {"title": "Sem dados", "duration": None, "rating": None, "synopsis": None},
+            cls.employee,
+        )
+        create_movie_with_employee(
+            {
+                "title": "Ação & “aspas”",
+                "duration": "1h 30min",
+                "rating": "PG-13",
+                "synopsis": "ñ",
+            },
+            cls.employee,
+        )
+        for movie, price in zip(
+            Movie.objects.all(), ["0.10", "10", "999999.99", "3.5", "7.25"]
+        ):
+            MovieOrder.objects.create(
+                movie=movie, user=cls.non_employee, price=Decimal(price)
+            )
+        cls.BASE_URL = "/api/movies/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def render(self, serializer) -> bytes:
+        return JSONRenderer().render(serializer.data)
+
+    def test_movie_rows_render_like_instances(self):
+        instances = Movie.objects.select_related("user").order_by("id")
+        rows = MovieSerializer.values_rows(Movie.objects.order_by("id"))
+
+        expected = self.render(MovieSerializer(instances, many=True))
+        result = self.render(MovieSerializer(rows, many=True))
+
+        msg = "Verifique se as linhas de values() geram o mesmo JSON que as instâncias de Movie"
+        self.assertEqual(expected, result, msg)
+
+    def test_order_rows_render_like_instances(self):
+        instances = MovieOrder.objects.select_related("movie", "user").order_by("id")
+        rows = MovieOrderSerializer.values_rows(MovieOrder.objects.order_by("id"))
+
+        expected = self.render(MovieOrderSerializer(instances, many=True))
+        result = self.render(MovieOrderSerializer(rows, many=True))
+
+        msg = "Verifique se as linhas de values() geram o mesmo JSON que as instâncias de MovieOrder"
+        self.assertEqual(expected, result, msg)
+
+    def test_expressions_can_be_overridden_per_query(self):
+        rows = MovieOrderSerializer.values_rows(
+            self.non_employee.user_movie_order.order_by("id"),
+            buyed_by=Value(self.non_employee.email),
+        )
+
+        with self.assertNumQueries(1):
+            data = MovieOrderSerializer(rows, many=True).data
+
+        msg = "Verifique se buyed_by vem da expressão informada, sem join com users"
+        self.assertEqual(
+            {self.non_employee.email}, {order["buyed_by"] for order in data}, msg
+        )
+        self.assertNotIn("users_user", str(rows.query), msg)
+
+    def test_single_instances_still_use_the_regular_path(self):
+        movie = Movie.objects.select_related("user").get(title="Sem dados")
+
+        data = MovieSerializer(movie).data
+
+        msg = "Verifique se a serialização de uma instância continua funcionando"
+        self.assertEqual(self.employee.email, data["added_by"], msg)
+        self.assertIsNone(data["duration"], msg)
+
+    def test_list_pages_count_plain_movies(self):
+        Movie.objects.exclude(title="Sem dados").update(duration_minutes=110)
+
+        for url in (self.BASE_URL, self.BASE_URL + "?min_duration=0"):
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+
+                count_sql = next(q["sql"] for q in queries if "COUNT(" in q["sql"])
+                msg = "Verifique se o COUNT da paginação não faz join com users nem subquery"
+                self.assertNotIn("users_user", count_sql, msg)
+                self.assertNotIn("subquery", count_sql, msg)
+                self.assertEqual(
+                    5 if url == self.BASE_URL else 4, response.json()["count"], msg
+                )
+                self.assertEqual(
+                    self.employee.email, response.json()["results"][0]["added_by"], msg
+                )
@@ -0,0 +1,161 @@
+from datetime import datetime, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.models import MovieOrder
+from movies.rollups import refresh_sales_rollups
+from tests.factories import (
+    create_employee_with_token,
+    create_movie_with_employee,
+    create_non_employee_with_token,
+)
+
+
+class SalesReportTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/reports/sales/"
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.non_employee, cls.non_employee_token = create_non_employee_with_token()
+        cls.revolver = create_movie_with_employee(employee=cls.employee)
+        cls.frozen = create_movie_with_employee(
+            {"title": "Frozen", "rating": "G"}, cls.employee
+        )
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def setUp(self) -> None:
+        token = str(self.employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+    def order(self, movie, price, buyed_at):
+        order = MovieOrder.objects.create(
+            movie=movie, user=self.non_employee, price=price
+        )
+        MovieOrder.objects.filter(id=order.id).update(buyed_at=buyed_at)
+
+    def test_daily_report_by_movie(self):
+        self.order(
+            self.revolver, "10.00", datetime(2023, 2, 1, 10, tzinfo=timezone.utc)
+        )
+        self.order(
+            self.revolver, "15.00", datetime(2023, 2, 1, 22, tzinfo=timezone.utc)
+        )
+        self.order(self.frozen, "7.50", datetime(2023, 2, 2, 9, tzinfo=timezone.utc))
+        self.assertEqual(3, refresh_sales_rollups())
+
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertListEqual(
+            [
+                {
+                    "bucket": "2023-02-01T00:00:00Z",
+                    "movie_id": self.revolver.id,
+                    "orders_count": 2,
+                    "revenue": "25.00",
+                },
+                {
+                    "bucket": "2023-02-02T00:00:00Z",
+                    "movie_id": self.frozen.id,
+                    "orders_count": 1,
+                    "revenue": "7.50",
+                },
+            ],
+            response.json()["results"],
+        )
+
+    def test_hourly_report_by_rating_with_date_range(self):
+        self.order(
+            self.revolver, "10.00", datetime(2023, 2, 1, 10, 5, tzinfo=timezone.utc)
+        )
+        self.order(
+            self.revolver, "15.00", datetime(2023, 2, 1, 10, 55, tzinfo=timezone.utc)
+        )
+        self.order(self.frozen, "7.50", datetime(2023, 2, 1, 11, tzinfo=timezone.utc))
+        self.order(self.frozen, "7.50", datetime(2023, 2, 3, 11, tzinfo=timezone.utc))
+        refresh_sales_rollups()
+
+        response = self.client.get(
+            self.BASE_URL,
+            {
+                "granularity": "hour",
+                "group_by": "rating",
+                "start": "2023-02-01T00:00:00Z",
+                "end": "2023-02-02T00:00:00Z",
+            },
+        )
+        resulted = [
+            (row["bucket"], row["rating"], row["orders_count"])
+            for row in response.json()["results"]
+        ]
+        self.assertListEqual(
+            [("2023-02-01T10:00:00Z", "R", 2), ("2023-02-01T11:00:00Z", "G", 1)],
+            resulted,
+        )
+
+    def test_refresh_is_incremental(self):
+        self.order(
+            self.revolver, "10.00", datetime(2023, 2, 1, 10, tzinfo=timezone.utc)
+        )
+        refresh_sales_rollups()
+        self.assertEqual(0, refresh_sales_rollups())
+
+        self.order(self.revolver, "5.00", datetime(2023, 2, 1, 12, tzinfo=timezone.utc))
+        call_command("refresh_sales_rollups", "--batch-size", "1", stdout=StringIO())
+
+        results = self.client.get(self.BASE_URL).json()["results"]
+        self.assertEqual(1, len(results))
+        self.assertEqual(2, results[0]["orders_count"])
+        self.assertEqual("15.00", results[0]["revenue"])
+
+    def test_refresh_increments_unrated_buckets(self):
+        unrated = create_movie_with_employee(
+            {"title": "Unrated", "rating": None}, self.employee
+        )
+        self.order(unrated, "4.00", datetime(2023, 2, 1, 10, tzinfo=timezone.utc))
+        self.order(unrated, "6.00", datetime(2023, 2, 1, 11, tzinfo=timezone.utc))
+        refresh_sales_rollups(batch_size=1)
+
+        results = self.client.get(self.BASE_URL + "?group_by=rating").json()["results"]
+        self.assertListEqual(
+            [
+                {
+                    "bucket": "2023-02-01T00:00:00Z",
+                    "rating": None,
+                    "orders_count": 2,
+                    "revenue": "10.00",
+                }
+            ],
+            results,
+        )
+
+    def test_refresh_waits_for_orders_inside_the_lag(self):
+        self.order(
+            self.revolver, "10.00", datetime(2023, 2, 1, 10, tzinfo=timezone.utc)
+        )
+        # Just placed, a lower id may still be uncommitted on other databases.
+        MovieOrder.objects.create(
+            movie=self.revolver, user=self.non_employee, price="1.00"
+        )
+        self.order(self.frozen, "7.50", datetime(2023, 2, 1, 11, tzinfo=timezone.utc))
+
+        msg = "Verifique se o refresh para no primeiro pedido mais novo que o lag"
+        self.assertEqual(1, refresh_sales_rollups(lag=60), msg)
+        self.assertEqual(2, refresh_sales_rollups(lag=0), msg)
+
+    def test_report_is_employee_only(self):
+        token = str(self.non_employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+    def test_report_with_invalid_filters(self):
+        response = self.client.get(
+            self.BASE_URL, {"granularity": "week", "start": "ontem"}
+        )
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertSetEqual({"granularity", "start"}, set(response.json()))
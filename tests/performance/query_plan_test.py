@@ -0,0 +1,216 @@
+from contextlib import ExitStack
+
+from django.db import connection, connections
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.models import Movie
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+    create_non_employee_with_token,
+)
+
+
+class SelectRecorder:
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip().upper().startswith("SELECT"):
+            self.statements.append((sql, params))
+        return execute(sql, params, many, context)
+
+
+class QueryPlanTest(APITestCase):
+    """
+    Runs EXPLAIN QUERY PLAN on the SELECTs issued by the API endpoints.
+
+    Catalog and report reads are checked against the exact plan expected
+    for each query, index by index, so a plan that silently moves to
+    another index or adds a sort fails. Writes and user endpoints only need
+    to avoid full table scans and temp B-tree sorts. The catalog export is
+    left out on purpose: it reads the whole table by design.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.non_employee, cls.non_employee_token = create_non_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 5)
+        # bulk_create skips MovieSerializer, which fills duration_minutes.
+        Movie.objects.update(duration_minutes=110)
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def record(self, request_callable):
+        recorder = SelectRecorder()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder))
+            response = request_callable()
+
+        self.assertLess(response.status_code, 400, response.content)
+        return recorder.statements
+
+    def explain(self, statements) -> list[list[str]]:
+        plans = []
+        with connection.cursor() as cursor:
+            for sql, params in statements:
+                cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+                plans.append([row[-1] for row in cursor.fetchall()])
+        return plans
+
+    def assertPlans(self, expected, statements):
+        queries = "\n".join(sql for sql, _ in statements)
+        msg = f"Verifique os planos das queries:\n{queries}"
+        self.assertListEqual(expected, self.explain(statements), msg)
+
+    def assertIndexedPlans(self, statements):
+        for (sql, _), plan in zip(statements, self.explain(statements)):
+            msg = f"Verifique os índices para a query:\n{sql}\nplano: {plan}"
+            for step in plan:
+                self.assertFalse(step.startswith("SCAN") and "INDEX" not in step, msg)
+                self.assertNotIn("USE TEMP B-TREE", step, msg)
+
+    def authenticate(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+
+    def test_movie_endpoints_use_indexes(self):
+        movie_id = self.movies[0].id
+        self.authenticate(self.employee_token)
+        owner = "SEARCH users_user USING INTEGER PRIMARY KEY (rowid=?)"
+        by_id = "SEARCH movies_movie USING INTEGER PRIMARY KEY (rowid=?)"
+        # Counting every movie reads the narrowest index whole.
+        count_all = [
+            "SCAN movies_movie USING COVERING INDEX movies_movie_user_id_af766fba"
+        ]
+        # Pages in id order walk the table in rowid order and stop after LIMIT.
+        id_page = ["SCAN movies_movie", owner]
+        matches = "SCAN movies_movie_fts VIRTUAL TABLE INDEX 0:M2"
+        duration_range = (
+            "movie_duration_id_idx (duration_minutes>? AND duration_minutes<?)"
+        )
+
+        for url, expected in [
+            ("/api/movies/", [count_all, id_page]),
+            ("/api/movies/?page=2", [count_all, id_page]),
+            ("/api/movies/?pagination=cursor", [id_page]),
+            (
+                "/api/movies/?pagination=cursor&ordering=title",
+                [["SCAN movies_movie USING INDEX movie_title_id_idx", owner]],
+            ),
+            (
+                "/api/movies/?q=movie",
+                [
+                    [matches, by_id],
+                    # FTS5 ranks every match before ordering, sorting the
+                    # matches by (rank, id) adds no pass over the table.
+                    [matches, by_id, owner, "USE TEMP B-TREE FOR ORDER BY"],
+                ],
+            ),
+            (
+                "/api/movies/?min_duration=100&max_duration=120",
+                [
+                    [f"SEARCH movies_movie USING COVERING INDEX {duration_range}"],
+                    # The matching ids are sorted off the index alone, then
+                    # only the page's rows are read.
+                    [
+                        by_id,
+                        "LIST SUBQUERY 1",
+                        f"SEARCH U0 USING COVERING INDEX {duration_range}",
+                        "USE TEMP B-TREE FOR ORDER BY",
+                        owner,
+                    ],
+                ],
+            ),
+            (f"/api/movies/{movie_id}/", [[by_id, owner]]),
+            (
+                f"/api/movies/{movie_id}/stats/",
+                [
+                    ["SEARCH users_user USING INTEGER PRIMARY KEY (rowid=?)"],
+                    [
+                        "SEARCH movies_movieordercounter USING INDEX "
+                        "sqlite_autoindex_movies_movieordercounter_1 (movie_id=?)"
+                    ],
+                    [by_id],
+                ],
+            ),
+            (
+                "/api/reports/sales/?start=2023-01-01T00:00:00Z",
+                [
+                    [
+                        "SEARCH movies_moviesalesrollup USING COVERING INDEX "
+                        "sqlite_autoindex_movies_moviesalesrollup_1 (granularity=? AND bucket>?)"
+                    ]
+                ],
+            ),
+            (
+                "/api/reports/sales/?group_by=rating&granularity=hour",
+                [
+                    [
+                        "SEARCH movies_ratingsalesrollup USING COVERING INDEX "
+                        "sqlite_autoindex_movies_ratingsalesrollup_1 (granularity=?)"
+                    ]
+                ],
+            ),
+        ]:
+            with self.subTest(url=url):
+                self.assertPlans(expected, self.record(lambda: self.client.get(url)))
+
+        statements = self.record(
+            lambda: self.client.post(
+                "/api/movies/", data={"title": "Up"}, format="json"
+            )
+        )
+        self.assertIndexedPlans(statements)
+
+        statements = self.record(
+            lambda: self.client.post(
+                "/api/movies/bulk/", data=[{"title": "Up"}], format="json"
+            )
+        )
+        self.assertIndexedPlans(statements)
+
+        statements = self.record(lambda: self.client.delete(f"/api/movies/{movie_id}/"))
+        self.assertIndexedPlans(statements)
+
+    def test_movie_order_endpoint_uses_indexes(self):
+        self.authenticate(self.non_employee_token)
+        url = f"/api/movies/{self.movies[1].id}/orders/"
+
+        statements = self.record(
+            lambda: self.client.post(url, data={"price": 10}, format="json")
+        )
+        self.assertIndexedPlans(statements)
+
+    def test_user_endpoints_use_indexes(self):
+        user_data = {
+            "username": "lucira",
+            "email": "lucira@mail.com",
+            "first_name": "Lucira",
+            "last_name": "Buster",
+            "password": "1234",
+        }
+        statements = self.record(
+            lambda: self.client.post("/api/users/", data=user_data, format="json")
+        )
+        self.assertIndexedPlans(statements)
+
+        statements = self.record(
+            lambda: self.client.post(
+                "/api/users/login/",
+                data={"username": "lucira", "password": "1234"},
+                format="json",
+            )
+        )
+        self.assertIndexedPlans(statements)
+
+        self.authenticate(self.non_employee_token)
+        url = f"/api/users/{self.non_employee.id}/"
+        self.assertIndexedPlans(self.record(lambda: self.client.get(url)))
+        self.assertIndexedPlans(self.record(lambda: self.client.get(url + "orders/")))
+        self.assertIndexedPlans(
+            self.record(
+                lambda: self.client.patch(url, data={"first_name": "Lu"}, format="json")
+            )
+        )
@@ -0,0 +1,176 @@
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from _kenziebuster import routers
+from _kenziebuster.conditional import validators_key
+from movies.cache import bump_catalog_version
+from movies.models import Movie
+from users.authentication import CachedJWTAuthentication, user_cache
+from tests.factories import (
+    create_employee_with_token,
+    create_movie_with_employee,
+    create_multiple_movies_with_employee,
+    create_non_employee_with_token,
+)
+
+
+@override_settings(REPLICA_DATABASE="replica", REPLICA_STICKY_SECONDS=5)
+class ReplicaTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.non_employee, cls.non_employee_token = create_non_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 3)
+        cls.BASE_URL = "/api/movies/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def setUp(self):
+        # The test database has no replica alias: record where each read
+        # would go and let it run on "default".
+        self.routed = []
+
+        def db_for_read(router, model, **hints):
+            self.routed.append(routers._read_alias.get())
+            return None
+
+        patcher = mock.patch.object(routers.ReplicaRouter, "db_for_read", db_for_read)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def authenticate(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+
+
+class ReplicaRoutingTest(ReplicaTestCase):
+    def test_safe_reads_on_marked_views_use_the_replica(self):
+        self.authenticate(self.non_employee_token)
+        urls = [
+            self.BASE_URL,
+            f"{self.BASE_URL}{self.movies[0].id}/",
+            f"/api/users/{self.non_employee.id}/",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.routed.clear()
+                response = self.client.get(url)
+
+                self.assertEqual(status.HTTP_200_OK, response.status_code)
+                self.assertTrue(self.routed)
+                self.assertEqual({"replica"}, set(self.routed))
+
+    def test_unmarked_views_and_writes_use_the_primary(self):
+        self.authenticate(self.non_employee_token)
+
+        response = self.client.get(f"/api/users/{self.non_employee.id}/orders/")
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        response = self.client.post(
+            f"{self.BASE_URL}{self.movies[0].id}/orders/",
+            data={"price": 10},
+            format="json",
+        )
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        self.assertTrue(self.routed)
+        self.assertEqual({None}, set(self.routed))
+
+    def test_client_reads_its_own_writes(self):
+        self.authenticate(self.employee_token)
+        movie_data = {"title": "Revolver"}
+        response = self.client.post(self.BASE_URL, data=movie_data, format="json")
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        cookie = response.cookies[routers.STICKY_COOKIE]
+        self.assertEqual(5, cookie["max-age"])
+
+        self.routed.clear()
+        response = self.client.get(f"{self.BASE_URL}{response.json()['id']}/")
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual({None}, set(self.routed))
+
+    def test_failed_writes_do_not_pin_the_client(self):
+        self.authenticate(self.non_employee_token)
+        response = self.client.post(
+            self.BASE_URL, data={"title": "Revolver"}, format="json"
+        )
+
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+        self.assertNotIn(routers.STICKY_COOKIE, response.cookies)
+
+
+class ReplicaCacheTest(ReplicaTestCase):
+    def test_replica_reads_do_not_fill_the_shared_caches(self):
+        # A write committed on the primary and moved the catalog version,
+        # the replica has not applied it yet.
+        bump_catalog_version()
+        reader = self.client_class()
+        response = reader.get(self.BASE_URL)
+        self.assertEqual({"replica"}, set(self.routed))
+
+        msg = (
+            "Verifique se uma página lida da réplica não recebe o ETag da versão atual"
+        )
+        self.assertEqual("MISS", response["X-Cache"], msg)
+        self.assertNotIn("ETag", response, msg)
+
+        create_movie_with_employee({"title": "Escrito agora"}, self.employee)
+        self.client.cookies[routers.STICKY_COOKIE] = "1"
+        response = self.client.get(self.BASE_URL)
+
+        msg = "Verifique se quem escreveu não recebe do cache a página da réplica atrasada"
+        self.assertEqual("MISS", response["X-Cache"], msg)
+        self.assertEqual(4, response.json()["count"], msg)
+        self.assertIn("ETag", response, msg)
+
+    def test_replica_reads_do_not_cache_validators(self):
+        movie = self.movies[0]
+        self.client.get(f"{self.BASE_URL}{movie.id}/")
+
+        msg = "Verifique se validadores lidos da réplica não vão para o cache"
+        self.assertIsNone(cache.get(validators_key(Movie, movie.id)), msg)
+
+        self.client.cookies[routers.STICKY_COOKIE] = "1"
+        self.client.get(f"{self.BASE_URL}{movie.id}/")
+        self.assertIsNotNone(cache.get(validators_key(Movie, movie.id)))
+
+    def test_replica_reads_do_not_cache_users(self):
+        authentication = CachedJWTAuthentication()
+        token = authentication.get_validated_token(
+            str(self.non_employee_token.access_token)
+        )
+
+        alias = routers._read_alias.set("replica")
+        try:
+            authentication.get_user(token)
+            async_to_sync(authentication.aget_user)(token)
+        finally:
+            routers._read_alias.reset(alias)
+
+        msg = "Verifique se usuários lidos da réplica não vão para o cache"
+        self.assertEqual({"replica"}, set(self.routed))
+        self.assertIsNone(user_cache.get(self.non_employee.id), msg)
+
+        authentication.get_user(token)
+        self.assertIsNotNone(user_cache.get(self.non_employee.id))
+
+
+@override_settings(ROOT_URLCONF="tests.performance.movies.movie_async_views_test")
+class AsyncReplicaCacheTest(ReplicaCacheTest):
+    pass
+
+
+class ReplicaNotConfiguredTest(APITestCase):
+    def test_no_replica_means_no_sticky_cookie(self):
+        employee, token = create_employee_with_token()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+
+        response = self.client.post(
+            "/api/movies/", data={"title": "Revolver"}, format="json"
+        )
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertNotIn(routers.STICKY_COOKIE, response.cookies)
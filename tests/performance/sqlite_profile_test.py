@@ -0,0 +1,47 @@
+import tempfile
+from pathlib import Path
+
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import TestCase, override_settings
+from _kenziebuster.query_budget import count_queries
+
+PRODUCTION_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 1048576,
+}
+
+
+@override_settings(SQLITE_PRAGMAS=PRODUCTION_PRAGMAS)
+class SQLiteProfileTest(TestCase):
+    def open_connection(self, **settings_dict) -> DatabaseWrapper:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        name = str(Path(directory.name) / "db.sqlite3")
+        wrapper = DatabaseWrapper(
+            {**connection.settings_dict, "NAME": name, **settings_dict}
+        )
+        self.addCleanup(wrapper.close)
+        wrapper.ensure_connection()
+        return wrapper
+
+    def pragma(self, wrapper, name):
+        return wrapper.connection.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def test_new_connections_get_the_pragmas(self):
+        with count_queries() as counter:
+            wrapper = self.open_connection()
+
+        self.assertEqual("wal", self.pragma(wrapper, "journal_mode"))
+        # 1 is NORMAL
+        self.assertEqual(1, self.pragma(wrapper, "synchronous"))
+        self.assertEqual(1048576, self.pragma(wrapper, "mmap_size"))
+        self.assertEqual(
+            0, len(counter), "Verifique se os PRAGMAs não contam como queries"
+        )
+
+    def test_connection_options_reach_the_driver(self):
+        wrapper = self.open_connection(OPTIONS={"timeout": 7})
+
+        self.assertEqual(7000, self.pragma(wrapper, "busy_timeout"))
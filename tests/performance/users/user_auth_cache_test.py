@@ -0,0 +1,45 @@
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from tests.factories import create_non_employee_with_token
+from users.authentication import user_cache
+from _kenziebuster.query_budget import count_queries
+
+
+class UserAuthCacheTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/users/%s/"
+        cls.non_employee, cls.non_employee_token = create_non_employee_with_token()
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def setUp(self) -> None:
+        token = str(self.non_employee_token.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+    def test_authenticated_user_is_resolved_from_cache(self):
+        base_url = self.BASE_URL % self.non_employee.id
+        self.client.get(base_url)
+
+        with count_queries() as counter:
+            response = self.client.get(base_url)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        msg = (
+            "Verifique se o usuário do token é lido do cache, sem query de autenticação"
+        )
+        self.assertEqual(1, len(counter), msg)
+
+    def test_user_update_invalidates_cached_user(self):
+        base_url = self.BASE_URL % self.non_employee.id
+        self.client.get(base_url)
+        self.assertIsNotNone(user_cache.get(self.non_employee.id))
+
+        response = self.client.patch(
+            base_url, data={"first_name": "Lucy"}, format="json"
+        )
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        self.assertIsNone(user_cache.get(self.non_employee.id))
+        response = self.client.get(base_url)
+        self.assertEqual("Lucy", response.json()["first_name"])
@@ -0,0 +1,68 @@
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from movies.models import MovieOrder
+from tests.factories import (
+    create_employee_with_token,
+    create_multiple_movies_with_employee,
+    create_non_employee_with_token,
+)
+from tests.query_budget import QueryBudgetTestMixin
+from users.views import UserOrderView
+
+
+class UserOrderHistoryTest(QueryBudgetTestMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.employee, cls.employee_token = create_employee_with_token()
+        cls.non_employee, cls.non_employee_token = create_non_employee_with_token()
+        cls.movies = create_multiple_movies_with_employee(cls.employee, 5)
+        MovieOrder.objects.bulk_create(
+            MovieOrder(movie=cls.movies[index % 5], user=cls.non_employee, price=index)
+            for index in range(45)
+        )
+        cls.BASE_URL = f"/api/users/{cls.non_employee.id}/orders/"
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def authenticate(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+
+    def test_owner_walks_whole_history_newest_first(self):
+        self.authenticate(self.non_employee_token)
+
+        results, url = [], self.BASE_URL
+        while url:
+            response = self.assertWithinQueryBudget(
+                UserOrderView.get, lambda: self.client.get(url), extra_queries=1
+            )
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            results.extend(response.json()["results"])
+            url = response.json()["next"]
+
+        self.assertEqual(45, len(results))
+        expected_ids = list(
+            MovieOrder.objects.order_by("-buyed_at", "-id").values_list("id", flat=True)
+        )
+        self.assertListEqual(expected_ids, [order["id"] for order in results])
+
+        first = results[0]
+        order = MovieOrder.objects.select_related("movie").get(id=first["id"])
+        self.assertEqual(order.movie.title, first["title"])
+        self.assertEqual(self.non_employee.email, first["buyed_by"])
+
+    def test_admin_can_read_other_users_history(self):
+        self.authenticate(self.employee_token)
+
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_other_user_cannot_read_history(self):
+        self.authenticate(self.non_employee_token)
+
+        response = self.client.get(f"/api/users/{self.employee.id}/orders/")
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+    def test_history_without_token(self):
+        response = self.client.get(self.BASE_URL)
+
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
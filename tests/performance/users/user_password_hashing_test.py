@@ -0,0 +1,77 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+from django.contrib.auth.hashers import identify_hasher
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from tests.factories import create_non_employee_with_token
+from users.hashing import PasswordHashingService, password_hashing
+
+
+class PasswordHashingServiceTest(APITestCase):
+    def test_pool_hashes_and_verifies_passwords(self):
+        encoded = password_hashing.make_password("1234")
+
+        self.assertTrue(password_hashing.check_password("1234", encoded))
+        self.assertFalse(password_hashing.check_password("4321", encoded))
+        self.assertFalse(password_hashing.check_password(None, encoded))
+
+    def test_async_entry_points(self):
+        async def round_trip():
+            encoded = await password_hashing.amake_password("1234")
+            return await password_hashing.acheck_password("1234", encoded)
+
+        self.assertTrue(asyncio.run(round_trip()))
+
+    def test_inline_service_matches_pool_output_format(self):
+        inline = PasswordHashingService(workers=0)
+        encoded = inline.make_password("1234")
+
+        self.assertTrue(password_hashing.check_password("1234", encoded))
+
+    def test_broken_pool_is_replaced(self):
+        service = PasswordHashingService(workers=1)
+        self.addCleanup(service.shutdown)
+        broken = service.executor
+
+        # A pool process dying mid-task breaks the whole pool.
+        with self.assertRaises(BrokenProcessPool):
+            service._submit(os._exit, 1).result()
+
+        encoded = service.make_password("1234")
+
+        msg = "Verifique se um pool quebrado é substituído por um novo"
+        self.assertIsNot(broken, service.executor, msg)
+        self.assertTrue(service.check_password("1234", encoded), msg)
+
+    def test_hashes_are_upgraded_when_iterations_change(self):
+        with override_settings(PASSWORD_HASH_ITERATIONS=1000):
+            encoded = PasswordHashingService(workers=0).make_password("1234")
+
+        upgraded = []
+        inline = PasswordHashingService(workers=0)
+        self.assertTrue(inline.check_password("1234", encoded, setter=upgraded.append))
+        self.assertEqual(["1234"], upgraded)
+        self.assertEqual("pbkdf2_sha256", identify_hasher(encoded).algorithm)
+
+
+class UserLoginHashingTest(APITestCase):
+    def test_login_verifies_password_through_hashing_service(self):
+        create_non_employee_with_token()
+
+        response = self.client.post(
+            "/api/users/login/",
+            data={"username": "lucira_common", "password": "1111"},
+            format="json",
+        )
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertIn("access", response.json())
+
+        response = self.client.post(
+            "/api/users/login/",
+            data={"username": "lucira_common", "password": "wrong"},
+            format="json",
+        )
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
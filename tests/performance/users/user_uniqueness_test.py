@@ -0,0 +1,50 @@
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+from tests.factories import create_employee_with_token, create_non_employee_with_token
+from tests.query_budget import QueryBudgetTestMixin
+from users.views import UserView
+
+
+class UserUniquenessTest(QueryBudgetTestMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/users/"
+        cls.user_data = {
+            "username": "lucira",
+            "email": "lucira@mail.com",
+            "first_name": "Lucira",
+            "last_name": "Buster",
+            "password": "1234",
+        }
+        # UnitTest Longer Logs
+        cls.maxDiff = None
+
+    def test_registration_is_a_single_insert(self):
+        response = self.assertWithinQueryBudget(
+            UserView.post,
+            lambda: self.client.post(self.BASE_URL, data=self.user_data, format="json"),
+        )
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+    def test_only_the_taken_field_is_reported(self):
+        self.client.post(self.BASE_URL, data=self.user_data, format="json")
+
+        user_data = {**self.user_data, "username": "another_lucira"}
+        response = self.client.post(self.BASE_URL, data=user_data, format="json")
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertDictEqual({"email": ["email already registered."]}, response.json())
+
+    def test_update_to_taken_email(self):
+        employee, _ = create_employee_with_token()
+        non_employee, token = create_non_employee_with_token()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + str(token.access_token))
+
+        response = self.client.patch(
+            f"{self.BASE_URL}{non_employee.id}/",
+            data={"email": employee.email},
+            format="json",
+        )
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertDictEqual({"email": ["email already registered."]}, response.json())
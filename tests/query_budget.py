@@ -0,0 +1,22 @@
+from _kenziebuster.query_budget import count_queries
+
+
+class QueryBudgetTestMixin:
+    def assertWithinQueryBudget(self, handler, request_callable, extra_queries=0):
+        """
+        Runs `request_callable` and asserts the whole request stayed within the
+        budget declared on `handler` plus `extra_queries` (e.g. the user lookup
+        done by authentication before the handler runs).
+        """
+        with count_queries() as counter:
+            response = request_callable()
+
+        budget = handler.query_budget + extra_queries
+        msg = (
+            f"Verifique se `{handler.__qualname__}` executa no máximo {budget} queries, "
+            + f"foram executadas {len(counter)}:\n"
+            + "\n".join(counter.queries)
+        )
+        self.assertLessEqual(len(counter), budget, msg)
+
+        return response
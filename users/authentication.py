@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from _kenziebuster.routers import reading_from_replica
+
+
+class LRUUserCache:
+    """Per-process LRU of user instances keyed by id, with a TTL per entry."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+
+            user, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+
+            self._entries.move_to_end(user_id)
+            return user
+
+    def set(self, user_id, user) -> None:
+        with self._lock:
+            self._entries[user_id] = (user, time.monotonic() + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+user_cache = LRUUserCache(
+    maxsize=settings.JWT_USER_CACHE_MAXSIZE,
+    ttl=settings.JWT_USER_CACHE_TTL,
+)
+
+
+def invalidate_cached_user(user_id) -> None:
+    user_cache.invalidate(user_id)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the token's user from `user_cache`
+    before falling back to the database.
+
+    Entries are dropped by `invalidate_cached_user` when a user is updated
+    and expire after `JWT_USER_CACHE_TTL` seconds, which bounds how long
+    other worker processes can keep serving a stale copy. Users read from
+    a lagging replica are not cached, since they may predate that update.
+
+    `aauthenticate` is the coroutine used by `movies.async_views`; token
+    checks are CPU only, so just the cache miss goes to the database.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None:
+            user = user_cache.get(user_id)
+            if user is not None:
+                return user
+
+        user = super().get_user(validated_token)
+        if not reading_from_replica():
+            user_cache.set(user_id, user)
+        return user
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        # Same checks and messages as JWTAuthentication.get_user.
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = user_cache.get(user_id)
+        if user is not None:
+            return user
+
+        try:
+            user = await self.user_model.objects.aget(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if not reading_from_replica():
+            user_cache.set(user_id, user)
+        return user
+
+
+class AnonymousSafeMethodsMixin:
+    """
+    For views whose permissions let every safe-method request through: GET
+    and HEAD are not authenticated up front, so a read carrying a bearer
+    token costs no JWT decoding and no user lookup. DRF still authenticates
+    on demand if anything reads `request.user`. OPTIONS is left out, since
+    it lists the actions the user may take.
+    """
+
+    anonymous_methods = ("GET", "HEAD")
+
+    def skips_authentication(self, request) -> bool:
+        return request.method in self.anonymous_methods
+
+    def perform_authentication(self, request):
+        if not self.skips_authentication(request):
+            super().perform_authentication(request)
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with the work factor taken from `PASSWORD_HASH_ITERATIONS`.
+
+    It keeps Django's `pbkdf2_sha256` algorithm name, so existing hashes keep
+    verifying and are upgraded on the next login when the setting changes.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS
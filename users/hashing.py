@@ -0,0 +1,115 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+def _init_worker() -> None:
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "_kenziebuster.settings")
+    django.setup()
+
+
+def _verify(raw_password: str, encoded: str) -> tuple[bool, bool]:
+    needs_update = []
+    is_correct = hashers.check_password(
+        raw_password, encoded, setter=lambda _: needs_update.append(True)
+    )
+    return is_correct, bool(needs_update)
+
+
+class PasswordHashingService:
+    """
+    Runs password hashing and verification on a process pool so the CPU
+    cost stays off request threads and off the event loop.
+
+    With `workers=0` everything runs inline in the calling thread.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        # Created on first use so each forked server worker gets its own pool.
+        # Pool processes start from the forkserver rather than forking this
+        # one, which may hold threads, locks and database connections.
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("forkserver"),
+                        initializer=_init_worker,
+                    )
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _submit(self, fn, *args) -> Future:
+        if not self.workers:
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+        executor = self.executor
+        try:
+            return executor.submit(fn, *args)
+        except BrokenProcessPool:
+            # A pool process died (e.g. OOM-killed), start a fresh pool once.
+            self._discard(executor)
+            return self.executor.submit(fn, *args)
+
+    def _submit_make_password(self, raw_password) -> Future:
+        if raw_password is None:
+            # Unusable passwords are random strings, no hashing involved.
+            future = Future()
+            future.set_result(hashers.make_password(None))
+            return future
+        return self._submit(hashers.make_password, raw_password)
+
+    def _submit_verify(self, raw_password, encoded) -> Future:
+        if raw_password is None or not hashers.is_password_usable(encoded):
+            future = Future()
+            future.set_result((False, False))
+            return future
+        return self._submit(_verify, raw_password, encoded)
+
+    def make_password(self, raw_password) -> str:
+        return self._submit_make_password(raw_password).result()
+
+    def check_password(self, raw_password, encoded, setter=None) -> bool:
+        is_correct, needs_update = self._submit_verify(raw_password, encoded).result()
+        if setter and is_correct and needs_update:
+            setter(raw_password)
+        return is_correct
+
+    async def amake_password(self, raw_password) -> str:
+        return await asyncio.wrap_future(self._submit_make_password(raw_password))
+
+    async def acheck_password(self, raw_password, encoded, setter=None) -> bool:
+        future = self._submit_verify(raw_password, encoded)
+        is_correct, needs_update = await asyncio.wrap_future(future)
+        if setter and is_correct and needs_update:
+            setter(raw_password)
+        return is_correct
+
+
+password_hashing = PasswordHashingService(workers=settings.PASSWORD_HASHING_WORKERS)
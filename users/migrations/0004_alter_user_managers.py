@@ -0,0 +1,19 @@
+# Generated by Django 4.1.6 on 2026-10-18 01:23
+
+from django.db import migrations
+import users.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0003_rename_bithdate_user_birthdate"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", users.models.UserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,8 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OrderHistoryCursorPagination(CursorPagination):
+    """Newest orders first, keyed on `(buyed_at, id)` so deep pages stay cheap."""
+
+    ordering = ("-buyed_at", "-id")
+    page_size = 20
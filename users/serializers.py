@@ -1,28 +1,24 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
 
+from _kenziebuster.conditional import forget_validators, validators_key
+from _kenziebuster.metrics import TimedSerializer
+from movies.cache import bump_catalog_version
+
+from .authentication import invalidate_cached_user
 from .models import User
 
 # from movies.serializers import MovieSerializer
 
 
-class UserSerializer(serializers.Serializer):
+class UserSerializer(TimedSerializer):
     id = serializers.IntegerField(read_only=True)
 
-    username = serializers.CharField(
-        validators=[UniqueValidator(
-            queryset=User.objects.all(),
-            message="username already taken."
-        )]
-    )
-
-    email = serializers.EmailField(
-        max_length=127,
-        validators=[UniqueValidator(
-            queryset=User.objects.all(),
-            message="email already registered."
-        )]
-    )
+    # Uniqueness is enforced by the database constraints on these columns,
+    # see `raise_unique_errors`, instead of a SELECT per field before saving.
+    username = serializers.CharField()
+    email = serializers.EmailField(max_length=127)
 
     password = serializers.CharField(write_only=True)
     first_name = serializers.CharField(max_length=50)
@@ -33,19 +29,63 @@ class UserSerializer(serializers.Serializer):
 
     # movies = MovieSerializer(many=True, read_only=True)
 
+    unique_messages = {
+        "username": "username already taken.",
+        "email": "email already registered.",
+    }
+
+    def raise_unique_errors(self, validated_data: dict, exclude_id=None):
+        """
+        Translates a unique constraint violation into the field errors the
+        API has always returned, with one lookup on the failure path only.
+        """
+        values = {
+            field: validated_data[field]
+            for field in self.unique_messages
+            if field in validated_data
+        }
+        lookup = Q()
+        for field, value in values.items():
+            lookup |= Q(**{field: value})
+
+        taken = User.objects.filter(lookup).exclude(id=exclude_id).values_list(*values)
+        errors = {}
+        for row in taken:
+            for field, value in zip(values, row):
+                if value == values[field]:
+                    errors[field] = [self.unique_messages[field]]
+
+        raise serializers.ValidationError(errors or {"detail": ["user already exists."]})
+
     def create(self, validated_data: dict) -> User:
-        if validated_data["is_employee"]:
-            return User.objects.create_superuser(**validated_data)
-        else:
-            return User.objects.create_user(**validated_data)
-        
+        try:
+            with transaction.atomic():
+                if validated_data["is_employee"]:
+                    return User.objects.create_superuser(**validated_data)
+                else:
+                    return User.objects.create_user(**validated_data)
+        except IntegrityError:
+            self.raise_unique_errors(validated_data)
+
     def update(self, instance: User, validated_data: dict):
+        email_changed = validated_data.get("email", instance.email) != instance.email
         for key, value in validated_data.items():
             if key == "password":
                 instance.set_password(value)
             else:
                 setattr(instance, key, value)
-        
-        instance.save()
+
+        try:
+            with transaction.atomic():
+                instance.save()
+        except IntegrityError:
+            self.raise_unique_errors(validated_data, exclude_id=instance.id)
+
+        invalidate_cached_user(instance.id)
+        forget_validators(validators_key(User, instance.id))
+        if email_changed:
+            # Movie validators depend on every user, only added_by matters to them.
+            forget_validators(validators_key(User))
+            bump_catalog_version()
 
         return instance
\ No newline at end of file
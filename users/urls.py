@@ -8,5 +8,6 @@ urlpatterns = [
     path("users/", views.UserView.as_view()),
     path("users/login/", TokenObtainPairView.as_view()),
     path("users/refresh/", TokenRefreshView.as_view()),
-    path("users/<int:user_id>/", views.UserDetailView.as_view())
+    path("users/<int:user_id>/", views.UserDetailView.as_view()),
+    path("users/<int:user_id>/orders/", views.UserOrderView.as_view()),
 ]
@@ -1,13 +1,20 @@
+from django.db.models import Value
 from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView, Request, Response, status
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from _kenziebuster.conditional import get_validators, model_validators, set_validators, validators_key
+from _kenziebuster.query_budget import query_budget
+from movies.serializers import MovieOrderSerializer
+
+from .authentication import CachedJWTAuthentication
 from .models import User
+from .pagination import OrderHistoryCursorPagination
 from .permissions import IsAccountOwnerOrAdmin
 from .serializers import UserSerializer
 
 
 class UserView(APIView):
+    @query_budget(1)
     def post(self, request: Request) -> Response:
         serializer = UserSerializer(data=request.data)
 
@@ -19,17 +26,35 @@ class UserView(APIView):
     
 
 class UserDetailView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAccountOwnerOrAdmin]
+    replica_reads = True
 
+    @query_budget(1)
     def get(self, request: Request, user_id: int) -> Response:
+        key = validators_key(User, user_id)
+        validators, generations = get_validators(key)
+        if validators is not None:
+            # The permission only compares ids, no need for the row.
+            self.check_object_permissions(request, User(id=user_id))
+            not_modified = validators.not_modified(request)
+            if not_modified is not None:
+                return not_modified
+
         user = get_object_or_404(User, id=user_id)
         self.check_object_permissions(request, user)
+        validators = model_validators(user)
+        set_validators(key, validators, generations)
+
+        not_modified = validators.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
         serializer = UserSerializer(user)
 
-        return Response(serializer.data, status.HTTP_200_OK)
-    
+        return validators.apply(Response(serializer.data, status.HTTP_200_OK))
 
+    @query_budget(2)
     def patch(self, request: Request, user_id: int) -> Response:
         user = get_object_or_404(User, id=user_id)
         self.check_object_permissions(request, user)
@@ -37,4 +62,24 @@ class UserDetailView(APIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
-        return Response(serializer.data, status.HTTP_200_OK)
\ No newline at end of file
+        return Response(serializer.data, status.HTTP_200_OK)
+
+
+class UserOrderView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAccountOwnerOrAdmin]
+
+    @query_budget(2)
+    def get(self, request: Request, user_id: int) -> Response:
+        user = get_object_or_404(User, id=user_id)
+        self.check_object_permissions(request, user)
+
+        # Every order belongs to `user`, no need to join it per row.
+        orders = MovieOrderSerializer.values_rows(
+            user.user_movie_order.all(), buyed_by=Value(user.email)
+        )
+        paginator = OrderHistoryCursorPagination()
+        result_page = paginator.paginate_queryset(orders, request, view=self)
+
+        serializer = MovieOrderSerializer(result_page, many=True)
+        return paginator.get_paginated_response(serializer.data)